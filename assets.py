@@ -0,0 +1,252 @@
+import os
+import threading
+import time
+
+import pygame
+from pgzero import loaders
+from pgzero.loaders import images
+
+from atlas import SpriteAtlas, sprite_shape
+
+# NOTE: ASSETS module focus on loading every image ONCE and sharing the same Surface everywhere
+
+
+class AssetRegistry:
+    """Loads and converts the images listed in the entity asset registry dictionaries
+    (e.g. ENEMY_ASSETS, PLAYER_ASSETS) once, keeps them resident and hands out
+    shared Surface references by image path.
+
+    preload_async() decodes images on a background thread (PNG decoding is most
+    of the load time) while the game keeps running; pump() then converts the
+    decoded Surfaces on the main thread, which owns the display.
+
+    Entries with an "rgb" color are not loaded from disk: every one of them is a
+    cell of one SpriteAtlas built from the "base" shape of their registry branch.
+    """
+
+    def __init__(self, *registries: dict):
+        """Collects every {"image": ..., "path": ...} entry from the registries.
+        {"image": ..., "path": ..., "rgb": ...} entries are color variants of the
+        nearest "base" image path above them.
+
+        Args:
+            *registries (dict): nested asset registry dictionaries (e.g. ENEMY_ASSETS)
+
+        Attributes:
+            self.entries (dict): image path -> pgzero image name
+            self.surfaces (dict): image path -> loaded + converted Surface obj
+            self.decoded (dict): image path -> decoded Surface waiting for pump()
+            self.variants (dict): variant image path -> (base image path, (r, g, b))
+            self.atlases (dict): base image path -> SpriteAtlas of its variants
+            self.load_seconds (float): main thread secs spent loading/converting (startup report)
+            self.background_seconds (float): secs the decode thread worked
+        """
+        self.entries = {}
+        self.surfaces = {}
+        self.decoded = {}
+        self.variants = {}
+        self.atlases = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.load_seconds = 0.0
+        self.background_seconds = 0.0
+        for registry in registries:
+            self.register(registry)
+
+    def register(self, registry: dict, base: str | None = None):
+        """Adds every image entry found in a nested asset registry dictionary.
+
+        Args:
+            registry (dict): nested asset registry dictionary (e.g. ENEMY_ASSETS)
+            base (str | None): atlas base image path inherited from the parent branch
+        """
+        base = registry.get("base", base)
+        for value in registry.values():
+            if not isinstance(value, dict):
+                continue
+            if "path" in value and "image" in value:  # leaf entry
+                self.entries[value["path"]] = value["image"]
+                if "rgb" in value:  # built from the base shape, no file of its own
+                    self.variants[value["path"]] = (base, tuple(value["rgb"]))
+            else:
+                self.register(value, base)  # go one level deeper
+
+    def preload(self, image_paths: list | None = None):
+        """Loads and converts registered images now. Call once at startup
+        (after the display exists) so the game loop never touches the disk.
+
+        Args:
+            image_paths (list | None): image paths to load. None = every registered image
+        """
+        for image_path in self.entries if image_paths is None else image_paths:
+            self.surface(image_path)
+
+    def preload_async(self, image_paths: list | None = None):
+        """Starts decoding images on a background thread. Call pump() every frame
+        to make them usable; anything needed earlier is loaded on demand by surface().
+
+        Args:
+            image_paths (list | None): image paths to load. None = every registered image not loaded yet
+        """
+        if image_paths is None:
+            image_paths = [
+                path
+                for path in self.entries
+                if path not in self.surfaces and path not in self.variants
+            ]
+        if not image_paths or self.thread is not None:
+            return
+        self.thread = threading.Thread(
+            target=self.decode_all, args=(list(image_paths),), daemon=True
+        )
+        self.thread.start()
+
+    def decode_all(self, image_paths: list):
+        """Decode thread: reads + decodes each image file (no convert, no display access).
+
+        Args:
+            image_paths (list): image paths to decode
+        """
+        start = time.perf_counter()
+        for image_path in image_paths:
+            if image_path in self.surfaces:
+                continue
+            # same root as pgzero's image loader (the folder holding main.py)
+            surf = pygame.image.load(os.path.join(loaders.root, image_path))
+            with self.lock:
+                self.decoded[image_path] = surf
+        self.background_seconds = time.perf_counter() - start
+
+    @property
+    def loading(self) -> bool:
+        """True while a preload_async() batch is not fully converted by pump()."""
+        return self.thread is not None
+
+    def pump(self, max_seconds: float = 0.004) -> bool:
+        """Converts decoded images on the main thread for up to max_seconds
+        (at least one image per call). Call once per frame while loading.
+
+        Args:
+            max_seconds (float): time budget of this call
+
+        Returns:
+            bool: True once the whole background batch is loaded
+        """
+        if self.thread is None:
+            return True
+        start = time.perf_counter()
+        while True:
+            with self.lock:
+                if not self.decoded:
+                    break
+                image_path, decoded = self.decoded.popitem()
+            self.adopt(image_path, decoded)
+            if time.perf_counter() - start >= max_seconds:
+                return False
+
+        if self.thread.is_alive():
+            return False
+        self.thread = None
+        self.preload(self.variants)  # atlases are built from one small base each
+        return True
+
+    def wait(self):
+        """Blocks until the background batch is decoded and converted (e.g. PLAY starts)."""
+        if self.thread is not None:
+            self.thread.join()
+            self.pump(max_seconds=float("inf"))
+
+    def adopt(self, image_path: str, decoded: object):
+        """Converts a decoded Surface and shares it with pgzero's image cache,
+        so Actor(image) and screen.blit(name) use it too.
+
+        Args:
+            image_path (str): registered image path
+            decoded (obj): Surface from pygame.image.load (not converted yet)
+        """
+        if image_path in self.surfaces:  # already loaded on demand meanwhile
+            return
+        start = time.perf_counter()
+        image = self.entries.get(image_path)
+        key = images.cache_key(image, (), {}) if image is not None else None
+        surf = images.cache.get(key) if key is not None else None
+        if surf is None:  # pgzero did not load it either
+            surf = decoded.convert_alpha()
+            if key is not None:
+                images.cache[key] = surf
+        self.surfaces[image_path] = surf
+        self.load_seconds += time.perf_counter() - start
+
+    def surface(self, image_path: str):
+        """Returns the shared Surface obj for image_path, loading it on first use.
+
+        Args:
+            image_path (str): path of image.png MUST include file extension. (e.g. "images/myimage.png")
+
+        Returns:
+            Surface: shared, already converted Surface. Do not draw onto it
+        """
+        surf = self.surfaces.get(image_path)
+        if surf is None:
+            variant = self.variants.get(image_path)
+            if variant is not None:  # atlas cell, every color is built at once
+                self.build_atlas(variant[0])
+                return self.surfaces[image_path]
+
+            with self.lock:
+                decoded = self.decoded.pop(image_path, None)
+            if decoded is not None:  # decoded in the background, just convert it
+                self.adopt(image_path, decoded)
+                return self.surfaces[image_path]
+
+            start = time.perf_counter()
+            image = self.entries.get(image_path)
+            if image is not None:
+                # pgzero's image loader converts + caches, so Actor(image) shares this Surface
+                surf = images.load(image)
+            else:  # not in any registry, load straight from disk
+                surf = pygame.image.load(image_path).convert_alpha()
+            self.surfaces[image_path] = surf
+            self.load_seconds += time.perf_counter() - start
+        return surf
+
+    def build_atlas(self, base: str):
+        """Builds the SpriteAtlas of every variant of base and shares its cells
+        with pgzero's image cache, so Actor(image) draws the atlas cell too.
+
+        Args:
+            base (str): base image path (only its alpha, the shape, is used)
+        """
+        start = time.perf_counter()
+        colors = {
+            path: rgb
+            for path, (variant_base, rgb) in self.variants.items()
+            if variant_base == base
+        }
+        base_surf = pygame.image.load(os.path.join(loaders.root, base)).convert_alpha()
+        atlas = self.atlases[base] = SpriteAtlas(sprite_shape(base_surf), colors)
+        for image_path in colors:
+            surf = atlas.variant(image_path)
+            self.surfaces[image_path] = surf
+            images.cache[images.cache_key(self.entries[image_path], (), {})] = surf
+        self.load_seconds += time.perf_counter() - start
+
+    def shape_key(self, image_path: str) -> str:
+        """Returns the rotation cache key of an image: the atlas base path for
+        color variants (every color has the same shape, so they share cached
+        rotations + masks), the image path itself otherwise.
+
+        Args:
+            image_path (str): registered image path
+        """
+        variant = self.variants.get(image_path)
+        return image_path if variant is None else variant[0]
+
+    def resident_bytes(self) -> int:
+        """Returns the total pixel memory (bytes) of every loaded Surface.
+        Atlas cells are views, so each atlas is counted once."""
+        parents = {}
+        for surf in self.surfaces.values():
+            parent = surf.get_parent() or surf
+            parents[id(parent)] = parent
+        return sum(surf.get_pitch() * surf.get_height() for surf in parents.values())
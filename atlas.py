@@ -0,0 +1,82 @@
+import pygame
+
+# NOTE: ATLAS module focus on building every color of a sprite from ONE shape instead of one PNG each
+# Global constants
+WHITE = (255, 255, 255)
+
+
+def sprite_shape(surface: object) -> object:
+    """Returns a copy of surface with every pixel white, keeping only its alpha (the shape).
+
+    Args:
+        surface (obj): per-pixel alpha Surface (e.g. a loaded sprite)
+    """
+    shape = surface.copy()
+    # max(rgb, 255) = 255, max(alpha, 0) = alpha
+    shape.fill((*WHITE, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return shape
+
+
+def tint(shape: object, rgb: tuple[int, int, int]) -> object:
+    """Returns a new Surface of shape filled with rgb (alpha kept).
+    Tinting a rotated shape gives the same pixels as rotating the tinted shape.
+
+    Args:
+        shape (obj): white Surface from sprite_shape() (or a rotation of it)
+        rgb (tuple[int, int, int]): fill color
+    """
+    surface = shape.copy()
+    # white * rgb / 255 = rgb, alpha * 255 / 255 = alpha
+    surface.fill((*rgb, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+class SpriteAtlas:
+    """Every color variant of one sprite shape, side by side in a single Surface.
+    Variants are subsurfaces (views sharing the atlas pixels) looked up by key,
+    so adding a color is one more (key, rgb) pair, not one more PNG.
+    """
+
+    def __init__(self, shape: object, colors: dict):
+        """Tints the shape once per color into the atlas.
+
+        Args:
+            shape (obj): white Surface from sprite_shape()
+            colors (dict): variant key (e.g. image path) -> (r, g, b) color
+
+        Attributes:
+            self.surface (obj): atlas Surface, one shape-sized cell per color
+            self.regions (dict): variant key -> Rect of its cell in self.surface
+            self.variants (dict): variant key -> subsurface of its cell
+            self.colors (dict): variant key -> (r, g, b) color
+        """
+        width, height = shape.get_size()
+        self.shape = shape
+        self.colors = dict(colors)
+        self.surface = pygame.Surface(
+            (width * max(1, len(colors)), height), pygame.SRCALPHA
+        )
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.regions = {}
+        self.variants = {}
+        for i, (key, rgb) in enumerate(self.colors.items()):
+            rect = pygame.Rect(i * width, 0, width, height)
+            # ADD onto the transparent atlas copies the pixels exactly (no alpha blending)
+            self.surface.blit(
+                tint(shape, rgb), rect, special_flags=pygame.BLEND_RGBA_ADD
+            )
+            self.regions[key] = rect
+            self.variants[key] = self.surface.subsurface(rect)
+
+    def region(self, key: object) -> object:
+        """Returns the Rect of a variant's cell inside self.surface."""
+        return self.regions[key]
+
+    def variant(self, key: object) -> object:
+        """Returns the subsurface of a variant. Do not draw onto it."""
+        return self.variants[key]
+
+    def nbytes(self) -> int:
+        """Returns the pixel memory (bytes) of the atlas Surface."""
+        return self.surface.get_pitch() * self.surface.get_height()
@@ -0,0 +1,233 @@
+"""Benchmarks for the per-frame hot paths at growing enemy counts.
+
+Timings depend on the machine, so the baseline is per machine and not committed:
+record one with --save-baseline (benchmarks/ is git-ignored) before changing
+the code, then compare against it on the same machine.
+
+Usage:
+    python benchmark.py --save-baseline              # store this run as this machine's baseline
+    python benchmark.py                              # run + compare with the stored baseline
+    python benchmark.py --sizes 10 100 --repeat 5    # quick run
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from pgzero.constants import mouse
+
+from headless import HeadlessRunner
+from entities import Enemy
+
+# NOTE: BENCHMARK module focus on measuring how the hot paths scale with enemy count
+# Global constants
+BENCH_SIZES = (10, 100, 1000, 10000)  # enemy counts to measure
+BENCH_REPEAT = 15  # timed calls per case (median is reported)
+BENCH_SEED = 1234  # same seed -> same enemies every run
+BENCH_DT = 1 / 60
+REGRESSION_THRESHOLD = 0.25  # flag cases more than 25% slower than the baseline
+NOISE_FLOOR_MS = 0.1  # slowdowns smaller than this are timer noise, never flagged
+BASELINE_PATH = Path("benchmarks/baseline.json")  # per machine, git-ignored
+RESULTS_PATH = Path("benchmarks/results.json")
+CLICK_POSITIONS = [(x, y) for x in range(60, 1920, 240) for y in range(60, 1080, 240)]
+
+
+def populate(runner: object, count: int):
+    """Spawns count enemies at seeded spawn positions and orients them once.
+
+    Args:
+        runner (object): HeadlessRunner holding the game
+        count (int): number of enemies to spawn
+    """
+    game = runner.game
+    for _ in range(count):
+        game.spawn_enemy(Enemy, "ant", "color")
+    game.update_enemies(target=runner.target, dt=0)  # rotation, mask rect + grid
+
+
+def measure(func, repeat: int, count: int, teardown=None) -> dict:
+    """Times func repeat times.
+
+    Args:
+        func (callable): zero-argument function to time
+        repeat (int): number of timed calls
+        count (int): enemy count, used for the per-enemy cost
+        teardown (callable): optional untimed zero-argument function run after each call
+
+    Returns:
+        dict: median/min milliseconds per call and median microseconds per enemy
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+        if teardown is not None:
+            teardown()
+    median_ms = statistics.median(samples)
+    return {
+        "median_ms": round(median_ms, 4),
+        "min_ms": round(min(samples), 4),
+        "per_enemy_us": round(median_ms * 1000 / count, 4),
+    }
+
+
+def bench_cases(runner: object) -> dict:
+    """Returns {case name: (function, teardown or None)} for one populated runner."""
+    game, target, player = runner.game, runner.target, runner.player
+
+    def movement():
+        for enemy in game.enemies:
+            enemy.movement(target, BENCH_DT)
+
+    def update_enemies():
+        game.update_enemies(target=target, dt=BENCH_DT)
+
+    def target_collision():
+        game.check_enemy_target_collision(target, BENCH_DT)
+
+    def undo_game_over():
+        game.change_state("PLAY")  # so every call does the same work
+
+    def player_collisions():
+        for pos in CLICK_POSITIONS:
+            player.rect.center = pos
+            game.check_enemy_player_collisions(
+                input_button=mouse.LEFT, expected_button=mouse.LEFT, player=player
+            )
+
+    def revive():
+        for enemy in game.enemies:
+            enemy.is_dead = False  # keep the population the same size
+
+    def draw_play():
+        game.draw_play(screen=runner.screen, target=target, player=player)
+
+    def draw_play_per_actor():
+        game.sprite_batch.enabled = False  # one blit call per enemy (unbatched path)
+        draw_play()
+        game.sprite_batch.enabled = True
+
+    cases = {
+        "update_enemies": (update_enemies, None),
+        "check_enemy_target_collision": (target_collision, undo_game_over),
+        "check_enemy_player_collisions": (player_collisions, revive),
+        "draw_play": (draw_play, None),
+        "draw_play_per_actor": (draw_play_per_actor, None),
+        "Enemy.movement": (movement, None),  # one enemy at a time, both backends
+    }
+    return cases
+
+
+def run_benchmarks(sizes, repeat: int) -> dict:
+    """Runs every case for both backends at every size.
+
+    Returns:
+        dict: {"meta": ..., "results": {"case[backend]": {"size": timings}}}
+    """
+    results = {}
+    for use_swarm in (False, True):
+        backend = "swarm" if use_swarm else "actor"
+        for count in sizes:
+            runner = HeadlessRunner(seed=BENCH_SEED, use_swarm=use_swarm)
+            populate(runner, count)
+            for case, (func, teardown) in bench_cases(runner).items():
+                timings = measure(func, repeat, count, teardown)
+                results.setdefault(f"{case}[{backend}]", {})[str(count)] = timings
+                print(f"{case}[{backend}] n={count}: {timings['median_ms']} ms")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": BENCH_SEED,
+            "repeat": repeat,
+            "date": time.strftime("%Y-%m-%d"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Returns the cases whose fastest call got slower than the baseline by more than threshold.
+    The min is compared (not the median) because it is the least affected by other processes.
+
+    Args:
+        current (dict): results of this run
+        baseline (dict): stored baseline results
+        threshold (float): allowed slowdown (0.25 = 25%)
+
+    Returns:
+        list: dicts describing every regression
+    """
+    regressions = []
+    for case, sizes in current["results"].items():
+        for count, timings in sizes.items():
+            old = baseline["results"].get(case, {}).get(count)
+            if old is None or old["min_ms"] <= 0:
+                continue  # new case, nothing to compare with
+            ratio = timings["min_ms"] / old["min_ms"]
+            slower_ms = timings["min_ms"] - old["min_ms"]
+            if ratio > 1 + threshold and slower_ms > NOISE_FLOOR_MS:
+                regressions.append(
+                    {
+                        "case": case,
+                        "enemies": int(count),
+                        "baseline_ms": old["min_ms"],
+                        "current_ms": timings["min_ms"],
+                        "slowdown": round(ratio, 2),
+                    }
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-frame hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCH_SIZES))
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT)
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store this run as the baseline"
+    )
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.sizes, args.repeat)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(current, indent=4), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=4), encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --save-baseline first")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    for key in ("platform", "python"):
+        if baseline["meta"].get(key) != current["meta"][key]:
+            print(
+                f"WARNING baseline {key} {baseline['meta'].get(key)} != "
+                f"{current['meta'][key]}, timings are not comparable"
+            )
+    regressions = compare(current, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['case']} n={regression['enemies']}: "
+            f"{regression['baseline_ms']} ms -> {regression['current_ms']} ms "
+            f"(x{regression['slowdown']})"
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+import heapq
+import math
+
+import numpy as np
+from pygame import surfarray
+
+from sprite_cache import RADIUS_SLACK
+
+# NOTE: COLLISION module focus on doing the expensive pixel-perfect test as rarely as possible
+# Global constants
+PROFILE_BINS = 360  # angular bins of the target radial profile (1 degree each)
+ARM_MARGIN = 2  # px added to arm distances (mask rect rounding, rotation steps)
+
+
+def radial_profile(sprite_mask, bins: int = PROFILE_BINS) -> np.ndarray:
+    """Returns, for each angular bin around the mask center, the distance of the
+    farthest set pixel in that direction (plus RADIUS_SLACK). Every pixel counts
+    in the bins of its center and of its 4 corners. Pixels too close to the center
+    for those to hit every bin they span count in all bins, so no direction is
+    underestimated.
+
+    Args:
+        sprite_mask (obj): pygame Mask obj
+        bins (int): number of angular bins over 360 degrees
+
+    Returns:
+        np.ndarray: max radius (px) per bin. Bin i covers [i, i + 1) * 360 / bins degrees,
+            anti-clockwise from +x like Actor.angle
+    """
+    width, height = sprite_mask.get_size()
+    profile = np.zeros(bins)
+    px, py = np.nonzero(surfarray.array_red(sprite_mask.to_surface()))
+    if not len(px):
+        return profile
+    cx, cy = width / 2, height / 2
+    corners = [(px + ox - cx, py + oy - cy) for ox in (0, 1) for oy in (0, 1)]
+    farthest = np.max([np.hypot(dx, dy) for dx, dy in corners], axis=0) + RADIUS_SLACK
+    center = (px + 0.5 - cx, py + 0.5 - cy)
+    for dx, dy in corners + [center]:
+        # y axis inverted like Actor.angle_to
+        angle = np.degrees(np.arctan2(-dy, dx)) % 360
+        index = (angle * bins / 360).astype(np.int64) % bins
+        np.maximum.at(profile, index, farthest)
+
+    # past this radius the 5 samples of a pixel are less than one bin apart
+    near = np.hypot(*center) < bins / (2 * math.pi)
+    if near.any():
+        np.maximum(profile, farthest[near].max(), out=profile)
+    return profile
+
+
+class CollisionPipeline:
+    """Two-phase enemy vs target collision test.
+    Broad phase: cheap bounding circle + Rect tests reject enemies far from the target.
+    Narrow phase: pixel-perfect Mask overlap, only for the enemies that survived.
+    """
+
+    def __init__(self):
+        """Creates the pipeline with empty counters.
+
+        Attributes:
+            self.broad_tests (int): enemies checked by the broad phase in the last frame
+            self.narrow_tests (int): mask overlaps done in the last frame
+            self.total_broad_tests (int): broad phase checks since start
+            self.total_narrow_tests (int): mask overlaps since start
+        """
+        self.broad_tests = 0
+        self.narrow_tests = 0
+        self.total_broad_tests = 0
+        self.total_narrow_tests = 0
+
+    def _narrow(self, target: object, enemy: object) -> bool:
+        """Rect test then pixel-perfect Mask overlap of one enemy."""
+        enemy_rect = enemy.mask_rect
+        target_rect = target.mask_rect
+        if not target_rect.colliderect(enemy_rect):
+            return False
+
+        self.narrow_tests += 1
+        # --- PIXEL-PERFECT COLLISION DETECTION ---#
+        dx = int(enemy_rect.left - target_rect.left)  # left offset pos
+        dy = int(enemy_rect.top - target_rect.top)  # top offset pos
+        # checks if target and enemy mask collide/overlap
+        return target.mask.overlap(enemy.mask, (dx, dy)) is not None
+
+    def find_hit(self, target: object, enemies) -> object | None:
+        """Returns the first enemy touching the target, or None.
+        ImpactScheduler calls it with the armed enemies only.
+
+        Args:
+            target (object): A Target class instance (needs mask, mask_rect, radius)
+            enemies (iterable): Enemy objects with rotation, mask and mask_rect set
+        """
+        self.broad_tests = self.narrow_tests = 0
+        tx, ty = target.x, target.y
+        target_radius = target.radius
+        hit = None
+
+        for enemy in enemies:
+            self.broad_tests += 1
+            # bounding circles too far apart -> cannot touch
+            reach = target_radius + enemy.rotation.radius
+            dx = enemy.x - tx
+            dy = enemy.y - ty
+            if dx * dx + dy * dy > reach * reach:
+                continue
+            if self._narrow(target, enemy):
+                hit = enemy
+                break
+
+        self._add_totals()
+        return hit
+
+    def _add_totals(self):
+        self.total_broad_tests += self.broad_tests
+        self.total_narrow_tests += self.narrow_tests
+
+    def stats(self) -> dict:
+        """Returns the last frame + total counters as a dict (e.g. for logging or an overlay)."""
+        skipped = (
+            1 - self.total_narrow_tests / self.total_broad_tests
+            if self.total_broad_tests
+            else 0.0
+        )
+        return {
+            "broad_tests": self.broad_tests,
+            "narrow_tests": self.narrow_tests,
+            "total_broad_tests": self.total_broad_tests,
+            "total_narrow_tests": self.total_narrow_tests,
+            "skipped_ratio": skipped,
+        }
+
+
+class ImpactScheduler:
+    """Event-driven enemy vs target test. The target never moves and an enemy flies
+    in a straight line toward its center at a constant speed, so the time it can
+    first touch the target is known one step after it spawns: the distance left
+    to the target's radial profile (widened by the enemy's own radius) / speed.
+
+    Those arm times sit in a min-heap. Every frame only the entries that came due
+    are popped, and only armed enemies (close enough to possibly touch) get the
+    exact CollisionPipeline Rect + Mask test, so the outcome is the same as polling
+    every enemy. Dead or recycled enemies are dropped lazily when popped.
+    """
+
+    def __init__(self, pipeline: object, bins: int = PROFILE_BINS):
+        """Creates an empty scheduler.
+
+        Args:
+            pipeline (obj): CollisionPipeline doing the narrow test + keeping the counters
+            bins (int): angular bins of the target radial profile
+
+        Attributes:
+            self.clock (float): simulated secs since the scheduler started (advanced by find_hit)
+            self.heap (list): (arm time, token, enemy) min-heap of enemies not armed yet
+            self.pending (list): (token, enemy) spawned since the last find_hit, not scheduled yet
+            self.armed (list): (token, enemy) close enough to the target to be tested every frame
+            self.profile (np.ndarray): radial profile of the target mask, built on first use
+            self.arm_distances (dict): (direction bin, enemy radius) -> arm distance (px)
+            self.scheduled (int): enemies scheduled so far
+            self.popped (int): heap entries popped so far (armed or stale)
+        """
+        self.pipeline = pipeline
+        self.bins = bins
+        self.clock = 0.0
+        self.heap = []
+        self.pending = []
+        self.armed = []
+        self.tokens = 0
+        self.profile = None
+        self.profile_mask = None
+        self.arm_distances = {}
+        self.scheduled = 0
+        self.popped = 0
+
+    def add(self, enemy: object):
+        """Registers a newly spawned (or respawned pooled) enemy. Its arm time is
+        computed by the next find_hit(), once the target is known.
+
+        Args:
+            enemy (obj): Enemy (or SwarmEnemy view) that just spawned
+        """
+        self.tokens += 1
+        enemy.impact_token = self.tokens  # older entries of a recycled enemy go stale
+        self.pending.append((self.tokens, enemy))
+
+    def discard(self, enemy: object):
+        """Drops every entry of a removed enemy (a freed swarm view still reads
+        the arrays at its old row, so is_dead alone cannot be trusted).
+
+        Args:
+            enemy (obj): Enemy (or SwarmEnemy view) removed from the game
+        """
+        enemy.impact_token = 0
+
+    def clear(self):
+        """Forgets every enemy (new run). The target profile is kept."""
+        self.heap.clear()
+        self.pending.clear()
+        self.armed.clear()
+
+    def set_target(self, target: object):
+        """Builds the radial profile of the target mask (once per mask obj)."""
+        if target.mask is not self.profile_mask:
+            self.profile = radial_profile(target.mask, self.bins)
+            self.profile_mask = target.mask
+            self.arm_distances = {}
+
+    def arm_distance(self, direction_bin: int, radius: int) -> float:
+        """Returns the largest center distance at which an enemy coming from
+        direction_bin with a mask radius of radius could touch the target.
+
+        Seen from the target center, an enemy at distance d can only touch the
+        pixels within asin(radius / d) of its direction, so it must satisfy
+        d <= (max profile over that window) + radius. The window shrinks as d
+        grows, so each window size k (in bins) gives one candidate bound.
+
+        Args:
+            direction_bin (int): profile bin of the direction from the target to the enemy
+            radius (int): enemy mask radius rounded up (px)
+        """
+        key = (direction_bin, radius)
+        distance = self.arm_distances.get(key)
+        if distance is not None:
+            return distance
+
+        profile, bins = self.profile, self.bins
+        bin_angle = 2 * math.pi / bins
+        distance = float(radius)  # closer than radius it may touch from any side
+        window_max = profile[direction_bin]
+        for k in range(1, bins // 4 + 2):
+            window_max = max(
+                window_max,
+                profile[(direction_bin - k) % bins],
+                profile[(direction_bin + k) % bins],
+            )
+            # bins b-k..b+k cover more than k bins on each side of any direction
+            # inside bin b. One bin is kept spare for the target center rounding
+            half_width = (k - 1) * bin_angle
+            min_d = radius / math.sin(half_width) if half_width > 0 else math.inf
+            if half_width >= math.pi / 2:
+                min_d = radius
+            if window_max + radius >= min_d:
+                distance = max(distance, window_max + radius)
+            if half_width >= math.pi / 2:
+                break
+        distance += ARM_MARGIN
+        self.arm_distances[key] = distance
+        return distance
+
+    def schedule(self, token: int, enemy: object, target: object):
+        """Pushes the enemy's arm time on the heap (or arms it right away)."""
+        self.scheduled += 1
+        if enemy.rotation is None:
+            # same angle its next step uses
+            enemy.apply_rotation(enemy.angle_to(target))
+        dx = enemy.x - target.x
+        dy = enemy.y - target.y
+        distance = math.hypot(dx, dy)
+        angle = math.degrees(math.atan2(-dy, dx)) % 360
+        direction_bin = int(angle * self.bins / 360) % self.bins
+        arm = self.arm_distance(direction_bin, math.ceil(enemy.rotation.radius))
+        speed = enemy.speed
+        if distance <= arm or speed <= 0:
+            self.armed.append((token, enemy))
+            return
+        heapq.heappush(self.heap, (self.clock + (distance - arm) / speed, token, enemy))
+
+    def find_hit(self, target: object, dt: float) -> object | None:
+        """Advances the clock by dt and returns the first armed enemy touching
+        the target, or None. Call once per simulation step, after the enemies moved.
+
+        Args:
+            target (object): A Target class instance (needs mask, mask_rect, radius)
+            dt (float): simulated secs since the last call
+        """
+        self.clock += dt
+        self.set_target(target)
+        for token, enemy in self.pending:
+            if enemy.impact_token == token and not enemy.is_dead:
+                self.schedule(token, enemy, target)
+        self.pending.clear()
+
+        heap = self.heap
+        while heap and heap[0][0] <= self.clock:
+            _, token, enemy = heapq.heappop(heap)
+            self.popped += 1
+            if enemy.impact_token == token and not enemy.is_dead:
+                self.armed.append((token, enemy))
+
+        self.armed = [
+            (token, enemy)
+            for token, enemy in self.armed
+            if enemy.impact_token == token and not enemy.is_dead
+        ]
+        # only the armed enemies go through the broad + narrow phase
+        return self.pipeline.find_hit(target, [enemy for _, enemy in self.armed])
+
+    def stats(self) -> dict:
+        """Returns the scheduler counters as a dict (e.g. for logging or an overlay)."""
+        return {
+            "waiting": len(self.heap),
+            "armed": len(self.armed),
+            "scheduled": self.scheduled,
+            "popped": self.popped,
+        }
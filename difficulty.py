@@ -0,0 +1,157 @@
+import json
+from pathlib import Path
+
+# NOTE: DIFFICULTY module focus on HOW HARD each score is, compiled once into lookup tables
+# Global constants
+DIFFICULTY_PROFILE_PATH = Path("difficulty/default.json")
+RANDOM_STAGE_COLOR = -1  # stage_color table value: pick a random color per spawn
+
+
+class DifficultyProfile:
+    """Difficulty curve settings, compiled into per-score lookup tables.
+    Every value the game needs at a given score (spawn interval, speed range,
+    stage color) is computed once here, so gameplay code only indexes a tuple.
+    Scores past max_difficulty_score use the last entry.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        max_difficulty_score: int = 240,
+        stage_count: int = 10,
+        start_spawn_interval: float = 2,
+        end_spawn_interval: float = 0.5,
+        min_spawn_interval: float = 0.5,
+        start_speed: float = 80,
+        end_speed_min: float = 95,
+        end_speed_max: float = 200,
+        color_count: int | None = None,
+    ):
+        """Stores the curve settings and compiles the tables.
+
+        Args:
+            name (str): profile name (e.g. the JSON file stem)
+            max_difficulty_score (int): score where the curve reaches its end values
+            stage_count (int): number of enemy color stages. Past the last one colors are random
+            start_spawn_interval (float): secs between spawns at score 0
+            end_spawn_interval (float): secs between spawns at max_difficulty_score
+            min_spawn_interval (float): spawn interval never goes below this
+            start_speed (float): min and max enemy speed (px/sec) at score 0
+            end_speed_min (float): lower speed bound at max_difficulty_score (also its cap)
+            end_speed_max (float): higher speed bound at max_difficulty_score (also its cap)
+            color_count (int | None): enemy colors the stage indexes point into, stages
+                past the last color are random too. None = one color per stage.
+                Not a curve setting: GameState sets it with with_colors()
+
+        Attributes:
+            self.spawn_interval (tuple[float]): score -> secs between spawns
+            self.speed_min (tuple[float]): score -> lower bound of the spawn speed
+            self.speed_max (tuple[float]): score -> higher bound of the spawn speed
+            self.stage_color (tuple[int]): score -> index in the enemy color list,
+                RANDOM_STAGE_COLOR past the last stage or the last color
+        """
+        if max_difficulty_score <= 0:
+            raise ValueError("max_difficulty_score must be greater than 0")
+        if stage_count <= 0:
+            raise ValueError("stage_count must be greater than 0")
+        if color_count is not None and color_count <= 0:
+            raise ValueError("color_count must be greater than 0")
+        self.name = name
+        self.max_difficulty_score = max_difficulty_score
+        self.stage_count = stage_count
+        self.start_spawn_interval = start_spawn_interval
+        self.end_spawn_interval = end_spawn_interval
+        self.min_spawn_interval = min_spawn_interval
+        self.start_speed = start_speed
+        self.end_speed_min = end_speed_min
+        self.end_speed_max = end_speed_max
+        self.color_count = color_count
+        self.compile()
+
+    @classmethod
+    def from_file(cls, path: str | Path = DIFFICULTY_PROFILE_PATH):
+        """Loads a profile from a JSON file. Missing keys keep their default value.
+
+        Args:
+            path (str | Path): JSON file holding the __init__ arguments
+        """
+        path = Path(path)
+        with open(path, "r", encoding="utf-8") as profile_file:
+            settings = json.load(profile_file)
+        settings.setdefault("name", path.stem)
+        return cls(**settings)
+
+    def to_dict(self) -> dict:
+        """Returns the curve settings (the JSON file content)."""
+        return {
+            "name": self.name,
+            "max_difficulty_score": self.max_difficulty_score,
+            "stage_count": self.stage_count,
+            "start_spawn_interval": self.start_spawn_interval,
+            "end_spawn_interval": self.end_spawn_interval,
+            "min_spawn_interval": self.min_spawn_interval,
+            "start_speed": self.start_speed,
+            "end_speed_min": self.end_speed_min,
+            "end_speed_max": self.end_speed_max,
+        }
+
+    def with_colors(self, color_count: int):
+        """Returns this profile compiled for color_count enemy colors (self if it already is).
+
+        Args:
+            color_count (int): number of enemy colors (e.g. len(ENEMY_ASSETS["ant"]["color"]))
+        """
+        if color_count == self.color_count:
+            return self
+        return DifficultyProfile(**self.to_dict(), color_count=color_count)
+
+    def compile(self):
+        """Builds the per-score tables with the LERP start + (end - start) * progression."""
+        spawn_interval, speed_min, speed_max, stage_color = [], [], [], []
+        last_stage = self.stage_count - 1
+        # stage i uses color i, so stages past the color list are random too
+        random_stage = (
+            last_stage
+            if self.color_count is None
+            else min(last_stage, self.color_count)
+        )
+        for score in range(self.max_difficulty_score + 1):
+            # progression b/w 0.0 (0%) and 1.0 (100%) of the curve
+            progress = min(score / self.max_difficulty_score, 1.0)
+
+            spawn_interval.append(
+                max(
+                    self.min_spawn_interval,
+                    self.start_spawn_interval
+                    + (self.end_spawn_interval - self.start_spawn_interval) * progress,
+                )
+            )
+            speed_min.append(
+                min(
+                    self.start_speed
+                    + (self.end_speed_min - self.start_speed) * progress,
+                    self.end_speed_min,
+                )
+            )
+            speed_max.append(
+                min(
+                    self.start_speed
+                    + (self.end_speed_max - self.start_speed) * progress,
+                    self.end_speed_max,
+                )
+            )
+            stage = int(progress * last_stage)
+            stage_color.append(RANDOM_STAGE_COLOR if stage >= random_stage else stage)
+
+        self.spawn_interval = tuple(spawn_interval)
+        self.speed_min = tuple(speed_min)
+        self.speed_max = tuple(speed_max)
+        self.stage_color = tuple(stage_color)
+
+    def index(self, score: int) -> int:
+        """Returns the table index of score (scores past the curve use the last entry).
+
+        Args:
+            score (int): current score
+        """
+        return min(score, self.max_difficulty_score)
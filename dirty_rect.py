@@ -0,0 +1,133 @@
+import pygame
+
+from profiler import PROFILER
+
+# NOTE: DIRTY RECT module focus on pushing only the screen regions that changed during PLAY
+# Global constants
+DIRTY_MAX_SCREEN_RATIO = 0.5  # above this share of the screen a full flip is cheaper
+
+
+class DirtyRectRenderer:
+    """Optional PLAY renderer for slow machines. The static background (play
+    screen + cake) is baked once, then every frame only the regions drawn last
+    frame are restored from it and only old + new sprite regions are sent to
+    the display with pygame.display.update(rects) instead of a full flip.
+
+    Restoring every region drawn last frame leaves the screen equal to the
+    background, so the sprites drawn on top give the same image as a full redraw.
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        """Creates the renderer. Call install() once so pgzero's flip honours partial frames.
+
+        Args:
+            size (tuple[int, int]): (width, height) of the screen
+
+        Attributes:
+            self.previous (list): Rects drawn last frame (restored from the background this frame)
+            self.pending (list | None): Rects to push on the next flip. None = full flip
+            self.full_redraw (bool): True redraws (and flips) the whole screen next frame
+            self.frames (int): PLAY frames drawn by this renderer
+            self.partial_frames (int): frames pushed with a partial update
+            self.dirty_pixels (int): pixels pushed by the last partial update
+        """
+        self.size = size
+        self.max_dirty_pixels = size[0] * size[1] * DIRTY_MAX_SCREEN_RATIO
+        self.previous = []
+        self.pending = None
+        self.full_redraw = True
+        self.frames = 0
+        self.partial_frames = 0
+        self.dirty_pixels = 0
+        self.display_flip = None
+
+    def install(self):
+        """Replaces pygame.display.flip (called by pgzero after every draw()) with
+        flip(), which sends only the pending Rects when the frame was partial."""
+        if self.display_flip is None:
+            self.display_flip = pygame.display.flip
+            pygame.display.flip = self.flip
+
+    def flip(self):
+        """Pushes the pending Rects, or the whole screen when there are none."""
+        pending, self.pending = self.pending, None
+        if pending is None:
+            self.display_flip()
+        else:
+            pygame.display.update(pending)
+
+    def invalidate(self):
+        """Forces a full redraw next frame (call it on every frame drawn by another
+        renderer, e.g. other states or the profiler overlay)."""
+        self.full_redraw = True
+        self.previous = []
+        self.pending = None
+
+    def draw_play(self, game: object, screen: object, target: object, player: object):
+        """Draws one PLAY frame, restoring + pushing only the regions that changed.
+
+        Args:
+            game (obj): GameState being drawn
+            screen (obj): Pygame Zero Screen object that represents game screen
+            target (object): A Target class instance used to define what the objective is.
+            player (object): A Player class instance defines what the play is
+        """
+        surface = screen.surface
+        background = game.layers.get(
+            "PLAY",
+            deps=(target.image, target.pos),
+            bake=lambda layer: self.bake_background(layer, target),
+        )
+
+        # 1. put the background back under everything drawn last frame
+        full_redraw = self.full_redraw
+        if full_redraw:
+            pygame.display.set_caption("Cake Defender")
+            surface.blit(background, (0, 0))
+        else:
+            for rect in self.previous:
+                surface.blit(background, rect, rect)
+
+        # 2. draw every enemy (same batch as GameState.draw_play), keeping the drawn Rects
+        batch = game.sprite_batch
+        rects = batch.draw(surface, game.enemies, game.render_alpha, return_rects=True)
+        PROFILER.count("enemy_draw_calls", batch.draw_calls)
+        drawn = [rect for rect in rects if rect.width]
+
+        # 3. HUD: score + player cursor
+        score_label = game.labels["score"]
+        score_label.draw(screen, game.score)
+        drawn.append(score_label.rect)
+        player.draw(screen)
+        drawn.append(player.rect.clip(surface.get_rect()))
+
+        # 4. push old + new regions, or everything when that is cheaper
+        dirty = self.previous + drawn
+        self.dirty_pixels = sum(rect.width * rect.height for rect in dirty)
+        if full_redraw or self.dirty_pixels > self.max_dirty_pixels:
+            self.pending = None
+        else:
+            self.pending = dirty
+            self.partial_frames += 1
+        self.previous = drawn
+        self.full_redraw = False
+        self.frames += 1
+
+    def bake_background(self, screen: object, target: object):
+        """Draws the static PLAY content (background + target) onto a layer.
+
+        Args:
+            screen (obj): Pygame Zero Screen object wrapping the layer Surface
+            target (object): A Target class instance used to define what the objective is.
+        """
+        screen.blit("play_screen", (0, 0))
+        screen.blit(target._surf, target.topleft)  # same as target.draw()
+
+    def stats(self) -> dict:
+        """Returns the renderer counters as a dict (e.g. for logging or an overlay)."""
+        return {
+            "frames": self.frames,
+            "partial_frames": self.partial_frames,
+            "dirty_pixels": self.dirty_pixels,
+            "dirty_ratio": self.dirty_pixels / (self.size[0] * self.size[1]),
+        }
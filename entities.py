@@ -1,53 +1,70 @@
 import math
+from pgzero import game
 from pgzero.builtins import Actor
+
 # from pgzero.loaders import images, sounds  # Manually import the magic loaders
 
-from pygame import mask, transform
+from pygame import mask
 import pygame
 
+from assets import AssetRegistry
+from sprite_cache import ROTATION_CACHE, mask_radius
+
 # Global constants
 # Registry data dictionary containing entity assets
 
 ENEMY_ASSETS = {
     "ant": {
+        # every "rgb" entry below is this shape tinted into one SpriteAtlas (see AssetRegistry).
+        # "image"/"path" only name the variant, a new color needs no PNG
+        "base": "images/enemy_blue.png",
         "color": {
             "black": {
                 "image": "enemy_black",
                 "path": "images/enemy_black.png",
+                "rgb": (41, 47, 51),
             },  # stage 1
             "blue": {
                 "image": "enemy_blue",
                 "path": "images/enemy_blue.png",
+                "rgb": (38, 83, 172),
             },  # stage 2......
             "green": {
                 "image": "enemy_green",
                 "path": "images/enemy_green.png",
+                "rgb": (29, 112, 55),
             },  # stage 3
             "orange": {
                 "image": "enemy_orange",
                 "path": "images/enemy_orange.png",
+                "rgb": (242, 132, 53),
             },  # stage 4
             "pink": {
                 "image": "enemy_pink",
                 "path": "images/enemy_pink.png",
+                "rgb": (249, 112, 148),
             },  # stage 5......
             "purple": {
                 "image": "enemy_purple",
                 "path": "images/enemy_purple.png",
+                "rgb": (124, 74, 160),
             },  # stage 6
             "red": {
                 "image": "enemy_red",
                 "path": "images/enemy_red.png",
+                "rgb": (191, 46, 12),
             },  # stage 7.....
             "teal": {
                 "image": "enemy_teal",
                 "path": "images/enemy_teal.png",
+                "rgb": (2, 171, 130),
             },  # stage 8.......
             "yellow": {
                 "image": "enemy_yellow",
                 "path": "images/enemy_yellow.png",
+                "rgb": (255, 198, 79),
             },  # stage 9
-        }
+        },
     }
 }
 
@@ -65,6 +82,18 @@ PLAYER_ASSETS = {
 }
 
 
+TARGET_ASSETS = {
+    "cake": {
+        "stages": {
+            "full": {"image": "cake1", "path": "images/cake1.png"},
+        }
+    }
+}
+
+# Shared registry: every entity gets its Surface from here instead of loading its own copy
+ASSETS = AssetRegistry(ENEMY_ASSETS, PLAYER_ASSETS, TARGET_ASSETS)
+
+
 # NOTE: ENTITIES module focus on WHAT it is and HOW to draw and move itself.
 class Enemy(Actor):  # inherits Actor class to access its methods/prop
     """Docstring for Enemy
@@ -101,12 +130,42 @@ class Enemy(Actor):  # inherits Actor class to access its methods/prop
 
         """
 
+        # atlas cells must be in pgzero's cache before Actor(image)
+        ASSETS.surface(image_path)
         super().__init__(image)  # creates Actor obj
+        self.respawn(image, image_path, pos, speed)
+
+    def respawn(
+        self,
+        image: str,
+        image_path: str,
+        pos: tuple[int, int],
+        speed: int,
+    ):
+        """(Re)sets every spawn value so a pooled Enemy can be reused instead of
+        creating a new Actor. Called by __init__ for new enemies.
+
+        Args:
+            image (str): the name of the image to create an Actor obj
+            image_path(str): path of image.png MUST include file extension. (e.g. "images/myimage.png")
+            pos (tuple[int, int]): (x, y) spawn position
+            speed (int): speed (px/sec) of the enemy
+        """
+        self._angle = 0.0  # back to the un-rotated image before swapping it
+        if image != self.image:
+            self.image = image  # pgzero loader is cached, no disk I/O
+        else:
+            self._surf = self._orig_surf
+            self._update_pos()
         self.image_path = image_path
         self.speed = speed  # px/sec
         self.x = pos[0]
         self.y = pos[1]
-        self.image_surf = pygame.image.load(self.image_path)
+        self.prev_x, self.prev_y = self.x, self.y  # position before the last step
+        self.image_surf = ASSETS.surface(self.image_path)  # shared, no disk I/O
+        # atlas colors share one rotation + mask cache key (their base shape)
+        self.shape_key = ASSETS.shape_key(self.image_path)
+        self.rotation = None
         self.mask = None
         self.mask_rect = None
         self.is_dead = False  # by default enemy is not dead
@@ -123,15 +182,12 @@ class Enemy(Actor):  # inherits Actor class to access its methods/prop
             self.mask_rect (obj): Rect obj of the mask obj after rotation and center aligns with enemy.pos center
         """
 
-        # Rotate angle to face target - syntax: Actor.angle()
-        self.angle = self.angle_to(target)  # ANTICLOCKWISE rotation
-
-        # Create rotated surface & mask matching Actor's surf (CW to counter Actor's CCW)
-        rotated_surf = transform.rotate(self.image_surf, -self.angle)
-        self.mask = mask.from_surface(rotated_surf)  # mask of rotated surface
+        # Rotate to face target using the shared rotation cache (ANTICLOCKWISE rotation)
+        ## one cached rotation is used for both drawing and the mask
+        self.apply_rotation(self.angle_to(target))
 
-        # Create rotated mask Rect obj center to match enemy.pos
-        self.mask_rect = self.mask.get_rect(center=(self.x, self.y))
+        # remember where this step started so draw_interpolated() can blend
+        self.prev_x, self.prev_y = self.x, self.y
 
         # Move toward target center
         # NOTE: velocity vector = unit direction vector * speed * dt
@@ -145,6 +201,61 @@ class Enemy(Actor):  # inherits Actor class to access its methods/prop
             self.x += dx / dist * self.speed * dt
             self.y += dy / dist * self.speed * dt
 
+        # keep mask Rect obj centered on the moved enemy.pos
+        self.mask_rect = self.rotation.mask_rect((self.x, self.y))
+
+    def render_pos(self, alpha: float) -> tuple[float, float]:
+        """Returns the center position between the previous and current step.
+
+        Args:
+            alpha (float): 0.0 = position before the last step, 1.0 = current position
+        """
+        prev_x, prev_y = self.prev_x, self.prev_y
+        return (
+            prev_x + (self.x - prev_x) * alpha,
+            prev_y + (self.y - prev_y) * alpha,
+        )
+
+    def draw_interpolated(self, alpha: float) -> object:
+        """Draws the enemy at render_pos(alpha) (same anchor as Actor.draw).
+
+        Args:
+            alpha (float): 0.0 = position before the last step, 1.0 = current position
+
+        Returns:
+            Rect: screen area that was drawn
+        """
+        x, y = self.render_pos(alpha)
+        ax, ay = self._anchor
+        return game.screen.blit(self._surf, (x - ax, y - ay))
+
+    def apply_rotation(self, angle: float):
+        """Swaps in the cached rotated Surface + Mask for angle instead of letting
+        Actor.angle rotate the image again on every frame.
+
+        Args:
+            angle (float): anti-clockwise angle in degrees (same as Actor.angle)
+
+        Attributes:
+            self.rotation (obj): RotatedSprite cache entry shared with same-shape enemies (every color)
+            self.mask (obj): mask obj of the rotated Surface
+        """
+        rotation = ROTATION_CACHE.get(
+            self.shape_key, self.image_surf, angle, variant=self.image_path
+        )
+        if rotation is self.rotation:
+            return  # same quantized angle as last frame, nothing to update
+
+        # same steps as the Actor.angle setter, but with the cached Surface
+        pos = self.pos
+        self.rotation = rotation
+        self._angle = rotation.angle
+        self._surf = rotation.variants[self.image_path]
+        self.width, self.height = rotation.size
+        self._anchor = (rotation.size[0] / 2, rotation.size[1] / 2)  # center anchor
+        self.pos = pos
+        self.mask = rotation.mask
+
 
 class Target(Actor):
     def __init__(self, image, image_path, screen_width, screen_height):
@@ -160,13 +271,15 @@ class Target(Actor):
             self.pos (int): defines target x and y position by its center
             self.mask (obj): mask object of the loaded target.png
             self.mask_rect (obj): Rect obj of the mask obj after center matches target.pos center
+            self.radius (float): bounding circle radius of the mask, for broad-phase collision culling
         """
         super().__init__(image)  # create Actor obj
         self.image_path = image_path
         self.pos = screen_width // 2, screen_height // 2
-        self.image_surf = pygame.image.load(self.image_path)
+        self.image_surf = ASSETS.surface(self.image_path)
         self.mask = mask.from_surface(self.image_surf)
         self.mask_rect = self.mask.get_rect(center=(self.x, self.y))
+        self.radius = mask_radius(self.mask)
 
 
 class Player:
@@ -181,7 +294,7 @@ class Player:
         self.image_path = image_path
 
         # -- Create Rect obj hitbox from image_path of image-- #
-        self.image_surf = pygame.image.load(self.image_path).convert_alpha()
+        self.image_surf = ASSETS.surface(self.image_path)
         # Rect obj created once at __init__ instead of multiple times in draw() loop
         self.rect = self.image_surf.get_rect()
 
@@ -1,71 +1,130 @@
-import json
-import math
 from pathlib import Path
 import random
 import sys
+import time
+import numpy as np
 import pygame
-from entities import ENEMY_ASSETS
+from collision import CollisionPipeline, ImpactScheduler
+from difficulty import DIFFICULTY_PROFILE_PATH, RANDOM_STAGE_COLOR, DifficultyProfile
+from layers import LayerCompositor
+from entities import ASSETS, ENEMY_ASSETS
+from pool import EnemyPool
+from profiler import PROFILER
+from save_writer import SAVE_WRITER
+from score_store import LEGACY_SAVE_PATH, SCORE_DB_PATH, ScoreStore
+from spatial import SpatialHashGrid
+from spawning import SpawnRing
+from sprite_batch import SpriteBatch
+from swarm import SwarmEngine
+from text_cache import TextLabel
 from ui import Button
 from pgzero.loaders import sounds
-from pgzero.builtins import Actor
 
 # NOTE: GAME STATE module focus on WHEN/WHERE/WHAT/HOW MANY to draw, consequences and performance
 # Global constants
-MAX_DIFFICULTY_SCORE = 240  # ((current_speed - start speed)//value_increased_by)*points required per interval
-START_SPEED = 80  # always start speed at this value
-MAX_SPEED_CAP = 200  # never let higher speed range go over this
-MIN_SPEED_CAP = 95  # never let lower speed range go over this
-STAGE_COUNT = 10  # number of difficulty stages in the game
-MAX_SPAWN_CAP = 0.5  # never go below this spawn interval
-MIN_SPAWN_CAP = 2  # never go over this spawn interval
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 
+# Registry data dictionary of the backgrounds + decorations drawn by name
+SCREEN_ASSETS = {
+    "menu": {"image": "menu", "path": "images/menu.png"},
+    "play": {"image": "play_screen", "path": "images/play_screen.png"},
+    "game_over": {"image": "game_over", "path": "images/game_over.png"},
+    "heart": {"image": "heart", "path": "images/heart.png"},
+    "ghost": {"image": "ghost1", "path": "images/ghost1.png"},
+}
+ASSETS.register(SCREEN_ASSETS)
+MENU_IMAGES = [SCREEN_ASSETS["menu"]["path"]]  # the only image the MENU draws
+
 
 class GameState:
-    def __init__(self):
+    def __init__(
+        self,
+        use_swarm: bool = False,
+        seed: int | None = None,
+        save_path: str | None = SCORE_DB_PATH,
+        difficulty: object | None = None,
+    ):
         """Holds all the game state screen data and variables together (menu, play, end).
 
+        Args:
+            use_swarm (bool): True moves enemies with the NumPy SwarmEngine backend
+                instead of stepping each Enemy Actor in Python
+            seed (int | None): seed for the game RNG. None seeds from the OS (normal play)
+            save_path (str | None): SQLite run history file. None disables loading/saving (headless runs)
+            difficulty (obj | None): DifficultyProfile to play with. None loads difficulty/default.json
+
         Attributes:
             self.state(str): game state as "MENU", "PLAY", "GAMEOVER", "PAUSE", "RESUME"
             self.render_map (dict): maps self.state to reference draw screen methods (draw_menu, draw_play, draw_game_over)
             self.menu_buttons(dict): creates menu buttons using Button class and stores them
             self.game_over_buttons (dict): creates game buttons using Button class and stores them
-            self.enemies (list): Store list of Enemy Actor objects. 0 enemies at start
+            self.labels (dict): TextLabel objs for every screen text, rendered once per distinct text
+            self.layers (obj): LayerCompositor holding the baked static MENU/GAMEOVER screens
+            self.pause_snapshot (obj): frozen dimmed PLAY Surface drawn during PAUSE. None outside PAUSE
+            self.grid (obj): SpatialHashGrid of enemy mask rects for click hit-testing
+            self.collisions (obj): CollisionPipeline for enemy vs target tests + per-frame counters
+            self.impacts (obj): ImpactScheduler, only enemies due to reach the target are tested
+            self.swarm (obj): SwarmEngine backend, None when use_swarm is False
+            self.sprite_batch (obj): SpriteBatch drawing the enemy layer (one blits call per frame)
+            self.enemies (obj): EnemyPool of live Enemy Actor objects (swarm view list in swarm mode). 0 at start
             self.score (int): tracks player's score. Start at 0
             self.storage.setdefault (dict):
             self.spawn_timer (int): timer counting in secs since last spawn. Starts at 0.
+            self.difficulty (obj): DifficultyProfile with the per-score spawn/speed/color tables
             self.spawn_interval (int): Define how often enemy spawn per sec
-            self.spawn_interval_decrease (int): amount of secs to decrease spawn_interval by
-            self.difficulty_score_interval (int): points required to trigger difficulty
             self.speed_min (int): defines min speed (px/sec) of the enemy
             self.speed_max (int): defines max speed (px/sec) of the enemy
-            self.save_path(object): Path object that represents file location
-            self.data(dict): centralized data from JSON game_data file
+            self.render_alpha (float): 0.0-1.0 blend b/w the last two simulation steps used to draw enemies
+            self.stage_color (int): enemy color index for new spawns (RANDOM_STAGE_COLOR = random)
+            self.rng (obj): random.Random instance used for every gameplay random choice
+            self.spawn_rings (dict): image path -> SpawnRing spawn geometry of that sprite
+            self.save_path(object): Path object that represents file location. None = no saves
+            self.scores(obj): ScoreStore run history (replaces the old game_data.json dict). None = no saves
+            self.run_time (float): secs spent in PLAY this run
+            self.peak_enemies (int): most enemies alive at once this run
             self.game_saved(bool): bool flag indicating whether or not game was saved
             self.new_highscore(bool): bool flag indicating whether or not new highscore achieved
         """
 
-        self.save_path = Path("game_data.json")  # Path obj of file path
-        # --- CENTRALIZED DATA DICTIONARY --- #
-        ## add to the dictionary as game grows (e.g. player_name, sound_vol. etc.)
-        self.data = {"highscore": 0}
+        self.rng = random.Random(seed)  # seeded runs are reproducible
+        if difficulty is None:  # shipped curve, or the built-in one if it is missing
+            if DIFFICULTY_PROFILE_PATH.exists():
+                difficulty = DifficultyProfile.from_file(DIFFICULTY_PROFILE_PATH)
+            else:
+                difficulty = DifficultyProfile()
+        # stage color indexes must stay inside the enemy color list
+        difficulty = difficulty.with_colors(len(ENEMY_ASSETS["ant"]["color"]))
+        self.difficulty = difficulty
+        self.save_path = Path(save_path) if save_path is not None else None
+        self.scores = None  # opened by load_save()
 
         # Gameplay data
         self.game_saved = False  # set to False game has not been saved yet
         self.is_resuming = True  # game is not paused by default
         self.resume_countdown = 0  # tracks countdown sec til going back to play state
-        self.enemies = []
+        self.grid = SpatialHashGrid(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.swarm = SwarmEngine(grid=self.grid) if use_swarm else None
+        self.collisions = CollisionPipeline()
+        self.impacts = ImpactScheduler(self.collisions)
+        # swarm mode: enemies list IS the swarm's view list (same list obj)
+        self.enemies = self.swarm.views if self.swarm is not None else EnemyPool()
+        self.sprite_batch = SpriteBatch(swarm=self.swarm)
         # self.enemy_colors = list(ENEMY_ASSETS.keys())  # retrieves the enemy color names
         self.enemy_ant_colors = list(ENEMY_ASSETS["ant"]["color"].keys())
+        self.spawn_rings = {}  # image path -> SpawnRing, built on first spawn
         self.score = 0
+        self.run_time = 0.0
+        self.peak_enemies = 0
         self.highscore = 0
         self.new_highscore = False  # new highscore was achieved?
         self.spawn_timer = 0
-        self.spawn_interval = MIN_SPAWN_CAP
-        self.speed_min = START_SPEED  # px/sec
-        self.speed_max = START_SPEED
+        self.spawn_interval = difficulty.spawn_interval[0]
+        self.speed_min = difficulty.speed_min[0]  # px/sec
+        self.speed_max = difficulty.speed_max[0]
+        self.stage_color = difficulty.stage_color[0]  # enemy color index for spawns
         self.state_timer = 0
+        self.render_alpha = 1.0  # fixed-step interpolation factor set by main.update()
 
         # Current screen/mode (menu, playing, game_over)
         self.state = "MENU"  # "MENU", "PLAY", "GAMEOVER", "PAUSE"
@@ -116,42 +175,119 @@ class GameState:
                 hovering_color=(236, 140, 128),  # pink
             ),
         }
+
+        # Screen texts. Static ones render once, value ones only when the value changes
+        outline = {"owidth": 1, "ocolor": (154, 207, 174)}  # green outline
+        self.labels = {
+            "menu_start": TextLabel(
+                "Start", fontname="love_days", fontsize=99, center=(960, 580), **outline
+            ),
+            "menu_quit": TextLabel(
+                "Quit", fontname="love_days", fontsize=99, center=(960, 750), **outline
+            ),
+            "menu_highscore": TextLabel(
+                "Highscore: {}",
+                fontname="love_days",
+                fontsize=110,
+                color=(191, 138, 105),
+                center=(960, 930),
+            ),
+            "score": TextLabel(
+                "Score: {}",
+                fontname="love_days",
+                fontsize=72,
+                topleft=(100, 0),
+                **outline
+            ),
+            "paused": TextLabel(
+                "PAUSED",
+                fontname="love_days",
+                fontsize=80,
+                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+            ),
+            "press_resume": TextLabel(
+                "Press space to resume",
+                fontname="love_days",
+                fontsize=60,
+                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100),
+            ),
+            "resuming": TextLabel(
+                "Resuming in {}",
+                fontname="love_days",
+                fontsize=60,
+                color="orange",
+                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100),
+            ),
+            "final_score": TextLabel(
+                "Score: {}",
+                fontname="love_days",
+                fontsize=110,
+                color="orange",
+                center=(960, 465),
+            ),
+            "new_highscore": TextLabel(
+                "New Highscore: {}",
+                fontname="love_days",
+                fontsize=110,
+                color="orange",
+                center=(960, 465),
+            ),
+            "retry": TextLabel(
+                "Retry", fontname="love_days", fontsize=99, center=(960, 580), **outline
+            ),
+            "game_over_quit": TextLabel(
+                "Quit", fontname="love_days", fontsize=99, center=(960, 750), **outline
+            ),
+        }
+
+        self.layers = LayerCompositor((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.pause_snapshot = None  # dimmed play field, taken on the first PAUSE frame
+
         # loads existing data immediately
         self.load_save()
 
     ## --- # NOTE: GAME PERSISTENCE LOGIC --- ##
     def load_save(self):
-        """Reads the saved json data file if it exits, otherwise it keeps the default"""
-        if self.save_path.exists():  # save_path exists?
-            # opens file, then reads with utf-8 encoder, store value as variable game_data_file
-            with open(self.save_path, "r", encoding="utf-8") as game_data_file:
-                # turns json to python dict then updates local data dict with saved values
-                self.data.update(json.load(game_data_file))
+        """Opens the run history (creating it if needed) and reads the highscore.
+        An old game_data.json next to it is imported once."""
+        if self.save_path is None:  # saving disabled (headless runs)
+            return
 
-        # sets self.highscore with whatever value is stored in local central data dict.
-        self.highscore = self.data["highscore"]
+        self.scores = ScoreStore(self.save_path)
+        self.scores.migrate_json(self.save_path.with_name(LEGACY_SAVE_PATH.name))
+        # best score ever, one index lookup
+        self.highscore = self.scores.highscore()
 
     def save_game(self):
         """Call this ONLY when game over or player exits.
-        Optimize speed by reducing times accessing JSON"""
+        The run is appended to the history by the background SAVE_WRITER thread,
+        so the frame never waits on the disk.
+        """
 
-        # opens file, then writes with utf-8 encoder, store value as variable game_data_file
-        with open(self.save_path, "w", encoding="utf-8") as game_data_file:
-            # saves the data to the opened file and indents 4 spaces for human readability
-            json.dump(self.data, game_data_file, indent=4)
+        if self.scores is None:  # saving disabled (headless runs)
+            self.game_saved = True
+            return
+
+        # values are captured now, the insert runs on the writer thread
+        SAVE_WRITER.call(
+            self.scores.add_run,
+            self.score,
+            round(self.run_time, 3),
+            self.peak_enemies,
+            time.time(),
+        )
 
         self.game_saved = True  # True when game is saved
 
     def update_highscore(self):
         """Update the highscore value in memory only (locally), for easy access in code
-        and to optimize speed by reducing read/write to JSON file.
+        and to optimize speed by reducing reads from the run history database.
 
         Args:
             current_score (int): current score during gameplay
         """
         if self.score > self.highscore:
             self.highscore = self.score  # for easy access in code
-            self.data["highscore"] = self.score  # to later save to JSON data file
             self.new_highscore = True  # new highscore is achieved
 
     ## --- # NOTE: RENDER COORDINATION DRAW LOGIC (WHEN/WHERE/WHAT/HOW MANY) --- ##
@@ -181,37 +317,11 @@ class GameState:
         # set window caption
         pygame.display.set_caption("Cake Defender - Menu")
 
-        # screen background
-        screen.blit("menu", (0, 0))
-
-        # draw outline text button
-        screen.draw.text(
-            "Start",
-            center=(960, 580),
-            fontname="love_days",
-            fontsize=99,
-            owidth=1,
-            ocolor=(154, 207, 174),  # green
-        )
-        screen.draw.text(
-            "Quit",
-            center=(960, 750),
-            fontname="love_days",
-            fontsize=99,
-            owidth=1,
-            ocolor=(154, 207, 174),  # green
-        )
-
-        if self.highscore > 0:
-            screen.draw.text(
-                f"Highscore: {self.highscore}",
-                center=(960, 930),
-                fontname="love_days",
-                fontsize=110,
-                color=(191, 138, 105),
-            )
+        # static part (background, labels, highscore), re-baked when the highscore changes
+        layer = self.layers.get("MENU", deps=(self.highscore,), bake=self.bake_menu)
+        screen.blit(layer, (0, 0))
 
-        # draw all the menu_buttons
+        # draw all the menu_buttons (hover state changes every frame)
         for btn in self.menu_buttons.values():  # loop through key values: Button obj
             btn.draw(screen)  # calls Button draw() method
 
@@ -234,20 +344,13 @@ class GameState:
         # 2. draw target on PLAY screen
         target.draw()  # draw Target obj
 
-        # 3. draw every spawned enemy
-        # iterate for every item in game.enemies list, temp store in enemy var
-        for enemy in self.enemies:
-            enemy.draw()  # draw Enemy obj stored in actor attribute
-
-        # 4. Display current score
-        screen.draw.text(
-            f"Score: {self.score}",
-            (100, 0),
-            fontname="love_days",
-            fontsize=72,
-            owidth=1,
-            ocolor=(154, 207, 174),  # green
-        )
+        # 3. draw every spawned enemy, blended b/w its last two simulated positions
+        # one Surface.blits call for the whole layer (one blit per enemy when batching is off)
+        self.sprite_batch.draw(screen.surface, self.enemies, self.render_alpha)
+        PROFILER.count("enemy_draw_calls", self.sprite_batch.draw_calls)
+
+        # 4. Display current score (re-rendered only when the score changed)
+        self.labels["score"].draw(screen, self.score)
 
         # 5. draw player
         if (
@@ -269,55 +372,48 @@ class GameState:
         pygame.display.set_caption("Cake Defender - Pause")
 
         # -- screen background -- #
+        # The dimmed play field is drawn once when PAUSE is entered and the snapshot
+        # is reused for the whole pause + resume countdown (nothing moves meanwhile)
+        if self.pause_snapshot is None:
+            self.pause_snapshot = self.snapshot_pause(screen, target, player)
+        screen.blit(self.pause_snapshot, (0, 0))
 
-        # 1. draw PLAY screen
-        self.draw_play(screen, target, player)
+        # Draw PAUSE screen if is_resuming is False.
+        if not self.is_resuming:
+            self.labels["press_resume"].draw(screen)
 
-        # 2. draw the target obj on top of PLAY screen
-        target.draw()
+        # draw resuming text countdown from 3 to 1, rounding as decr by -= dt
+        if self.is_resuming:
+            self.labels["resuming"].draw(screen, round(self.resume_countdown))
 
-        # 3. draw each spawned enemy
-        # iterate for every item in self.enemies list, temp store in enemy variable
-        for enemy in self.enemies:
-            enemy.draw()  # draw Enemy obj stored in actor attribute
+    def snapshot_pause(self, screen: object, target: object, player: object) -> object:
+        """Draws the dimmed PLAY screen + "PAUSED" onto the screen once and returns a copy.
+
+        Args:
+            screen (obj): Pygame Zero Screen object that represents game screen
+            target (object): A Target class instance used to define what the objective is.
+            player (object): A Player class instance used to define what a player is
+
+        Returns:
+            Surface: frozen pause background
+        """
+        # 1. draw PLAY screen (target + enemies, no player in PAUSE state)
+        self.draw_play(screen, target, player)
 
         ## --- Create a semi-transparent overlay screen to still see game PLAY --- ##
-        # 4. Create overlay Surface = screen size. Use pygame.Surface with SRCALPHA to enable transparency
+        # 2. Create overlay Surface = screen size. Use pygame.Surface with SRCALPHA to enable transparency
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         # use Surface_obj.fill() to fill overlay Surface with semi-transparent black color
         ## (0, 0, 0, 128) -> R,G,B,A -> A (alpha) 0-255, 0 is full transparency
         overlay.fill((0, 0, 0, 128))
 
-        # 5. draw the semi-transparent overlay screen on top the PLAY screen
+        # 3. draw the semi-transparent overlay screen on top the PLAY screen
         # use screen.blit(Surface, pos) with enabled alpha. Requires pygame.Surface as arg
         screen.blit(overlay, (0, 0))  # top-left pos 0, 0
 
         # draw UI TEXT on top of overlay
-        screen.draw.text(
-            "PAUSED",
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
-            fontname="love_days",
-            fontsize=80,
-        )
-
-        # Draw PAUSE screen if is_resuming is False.
-        if not self.is_resuming:
-            screen.draw.text(
-                "Press space to resume",
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100),
-                fontname="love_days",
-                fontsize=60,
-            )
-
-        # draw resuming text countdown from 3 to 1, rounding as decr by -= dt
-        if self.is_resuming:
-            screen.draw.text(
-                f"Resuming in {round(self.resume_countdown)}",
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100),
-                fontname="love_days",
-                fontsize=60,
-                color="orange",
-            )
+        self.labels["paused"].draw(screen)
+        return screen.surface.copy()
 
     def draw_game_over(
         self, screen: object, player: object, target: object | None = None
@@ -334,43 +430,15 @@ class GameState:
         # set window caption
         pygame.display.set_caption("Cake Defender - Game Over")
 
-        # screen background
-        screen.blit("game_over", (0, 0))
+        # static part (background, decorations, outlined labels), baked once
+        layer = self.layers.get("GAMEOVER", deps=(), bake=self.bake_game_over)
+        screen.blit(layer, (0, 0))
 
         # draw final score
         if self.new_highscore:  # new highscore?
-            score_text = f"New Highscore: {self.score}"
+            self.labels["new_highscore"].draw(screen, self.score)
         else:
-            score_text = f"Score: {self.score}"
-        screen.draw.text(
-            score_text,
-            center=(960, 465),
-            fontname="love_days",
-            fontsize=110,
-            color="orange",
-        )
-
-        # Add extra screen assets
-        screen.blit("heart", (780, 570))  # heart near RETRY button
-        screen.blit("ghost1", (795, 740))  ## ghost near QUIT button
-
-        # draw outline text button
-        screen.draw.text(
-            "Retry",
-            center=(960, 580),
-            fontname="love_days",
-            fontsize=99,
-            owidth=1,
-            ocolor=(154, 207, 174),
-        )
-        screen.draw.text(
-            "Quit",
-            center=(960, 750),
-            fontname="love_days",
-            fontsize=99,
-            owidth=1,
-            ocolor=(154, 207, 174),
-        )
+            self.labels["final_score"].draw(screen, self.score)
 
         # draw all the game_over_buttons
         for (
@@ -381,6 +449,39 @@ class GameState:
         # draw player on screen
         player.draw(screen)
 
+    def bake_menu(self, screen: object):
+        """Draws the static MENU content onto a layer (see draw_menu).
+
+        Args:
+            screen (obj): Pygame Zero Screen object wrapping the layer Surface
+        """
+        # screen background
+        screen.blit("menu", (0, 0))
+
+        # draw outline text button
+        self.labels["menu_start"].draw(screen)
+        self.labels["menu_quit"].draw(screen)
+
+        if self.highscore > 0:
+            self.labels["menu_highscore"].draw(screen, self.highscore)
+
+    def bake_game_over(self, screen: object):
+        """Draws the static GAMEOVER content onto a layer (see draw_game_over).
+
+        Args:
+            screen (obj): Pygame Zero Screen object wrapping the layer Surface
+        """
+        # screen background
+        screen.blit("game_over", (0, 0))
+
+        # Add extra screen assets
+        screen.blit("heart", (780, 570))  # heart near RETRY button
+        screen.blit("ghost1", (795, 740))  ## ghost near QUIT button
+
+        # draw outline text button
+        self.labels["retry"].draw(screen)
+        self.labels["game_over_quit"].draw(screen)
+
     ## --- # NOTE: GAME STATE MANAGEMENT LOGIC --- ##
 
     def change_state(self, new_state: str):
@@ -391,6 +492,99 @@ class GameState:
         """
         self.state = new_state
         self.state_timer = 0  # resets timer buffer for new screen
+        if new_state != "PAUSE":
+            self.pause_snapshot = None  # the next pause takes a fresh snapshot
+
+    def update(
+        self,
+        dt: float,
+        target: object,
+        enemy_class: object,
+        enemy_name: str = "ant",
+        enemy_asset: str = "color",
+    ) -> bool:
+        """One frame of game logic: resume countdown, spawn, movement, collisions.
+        Called by main.update() and by the headless runner.
+
+        Args:
+            dt (float): delta time is time since last frame
+            target (object): A Target class instance used to define what the objective is
+            enemy_class (object): Enemy class used to create new enemies
+            enemy_name (str): The enemy name (key) from ENEMY_ASSETS registry dictionary (e.g. "ant")
+            enemy_asset (str): The enemy asset key from ENEMY_ASSETS registry dictionary (e.g. "color")
+
+        Returns:
+            bool: True if the game ended this frame
+        """
+        self.check_resume(dt)  # is resuming? if True countdown til PLAY state
+
+        # increment the state timer every frame. only resets during screen transition
+        self.state_timer += dt
+        # Enemy spawn when game state is "PLAY"
+        if self.state == "PLAY":
+            with PROFILER.phase("spawn"):
+                self.update_spawn(
+                    dt=dt,
+                    enemy_class=enemy_class,
+                    enemy_name=enemy_name,
+                    enemy_asset=enemy_asset,
+                )  # spawns enemy
+            with PROFILER.phase("movement"):
+                self.update_enemies(target=target, dt=dt)  # moves enemies
+            self.run_time += dt
+            self.peak_enemies = max(self.peak_enemies, len(self.enemies))
+            with PROFILER.phase("collision"):
+                game_over = self.check_enemy_target_collision(target, dt)
+            if game_over:  # is game over?
+                return True
+        return False
+
+    def handle_key(self, key, expected_button):
+        """Pauses/resumes the game on key press. Ignored during the resume countdown.
+
+        Args:
+            key (enum): the key that was pressed
+            expected_button (enum): the pause key (e.g. keys.SPACE)
+        """
+        if self.state == "PAUSE" and self.is_resuming:  # is game resuming?
+            return  # prevents pressing again during countdown
+
+        # check pause: True > state set to PAUSE, False -> game resume
+        self.check_pause(input_button=key, expected_button=expected_button)
+
+    def handle_click(self, pos, input_button, expected_button, player: object) -> int:
+        """Handles a mouse click: buttons on MENU/GAMEOVER, killing enemies on PLAY.
+
+        Args:
+            pos (tuple[int, int]): (x, y) position of the click
+            input_button (enum): A mouse enum value indicating the button that was pressed.
+            expected_button (enum): A mouse enum value of the button you expect to be pressed
+            player (object): An instance of Player class used as the click hitbox
+
+        Returns:
+            int: enemies killed by the click (removed by the next update_enemies)
+        """
+        # block input during PAUSE state
+        if self.state == "PAUSE":
+            return 0
+
+        # only allows mouse clicks if screen has been visible for at least 0.5s
+        if self.state_timer < 0.5:
+            return 0
+
+        # Finds which button was clicked on MENU/GAMEOVER screen then changes game state
+        self.check_button_interactions(
+            mouse_pos=pos, input_button=input_button, expected_button=expected_button
+        )
+
+        # hitbox follows the click position
+        player.rect.center = pos
+        # removes enemies when clicked and scales diffculty base on score
+        return self.check_enemy_player_collisions(
+            input_button=input_button,
+            expected_button=expected_button,
+            player=player,
+        )
 
     def check_pause(self, input_button, expected_button):
         if input_button == expected_button:  # is space pressed?
@@ -414,20 +608,26 @@ class GameState:
         self.game_saved = False
         self.is_resuming = True  # game is not paused by default
         self.resume_countdown = 0
-        self.enemies = []
+        if self.swarm is not None:
+            self.swarm.clear()  # empties the shared view list + grid too
+        else:
+            self.enemies.clear()  # recycles every pooled enemy for the next run
+            self.grid.clear()
+        self.impacts.clear()
         self.score = 0
+        self.run_time = 0.0
+        self.peak_enemies = 0
         self.new_highscore = False
         self.spawn_timer = 0
-        self.spawn_interval = MIN_SPAWN_CAP
-        self.speed_min = START_SPEED
-        self.speed_max = START_SPEED
+        self.update_difficulty()  # back to the score 0 values
         self.state_timer = 0
 
         # change game state to PLAY + resets state_timer
         self.change_state("PLAY")
 
     def quit(self):
-        """Quits and exits the game."""
+        """Quits and exits the game once the pending saves are on disk."""
+        SAVE_WRITER.flush()
         pygame.quit()  # Uninitalizes all pygame modules
         sys.exit()  # terminates Python process and closes game window
 
@@ -463,14 +663,14 @@ class GameState:
 
     def get_difficulty_stage_progression(self):
         """Return a float representing stage progress (0.0 - 1.0) based on score milestones
-        Where MAX_DIFFICULTY_SCORE determines number of stages.
+        Where the difficulty profile's max_difficulty_score determines number of stages.
 
         Returns:
             float: progression value between 0.0 and 1.0 based on current score progress
         """
         # progress is the current score out of max difficulty score
         # which gives a value b/w 0.0 (0%) and 1.0 (100%) so cap at 1.0
-        return min(self.score / MAX_DIFFICULTY_SCORE, 1.0)  # selects lowest b/w the two
+        return min(self.score / self.difficulty.max_difficulty_score, 1.0)
 
     def get_enemy_image(self, enemy_name: dict, enemy_asset: dict):
         """Determines enemy image name based on score and stage difficulty
@@ -481,18 +681,14 @@ class GameState:
         Returns:
             dict: dictionary of enemy assets: image and image path
         """
-
-        progression = self.get_difficulty_stage_progression()
-
-        # stores the index number 0-8 STAGE_COUNT -1 bc index range starts at 0
-        stage_color_index = int(progression * (STAGE_COUNT - 1))
+        # stage color index 0-8 precompiled per score in the difficulty profile
+        stage_color_index = self.stage_color
 
         # LOGICS
-        # if index is 0-8: return the specific color from the self.enemy_colors list
-        # if index is 9 or greater: return a random color from the list
-
-        if stage_color_index >= 9:
-            color_key = random.choice(self.enemy_ant_colors)
+        # if index is a stage: return the specific color from the self.enemy_colors list
+        # if past the last stage: return a random color from the list
+        if stage_color_index == RANDOM_STAGE_COLOR:
+            color_key = self.rng.choice(self.enemy_ant_colors)
         else:
             color_key = self.enemy_ant_colors[stage_color_index]
 
@@ -502,28 +698,16 @@ class GameState:
 
     def update_difficulty(self):
         """Difficulty-scaling: Increase spawn freq and speed based score progression.
-        Uses LERP Linear interoperability formula for smooth progression.
-        Progression based on each point earned. start + (end - start) * progression
+        The LERPs (start + (end - start) * progression) are precompiled per score
+        by the DifficultyProfile, so this is one table lookup per value.
         """
-
-        # updates difficulty infinitesimally after every point earned
-        progress = self.get_difficulty_stage_progression()  # progression based on score
-
-        # --- SCALE SPAWN FREQUENCY --- #
-        # cap max spawn interval to ensure it doesn't go below 0.5 using max()
-        self.spawn_interval = max(
-            0.5, MIN_SPAWN_CAP + (MAX_SPAWN_CAP - MIN_SPAWN_CAP) * progress
-        )
-
-        # --- SCALE SPEED RANGE -- #
-        ## LERP linear interoperability (progress) b/w start (80) and speed cap
-        # cap min and max speed to ensure it doesn't go over the defined cap (95 and 200)
-        self.speed_min = min(
-            START_SPEED + (MIN_SPEED_CAP - START_SPEED) * progress, MIN_SPEED_CAP
-        )
-        self.speed_max = min(
-            START_SPEED + (MAX_SPEED_CAP - START_SPEED) * progress, MAX_SPEED_CAP
-        )
+        # updates difficulty after every point earned
+        difficulty = self.difficulty
+        i = difficulty.index(self.score)
+        self.spawn_interval = difficulty.spawn_interval[i]  # secs between spawns
+        self.speed_min = difficulty.speed_min[i]  # speed range (px/sec)
+        self.speed_max = difficulty.speed_max[i]
+        self.stage_color = difficulty.stage_color[i]  # enemy color index
 
     def get_spawn_speed(self) -> float:
         """Retrieves a random float based on min/max speed to increase smooth movement variety
@@ -531,65 +715,36 @@ class GameState:
         Returns:
             float: returns a random speed within speed_min and speed_max range
         """
-        return random.uniform(self.speed_min, self.speed_max)
+        return self.rng.uniform(self.speed_min, self.speed_max)
 
     ## --- # NOTE: GAME FLOW LOGIC --- ##
 
-    def get_spawn_position(
-        self,
-        enemy_name: dict,
-        enemy_asset: dict,
-        screen_width=SCREEN_WIDTH,
-        screen_height=SCREEN_HEIGHT,
-    ):
-        """Returns (x, y) spawn position
+    def get_spawn_ring(self, enemy_image: dict) -> SpawnRing:
+        """Returns the spawn geometry of an enemy sprite, built once per image.
 
         Args:
-            screen_width (int): horizontal size of the screen in px
-            screen_height (int): vertical size of the screen in px
-            enemy_name (dict): The enemy name (key) from ENEMY_ASSETS registry dictionary (e.g. "ant")
-            enemy_asset (dict):  The enemy asset key from ENEMY_ASSETS registry dictionary (e.g. "color")
+            enemy_image (dict): ENEMY_ASSETS entry with "image" and "path" keys
+
         Returns:
-            tuple[int, int]: (x, y) spawn position
+            SpawnRing: buffer distance, edge bands and corners for that sprite size
         """
+        ring = self.spawn_rings.get(enemy_image["path"])
+        if ring is None:
+            # sprite size read once from the shared Surface (no temporary Actor)
+            size = ASSETS.surface(enemy_image["path"]).get_size()
+            ring = SpawnRing(size, SCREEN_WIDTH, SCREEN_HEIGHT)
+            self.spawn_rings[enemy_image["path"]] = ring
+        return ring
 
-        # 1. get data from entities registry dictionary
-        # ENEMY_ASSETS["ant"]["color"]["black"] -> image and path keys
-        image = self.get_enemy_image(enemy_name, enemy_asset)["image"]
-
-        # 2. create temporary Actor obj to get dimensions. Actor(image_name)
-        ## Pygame zero loads image and sets .width .height
-        temp_actor = Actor(image)
-
-        sprite_diag = math.hypot(temp_actor.width, temp_actor.height)  # diagonal length
-        buffer = int(sprite_diag * 0.5) + 50  # half diag + padding
-
-        positions = {
-            "left": (-buffer, "y"),
-            "right": (screen_width + buffer, "y"),
-            "top": ("x", -buffer),
-            "bottom": ("x", screen_height + buffer),
-            "top-left": (-buffer, -buffer),
-            "top-right": (screen_width + buffer, -buffer),
-            "bottom-left": (-buffer, screen_height + buffer),
-            "bottom-right": (screen_width + buffer, screen_height + buffer),
-        }
-
-        # Choose random key value from positions dict
-        side = random.choice(list(positions.keys()))
-
-        pos_x, pos_y = positions[side]  # calls key value (x, y)
+    def get_spawn_position(self, enemy_image: dict) -> tuple[int, int]:
+        """Returns (x, y) spawn position just outside a random screen edge or corner
 
-        # set Actor pos - syntax: Actor.x, Actor.y
-        if pos_x == "x":  # top or bottom edge
-            temp_actor.x = random.randint(buffer, screen_width - buffer)
-            temp_actor.y = pos_y
-        elif pos_y == "y":  # left or right edge
-            temp_actor.y = random.randint(buffer, screen_height - buffer)
-            temp_actor.x = pos_x
-        else:  # corners
-            temp_actor.x, temp_actor.y = pos_x, pos_y
-        return (temp_actor.x, temp_actor.y)  # returns x, y spawn position
+        Args:
+            enemy_image (dict): ENEMY_ASSETS entry with "image" and "path" keys
+        Returns:
+            tuple[int, int]: (x, y) spawn position
+        """
+        return self.get_spawn_ring(enemy_image).position(self.rng)
 
     def update_spawn(
         self,
@@ -614,40 +769,130 @@ class GameState:
         self.spawn_timer += dt  # spawn timer increases every frame by dt value
 
         if self.spawn_timer > self.spawn_interval:
-            new_speed = self.get_spawn_speed()
-            spawn_pos = self.get_spawn_position(enemy_name, enemy_asset)
+            self.spawn_enemy(enemy_class, enemy_name, enemy_asset)
+            self.spawn_timer = 0  # reset spawn timer after new enemy spawns
+
+    def spawn_enemy(self, enemy_class: object, enemy_name: str, enemy_asset: str):
+        """Spawns one enemy at a random spawn position with a random speed
+        based on the current difficulty.
 
-            # Enemy object created
-            enemy = enemy_class(
-                image=self.get_enemy_image(enemy_name, enemy_asset)["image"],
-                image_path=self.get_enemy_image(enemy_name, enemy_asset)["path"],
+        Args:
+            enemy_class(object): object created from Enemy class which defines what the enemy is
+            enemy_name (str): The enemy name (key) from ENEMY_ASSETS registry dictionary (e.g. "ant")
+            enemy_asset (str):  The enemy asset key from ENEMY_ASSETS registry dictionary (e.g. "color")
+        Returns:
+            object: the spawned Enemy (SwarmEnemy view in swarm mode)
+        """
+        new_speed = self.get_spawn_speed()
+        # one lookup so image and path always belong to the same color
+        enemy_image = self.get_enemy_image(enemy_name, enemy_asset)
+        spawn_pos = self.get_spawn_position(enemy_image)
+
+        if self.swarm is not None:
+            # swarm row + view created, view is appended to the shared enemies list
+            enemy = self.swarm.spawn(
+                image=enemy_image["image"],
+                image_path=enemy_image["path"],
                 pos=spawn_pos,
                 speed=new_speed,
             )
-            # New Enemy obj created and appended to enemies list
-            self.enemies.append(enemy)
-            self.spawn_timer = 0  # reset spawn timer after new enemy spawns
+        else:
+            # Enemy object reused from the pool (or created) and added to the live enemies
+            enemy = self.enemies.acquire(
+                enemy_class,
+                image=enemy_image["image"],
+                image_path=enemy_image["path"],
+                pos=spawn_pos,
+                speed=new_speed,
+            )
+        self.impacts.add(enemy)  # contact time computed on the next collision check
+        return enemy
+
+    def spawn_batch(
+        self,
+        count: int,
+        enemy_class: object,
+        enemy_name: str = "ant",
+        enemy_asset: str = "color",
+    ) -> list:
+        """Spawns count enemies at once (waves/bursts). Colors, positions and speeds
+        are drawn as NumPy arrays from a generator seeded by self.rng, so seeded runs
+        stay reproducible, then the enemies are added per image.
+
+        Args:
+            count (int): number of enemies to spawn
+            enemy_class(object): object created from Enemy class which defines what the enemy is
+            enemy_name (str): The enemy name (key) from ENEMY_ASSETS registry dictionary (e.g. "ant")
+            enemy_asset (str):  The enemy asset key from ENEMY_ASSETS registry dictionary (e.g. "color")
+        Returns:
+            list: the spawned Enemy objects (SwarmEnemy views in swarm mode)
+        """
+        if count <= 0:
+            return []
+        np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
+        # same color rule as get_enemy_image(): stage color, random past the last stage
+        colors = self.enemy_ant_colors
+        if self.stage_color == RANDOM_STAGE_COLOR:
+            color_ids = np_rng.integers(0, len(colors), count)
+        else:
+            color_ids = np.full(count, self.stage_color)
+        speeds = np_rng.uniform(self.speed_min, self.speed_max, count)
+
+        spawned = []
+        for color_id in np.unique(color_ids):
+            rows = np.flatnonzero(color_ids == color_id)
+            enemy_image = ENEMY_ASSETS[enemy_name][enemy_asset][colors[color_id]]
+            xs, ys = self.get_spawn_ring(enemy_image).positions(np_rng, len(rows))
+            xs, ys, group_speeds = xs.tolist(), ys.tolist(), speeds[rows].tolist()
+
+            if self.swarm is not None:
+                spawned += self.swarm.spawn_batch(
+                    enemy_image["image"], enemy_image["path"], xs, ys, group_speeds
+                )
+                continue
+            acquire = self.enemies.acquire
+            for x, y, speed in zip(xs, ys, group_speeds):
+                spawned.append(
+                    acquire(
+                        enemy_class,
+                        image=enemy_image["image"],
+                        image_path=enemy_image["path"],
+                        pos=(x, y),
+                        speed=speed,
+                    )
+                )
+        for enemy in spawned:
+            self.impacts.add(enemy)
+        return spawned
 
     def check_enemy_player_collisions(
         self, input_button, expected_button, player: object
-    ):
+    ) -> int:
         """Checks if enemy is killed, if so add a point to current score.
 
         Args:
             input_button (enum): A mouse enum value indicating the button that was pressed.
             expected_button (enum): A mouse enum value of the button you expect to be pressed
             player (object): An instance of Player class that contains the player's image
+
+        Returns:
+            int: enemies newly marked dead by this click
         """
 
-        for enemy in self.enemies:
-            if input_button == expected_button and player.rect.colliderect(
-                enemy.mask_rect
-            ):  # player clicked on enemy?
-                # TODO (sound feature): Create a method in Enemy class that tells what the enemy sounds like
-                # then call it hear to tell when the sound should play
-                ## uncomment sound for now until a method to retrieve .wav sound files is created
-                # sounds.squish.play()  # plays a sound when enemy clicked
-                enemy.is_dead = True
+        if input_button != expected_button:
+            return 0
+
+        # only enemies registered in the grid cells under the player rect are tested
+        kills = 0
+        for enemy in self.grid.query_rect(player.rect):  # player clicked on enemy?
+            # TODO (sound feature): Create a method in Enemy class that tells what the enemy sounds like
+            # then call it hear to tell when the sound should play
+            ## uncomment sound for now until a method to retrieve .wav sound files is created
+            # sounds.squish.play()  # plays a sound when enemy clicked
+            kills += not enemy.is_dead
+            enemy.is_dead = True
+        return kills
 
     def update_enemies(self, target: object, dt: float):
         """Moves enemy toward target, removes enemies when they are killed and adds to the score
@@ -657,15 +902,35 @@ class GameState:
             dt (float): delta time is time since last frame. Given automatically by Pygame Zero
         """
         self.target = target
-        for enemy in self.enemies[:]:  # [:] freezes dynamic list to modify safely
+
+        if self.swarm is not None:
+            self.swarm.step(self.target, dt)  # moves every enemy at once
+            killed = self.swarm.compact()  # removes dead enemies in bulk (+ from grid)
+            for enemy in killed:
+                self.impacts.discard(enemy)
+            if killed:
+                self.score += len(killed)
+                self.update_difficulty()
+                self.update_highscore()
+            return
+
+        # walk backwards: release() swaps the last enemy into the freed slot,
+        # and that enemy has already been processed this frame
+        for i in range(len(self.enemies) - 1, -1, -1):
+            enemy = self.enemies[i]
             enemy.movement(self.target, dt)  # "Move toward target!"
             if enemy.is_dead:
-                self.enemies.remove(enemy)
+                self.enemies.release(enemy)  # O(1) swap-remove, kept for reuse
+                self.grid.remove(enemy)
+                self.impacts.discard(enemy)
                 self.score += 1
 
                 ### --- only call when score increases --- ###
                 self.update_difficulty()  # checks if difficulty needs to be updated
                 self.update_highscore()  # checks if highscore needs to be updated locally
+            else:
+                # only re-files it in the grid when it changed cells
+                self.grid.move(enemy, enemy.mask_rect)
 
     def check_enemy_target_collision(self, target: object, dt: float):
         """Returns True if game over triggered by a collision + saves game.
@@ -678,22 +943,17 @@ class GameState:
             bool: True if there is a collison and False if there isn't
         """
         self.target = target
-        for enemy in self.enemies:  # iterate through game.enemies Enemy obj list
-            # --- PIXEL-PERFECT COLLISIOIN DETECTION ---#
-            dx = int(
-                enemy.mask_rect.left - self.target.mask_rect.left
-            )  # left offset pos
-            dy = int(enemy.mask_rect.top - self.target.mask_rect.top)  # top offset pos
-            # checks if target and enemy mask collide/overlap -> returns True if it does
-            game_over = self.target.mask.overlap(enemy.mask, (dx, dy))
-
-            if game_over:  # enemy and target collide?
-                self.change_state("GAMEOVER")  # state = GAMEOVER + reset state_timer
-                # ONLY saves game if GAMEOVER and game not saved yet
-                if not self.game_saved:  # default False
-                    self.save_game()  # changes game_saved to true after saved
-                return True  # game is over
-        return False  # False all enemies in loop -> no collision
+
+        # only enemies whose precomputed contact time came up get the rect + mask test
+        hit = self.impacts.find_hit(self.target, dt)
+
+        if hit is not None:  # enemy and target collide?
+            self.change_state("GAMEOVER")  # state = GAMEOVER + reset state_timer
+            # ONLY saves game if GAMEOVER and game not saved yet
+            if not self.game_saved:  # default False
+                self.save_game()  # changes game_saved to true after saved
+            return True  # game is over
+        return False  # False all enemies -> no collision
 
     ## --- # NOTE: SOUND SYSTEM / AUDIO --- ##
 
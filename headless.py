@@ -0,0 +1,381 @@
+"""Headless, fast-forward simulation of the game logic (no window, no frame cap).
+
+Usage:
+    python headless.py --minutes 60 --seed 1 --bot-interval 0.4
+    python headless.py --minutes 10 --swarm --script inputs.json
+    python headless.py --minutes 30 --difficulty difficulty/default.json
+    python headless.py --minutes 20 --difficulty difficulty/many_stages.json  # more stages than colors
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+# must be set before pygame opens a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pgzero.game
+from pgzero import loaders
+from pgzero.constants import mouse
+from pgzero.keyboard import keys
+from pgzero.screen import Screen
+
+from difficulty import DifficultyProfile
+from entities import ASSETS, Enemy, Player, Target
+from game_state import GameState, SCREEN_HEIGHT, SCREEN_WIDTH
+
+# NOTE: HEADLESS module focus on running GameState as fast as possible without a window
+# Global constants
+HEADLESS_DT = 1 / 60  # fixed simulated seconds per frame
+BOT_MISS_OFFSET = 120  # px a missed bot click lands away from its aim (> player hitbox)
+MAIN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+
+def init_headless():
+    """Sets up what pgzrun normally provides, using the SDL dummy video driver:
+    a display Surface, the pgzero image loader root and the preloaded assets.
+
+    Returns:
+        Screen: pgzero Screen obj wrapping the (invisible) display Surface
+    """
+    pygame.init()
+    surface = pygame.display.get_surface()
+    if surface is None:
+        surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    loaders.set_root(MAIN_PATH)  # images/, fonts/, sounds/ next to main.py
+    pgzero.game.screen = surface  # Actor.draw() blits onto this
+    ASSETS.preload()
+    return Screen(surface)
+
+
+class ScriptedInput:
+    """Input source that replays a fixed list of events by frame number."""
+
+    def __init__(self, events: list):
+        """Stores the events sorted by frame.
+
+        Args:
+            events (list): dicts like {"frame": 120, "type": "click", "pos": [960, 540]}
+                or {"frame": 300, "type": "key", "key": "space"}
+        """
+        self.events = sorted(events, key=lambda event: event["frame"])
+        self.index = 0
+
+    @classmethod
+    def from_file(cls, path: str):
+        """Loads the event list from a JSON file.
+
+        Args:
+            path (str): path of a JSON file holding a list of events
+        """
+        with open(path, "r", encoding="utf-8") as script_file:
+            return cls(json.load(script_file))
+
+    def poll(self, runner: object) -> list:
+        """Returns the (type, value) events scheduled for the current frame.
+
+        Args:
+            runner (object): HeadlessRunner being driven
+        """
+        due = []
+        while (
+            self.index < len(self.events)
+            and self.events[self.index]["frame"] <= runner.frames
+        ):
+            event = self.events[self.index]
+            if event["type"] == "click":
+                due.append(("click", tuple(event["pos"])))
+            else:
+                due.append(("key", event["key"]))
+            self.index += 1
+        return due
+
+
+class AutoClicker:
+    """Input source bot: every interval seconds it clicks the enemy closest to the target."""
+
+    def __init__(self, interval: float = 0.5):
+        """
+        Args:
+            interval (float): simulated seconds between clicks
+        """
+        self.interval = interval
+        self.next_click = interval
+
+    def poll(self, runner: object) -> list:
+        """Returns one click on the on-screen enemy closest to the target when a click is due.
+
+        Args:
+            runner (object): HeadlessRunner being driven
+        """
+        if runner.sim_time < self.next_click:
+            return []
+        self.next_click = runner.sim_time + self.interval
+
+        target = runner.target
+        enemies = [
+            enemy
+            for enemy in runner.game.enemies
+            if enemy.mask_rect
+            and 0 <= enemy.x < SCREEN_WIDTH
+            and 0 <= enemy.y < SCREEN_HEIGHT
+        ]
+        if not enemies:
+            return []
+        closest = min(enemies, key=lambda enemy: enemy.distance_to(target))
+        return [("click", (int(closest.x), int(closest.y)))]
+
+
+class ReactionBot:
+    """Input source bot playing like a person: it picks the on-screen enemy
+    closest to the target, needs reaction_time seconds to click it (the enemy
+    keeps moving meanwhile) and lands the click with probability accuracy.
+    Misses land BOT_MISS_OFFSET px away in a random direction.
+    """
+
+    def __init__(
+        self,
+        reaction_time: float = 0.35,
+        accuracy: float = 0.9,
+        seed: int = 0,
+        miss_offset: float = BOT_MISS_OFFSET,
+    ):
+        """
+        Args:
+            reaction_time (float): simulated secs from picking an enemy to clicking it
+            accuracy (float): 0.0-1.0 chance a click lands on the aimed enemy
+            seed (int): seed of the bot's own RNG (the game RNG is never touched)
+            miss_offset (float): px b/w the aimed enemy and a missed click
+
+        Attributes:
+            self.aimed (obj | None): enemy the bot is reacting to. None = looking for one
+            self.click_time (float): sim_time the click on self.aimed happens
+            self.clicks (int): clicks sent so far
+            self.misses (int): clicks that were aimed off target
+        """
+        self.reaction_time = reaction_time
+        self.accuracy = accuracy
+        self.miss_offset = miss_offset
+        self.rng = random.Random(seed)
+        self.aimed = None
+        self.aimed_run = 0
+        self.click_time = 0.0
+        self.clicks = 0
+        self.misses = 0
+
+    def poll(self, runner: object) -> list:
+        """Returns one click when the reaction time to the aimed enemy is over.
+
+        Args:
+            runner (object): HeadlessRunner being driven
+        """
+        if self.aimed is None:
+            enemies = [
+                enemy
+                for enemy in runner.game.enemies
+                if enemy.mask_rect
+                and not enemy.is_dead
+                and 0 <= enemy.x < SCREEN_WIDTH
+                and 0 <= enemy.y < SCREEN_HEIGHT
+            ]
+            if enemies:
+                target = runner.target
+                self.aimed = min(enemies, key=lambda enemy: enemy.distance_to(target))
+                self.aimed_run = runner.game_overs  # a restart recycles every enemy
+                self.click_time = runner.sim_time + self.reaction_time
+            return []
+        if runner.sim_time < self.click_time:
+            return []
+
+        enemy, self.aimed = self.aimed, None
+        if enemy.is_dead or self.aimed_run != runner.game_overs:
+            return []  # gone before the click, pick another one next frame
+        x, y = enemy.x, enemy.y
+        self.clicks += 1
+        if self.rng.random() >= self.accuracy:
+            self.misses += 1
+            angle = self.rng.uniform(0, 2 * math.pi)
+            x += math.cos(angle) * self.miss_offset
+            y += math.sin(angle) * self.miss_offset
+        return [("click", (int(x), int(y)))]
+
+
+class HeadlessRunner:
+    """Drives GameState frame by frame with a fixed dt and scripted input.
+    The game restarts automatically after every game over, so one run can cover
+    thousands of game-minutes.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        dt: float = HEADLESS_DT,
+        use_swarm: bool = False,
+        input_source: object = None,
+        difficulty: object = None,
+    ):
+        """Creates the game objects without a window.
+
+        Args:
+            seed (int): seed for the game RNG
+            dt (float): simulated seconds per frame
+            use_swarm (bool): True uses the NumPy swarm backend
+            input_source (object): obj with poll(runner) -> [(type, value)]. None = no input
+            difficulty (object): DifficultyProfile to play with. None = difficulty/default.json
+
+        Attributes:
+            self.frames (int): simulated frames so far
+            self.sim_time (float): simulated seconds so far
+            self.game_overs (int): number of finished runs
+            self.kills (int): enemies killed over every run
+            self.best_score (int): best score of any run
+            self.peak_enemies (int): most enemies alive at once
+        """
+        self.screen = init_headless()
+        self.dt = dt
+        self.input_source = input_source
+        self.game = GameState(
+            use_swarm=use_swarm, seed=seed, save_path=None, difficulty=difficulty
+        )
+        self.target = Target(
+            image="cake1",
+            image_path="images/cake1.png",
+            screen_width=SCREEN_WIDTH,
+            screen_height=SCREEN_HEIGHT,
+        )
+        self.player = Player(image_path="images/cat_angry.png")
+        self.frames = 0
+        self.sim_time = 0.0
+        self.game_overs = 0
+        self.kills = 0
+        self.best_score = 0
+        self.peak_enemies = 0
+        self.game.change_state("PLAY")  # skip the menu
+
+    def dispatch(self, event_type: str, value):
+        """Sends one input event to the game, like main.on_mouse_down/on_key_down.
+
+        Args:
+            event_type (str): "click" or "key"
+            value: (x, y) click position or key name (e.g. "space")
+        """
+        if event_type == "click":
+            self.game.handle_click(
+                pos=value,
+                input_button=mouse.LEFT,
+                expected_button=mouse.LEFT,
+                player=self.player,
+            )
+        elif event_type == "key":
+            self.game.handle_key(key=keys[value.upper()], expected_button=keys.SPACE)
+
+    def step(self) -> bool:
+        """Simulates one frame. Restarts the game after a game over.
+
+        Returns:
+            bool: True if the game ended this frame
+        """
+        if self.input_source is not None:
+            for event_type, value in self.input_source.poll(self):
+                self.dispatch(event_type, value)
+
+        game_over = self.game.update(dt=self.dt, target=self.target, enemy_class=Enemy)
+        self.frames += 1
+        self.sim_time += self.dt
+        self.peak_enemies = max(self.peak_enemies, len(self.game.enemies))
+
+        if game_over:
+            self.game_overs += 1
+            self.kills += self.game.score
+            self.best_score = max(self.best_score, self.game.score)
+            self.game.reset()  # same as clicking Retry
+        return game_over
+
+    def run(self, frames: int) -> dict:
+        """Simulates frames as fast as possible and reports the speed.
+
+        Args:
+            frames (int): number of frames to simulate
+
+        Returns:
+            dict: frame counts, simulated vs wall-clock time and game results
+        """
+        start = time.perf_counter()
+        for _ in range(frames):
+            self.step()
+        wall_seconds = time.perf_counter() - start
+        return self.report(wall_seconds)
+
+    def report(self, wall_seconds: float) -> dict:
+        """Returns the run counters as a dict.
+
+        Args:
+            wall_seconds (float): real time spent simulating
+        """
+        return {
+            "frames": self.frames,
+            "simulated_seconds": round(self.sim_time, 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "frames_per_second": (
+                round(self.frames / wall_seconds, 1) if wall_seconds else None
+            ),
+            "realtime_factor": (
+                round(self.sim_time / wall_seconds, 1) if wall_seconds else None
+            ),
+            "game_overs": self.game_overs,
+            "kills": self.kills + self.game.score,
+            "best_score": max(self.best_score, self.game.score),
+            "peak_enemies": self.peak_enemies,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game logic headless.")
+    parser.add_argument(
+        "--minutes", type=float, default=10, help="game-minutes to simulate"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="game RNG seed")
+    parser.add_argument(
+        "--dt", type=float, default=HEADLESS_DT, help="seconds per frame"
+    )
+    parser.add_argument(
+        "--swarm", action="store_true", help="use the NumPy swarm backend"
+    )
+    parser.add_argument("--script", help="JSON file of scripted input events")
+    parser.add_argument("--difficulty", help="difficulty profile JSON file")
+    parser.add_argument(
+        "--bot-interval",
+        type=float,
+        default=0.5,
+        help="seconds between bot clicks when no --script is given (0 = no input)",
+    )
+    args = parser.parse_args()
+
+    if args.script:
+        input_source = ScriptedInput.from_file(args.script)
+    elif args.bot_interval > 0:
+        input_source = AutoClicker(interval=args.bot_interval)
+    else:
+        input_source = None
+
+    difficulty = (
+        DifficultyProfile.from_file(args.difficulty) if args.difficulty else None
+    )
+    runner = HeadlessRunner(
+        seed=args.seed,
+        dt=args.dt,
+        use_swarm=args.swarm,
+        input_source=input_source,
+        difficulty=difficulty,
+    )
+    frames = round(args.minutes * 60 / args.dt)
+    print(json.dumps(runner.run(frames), indent=4))
+
+
+if __name__ == "__main__":
+    main()
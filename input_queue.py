@@ -0,0 +1,215 @@
+import json
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from profiler import PERCENTILES, PROFILE_DUMP_DIR, RingBuffer
+
+# NOTE: INPUT QUEUE module focus on WHEN input reaches the simulation + HOW LONG until a kill is on screen
+# Global constants
+# histogram bucket upper edges (ms), one more open bucket past the last edge
+LATENCY_BUCKETS_MS = (1, 2, 4, 8, 12, 17, 25, 33, 50, 67, 100, 150, 250)
+LATENCY_BUFFER_SIZE = 600  # latest kills kept per stage for the percentiles
+# event -> hit test -> removal -> presented frame, "total" = event -> presented frame
+LATENCY_STAGES = ("queue", "removal", "present", "total")
+
+
+class InputEvent:
+    """One mouse click or key press plus the perf_counter() times it went through."""
+
+    __slots__ = ("kind", "pos", "button", "key", "time", "hit_time", "removed_time")
+
+    def __init__(self, kind: str, pos=None, button=None, key=None, timestamp=None):
+        """Stamps the event.
+
+        Args:
+            kind (str): "click" or "key"
+            pos (tuple[int, int]): (x, y) click position
+            button (enum): mouse enum value of the clicked button
+            key (enum): keys enum value of the pressed key
+            timestamp (float | None): perf_counter() secs the event happened. None = now
+
+        Attributes:
+            self.time (float): perf_counter() secs the event reached the game
+            self.hit_time (float | None): secs the simulation hit-tested it
+            self.removed_time (float | None): secs the step removing its kills ended
+        """
+        self.kind = kind
+        self.pos = pos
+        self.button = button
+        self.key = key
+        self.time = time.perf_counter() if timestamp is None else timestamp
+        self.hit_time = None
+        self.removed_time = None
+
+
+class InputQueue:
+    """FIFO of timestamped input events. pgzero's on_mouse_down/on_key_down only
+    push; the simulation drains the queue at the start of every fixed step, so
+    input is always applied at the same point (before spawn + movement) against
+    the enemy positions of the previous step, whatever the frame pacing.
+    """
+
+    def __init__(self):
+        """Creates an empty queue.
+
+        Attributes:
+            self.events (deque): events not consumed yet, oldest first
+            self.pushed (int): events pushed so far
+        """
+        self.events = deque()
+        self.pushed = 0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def push_click(self, pos: tuple[int, int], button, timestamp=None) -> InputEvent:
+        """Queues a mouse click.
+
+        Args:
+            pos (tuple[int, int]): (x, y) click position
+            button (enum): mouse enum value of the clicked button
+            timestamp (float | None): perf_counter() secs of the click. None = now
+        """
+        return self.push(
+            InputEvent("click", pos=pos, button=button, timestamp=timestamp)
+        )
+
+    def push_key(self, key, timestamp=None) -> InputEvent:
+        """Queues a key press.
+
+        Args:
+            key (enum): keys enum value of the pressed key
+            timestamp (float | None): perf_counter() secs of the key press. None = now
+        """
+        return self.push(InputEvent("key", key=key, timestamp=timestamp))
+
+    def push(self, event: InputEvent) -> InputEvent:
+        self.events.append(event)
+        self.pushed += 1
+        return event
+
+    def drain(self) -> list:
+        """Returns every queued event, oldest first, and empties the queue."""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+
+class LatencyTracker:
+    """Input-to-kill latency of every click that killed something, split in stages:
+    queue (event -> hit test), removal (hit test -> end of the step removing
+    the enemy), present (removal -> the flip showing the frame without it) and
+    total (event -> flip). Each stage keeps a fixed-bucket histogram since start
+    and the latest values for percentiles.
+    """
+
+    def __init__(self, size: int = LATENCY_BUFFER_SIZE):
+        """Creates empty histograms.
+
+        Args:
+            size (int): latest kills kept per stage for the percentiles
+
+        Attributes:
+            self.histograms (dict): stage -> np.ndarray count per LATENCY_BUCKETS_MS bucket (+ overflow)
+            self.recent (dict): stage -> RingBuffer of the latest ms values
+            self.hit (list): events hit-tested with kills, waiting for their removal
+            self.removed (list): events whose kills are removed, waiting for a presented frame
+            self.kills (int): kills measured so far
+        """
+        self.histograms = {
+            stage: np.zeros(len(LATENCY_BUCKETS_MS) + 1, dtype=np.int64)
+            for stage in LATENCY_STAGES
+        }
+        self.recent = {stage: RingBuffer(size) for stage in LATENCY_STAGES}
+        self.hit = []
+        self.removed = []
+        self.kills = 0
+        self.display_flip = None
+
+    def install(self):
+        """Wraps pygame.display.flip (called by pgzero after every draw()) so the
+        time each frame is presented is known."""
+        if self.display_flip is None:
+            self.display_flip = pygame.display.flip
+            pygame.display.flip = self.flip
+
+    def flip(self):
+        self.display_flip()
+        self.presented()
+
+    def hit_tested(self, event: InputEvent, kills: int):
+        """Stamps a click the simulation just hit-tested (call right after handle_click).
+
+        Args:
+            event (obj): the consumed InputEvent
+            kills (int): enemies the click killed. Clicks without kills are not tracked
+        """
+        if kills:
+            event.hit_time = time.perf_counter()
+            self.hit.append(event)
+            self.kills += kills
+
+    def step_done(self):
+        """Stamps the removal of every hit-tested kill (call after the step's update)."""
+        if self.hit:
+            now = time.perf_counter()
+            for event in self.hit:
+                event.removed_time = now
+            self.removed += self.hit
+            self.hit = []
+
+    def presented(self):
+        """Records every stage of the kills shown by the frame just presented."""
+        if not self.removed:
+            return
+        now = time.perf_counter()
+        for event in self.removed:
+            self.record("queue", event.hit_time - event.time)
+            self.record("removal", event.removed_time - event.hit_time)
+            self.record("present", now - event.removed_time)
+            self.record("total", now - event.time)
+        self.removed = []
+
+    def record(self, stage: str, seconds: float):
+        ms = seconds * 1000
+        self.histograms[stage][np.searchsorted(LATENCY_BUCKETS_MS, ms)] += 1
+        self.recent[stage].append(ms)
+
+    def summary(self) -> dict:
+        """Returns {stage: {"count", "p50", "p95", "p99", "histogram"}} in ms."""
+        result = {}
+        for stage in LATENCY_STAGES:
+            values = self.recent[stage].values()
+            percentiles = np.percentile(values, PERCENTILES) if len(values) else ()
+            labels = [f"<={edge}" for edge in LATENCY_BUCKETS_MS]
+            labels.append(f">{LATENCY_BUCKETS_MS[-1]}")
+            result[stage] = {
+                "count": int(self.histograms[stage].sum()),
+                **{
+                    f"p{p}": round(float(v), 3)
+                    for p, v in zip(PERCENTILES, percentiles)
+                },
+                "histogram": dict(zip(labels, self.histograms[stage].tolist())),
+            }
+        return result
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Writes summary() to a JSON file.
+
+        Args:
+            path (Path | None): output file. None writes profiles/latency_<time>.json
+
+        Returns:
+            Path: the written file
+        """
+        if path is None:
+            path = PROFILE_DUMP_DIR / time.strftime("latency_%Y%m%d_%H%M%S.json")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump({"kills": self.kills, **self.summary()}, json_file, indent=4)
+        return path
@@ -0,0 +1,73 @@
+import pygame
+from pgzero.screen import Screen
+
+# NOTE: LAYERS module focus on drawing the static part of a screen once instead of every frame
+
+
+class StaticLayer:
+    """One baked full-screen Surface plus the dependency values it was baked with."""
+
+    __slots__ = ("surface", "deps")
+
+    def __init__(self, surface: object, deps: tuple):
+        self.surface = surface
+        self.deps = deps
+
+
+class LayerCompositor:
+    """Bakes the static parts of a screen (background, labels, decorations) into
+    one cached Surface. A layer is re-baked automatically when the dependency
+    values passed to get() differ from the ones it was baked with
+    (e.g. the highscore shown on the menu).
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        """Creates an empty compositor.
+
+        Args:
+            size (tuple[int, int]): (width, height) of every layer, normally the screen size
+
+        Attributes:
+            self.layers (dict): layer name -> StaticLayer
+            self.bakes (int): number of times a layer was (re-)baked
+        """
+        self.size = size
+        self.layers = {}
+        self.bakes = 0
+
+    def get(self, name: str, deps: tuple, bake) -> object:
+        """Returns the baked Surface of layer name, baking it first when missing
+        or when deps changed since the last bake.
+
+        Args:
+            name (str): layer name (e.g. "MENU")
+            deps (tuple): hashable values the static content depends on
+            bake (callable): bake(screen) draws the static content onto a pgzero Screen obj
+
+        Returns:
+            Surface: opaque Surface holding the static content
+        """
+        layer = self.layers.get(name)
+        if layer is not None and layer.deps == deps:
+            return layer.surface
+
+        if layer is None:
+            surface = pygame.Surface(self.size).convert()  # opaque = fastest blit
+        else:
+            surface = layer.surface  # re-use the Surface, everything is redrawn
+        surface.fill((0, 0, 0))
+        bake(Screen(surface))
+        self.layers[name] = StaticLayer(surface, deps)
+        self.bakes += 1
+        return surface
+
+    def invalidate(self, name: str | None = None):
+        """Drops one layer (or every layer when name is None) so it is re-baked on next use.
+
+        Args:
+            name (str | None): layer name. None drops every layer
+        """
+        if name is None:
+            self.layers.clear()
+        else:
+            self.layers.pop(name, None)
@@ -1,9 +1,19 @@
+from startup import STARTUP  # first import: start of the startup timeline
+
+import atexit
+import random
+
 import pgzrun
 from typing import TYPE_CHECKING, Any
 
-from game_state import GameState, SCREEN_HEIGHT, SCREEN_WIDTH
-from entities import Enemy, Player, Target
-
+from game_state import GameState, MENU_IMAGES, SCREEN_HEIGHT, SCREEN_WIDTH
+from dirty_rect import DirtyRectRenderer
+from entities import ASSETS, Enemy, Player, Target
+from input_queue import InputQueue, LatencyTracker
+from profiler import PROFILER
+from replay import ReplayRecorder
+from text_cache import FONTS
+from timestep import FixedStepper
 
 # Avoid Pylance 'not defined' warnings for Pygame Zero objects
 if TYPE_CHECKING:
@@ -12,6 +22,7 @@ if TYPE_CHECKING:
     keyboard: Any
     mouse: Any
     images: Any
+    keys: Any
     sounds: Any
     music: Any
     clock: Any
@@ -23,41 +34,118 @@ if TYPE_CHECKING:
         pass
 
 
+# True moves enemies with the NumPy swarm backend (stress runs with 10k+ enemies)
+USE_SWARM = False
+# True redraws + pushes only the changed regions during PLAY (low-end kiosk machines)
+USE_DIRTY_RECTS = False
+# True draws the enemy layer with one Surface.blits call, False one blit per Actor (F5 toggles)
+USE_SPRITE_BATCH = True
+# True records the session inputs to replays/ on exit (python replay.py <file> plays it back)
+RECORD_REPLAY = False
+
 # Screen resolution
 WIDTH = SCREEN_WIDTH  # constant variable for horizontal size
 HEIGHT = SCREEN_HEIGHT  # constant variable for vertical size
 
+STARTUP.mark("imports")
+
+# Only the menu's own images load before the first frame. Every other registered
+# image (gameplay sprites, PLAY/GAMEOVER screens) is decoded on a background
+# thread while the menu is shown, see update()
+with STARTUP.phase("images"):
+    ASSETS.preload(MENU_IMAGES)
+
 # Instances of classes
-game = GameState()
-target = Target(
-    image="cake1",
-    image_path="images/cake1.png",
-    screen_width=WIDTH,
-    screen_height=HEIGHT,
-)
-player = Player(image_path="images/cat_angry.png")
+with STARTUP.phase("game_init"):
+    seed = random.getrandbits(63)  # explicit so a recording can re-seed GameState
+    game = GameState(use_swarm=USE_SWARM, seed=seed)
+    game.sprite_batch.enabled = USE_SPRITE_BATCH
+    target = Target(
+        image="cake1",
+        image_path="images/cake1.png",
+        screen_width=WIDTH,
+        screen_height=HEIGHT,
+    )
+    player = Player(image_path="images/cat_angry.png")
+ASSETS.preload_async()  # everything not loaded yet
+stepper = FixedStepper()  # game logic runs in fixed SIM_STEP steps
+dirty_renderer = DirtyRectRenderer((WIDTH, HEIGHT))
+if USE_DIRTY_RECTS:
+    dirty_renderer.install()  # pgzero's flip() now honours partial frames
+inputs = InputQueue()  # clicks + key presses, consumed at the start of each step
+latency = LatencyTracker()
+latency.install()  # stamps every presented frame (wraps the dirty rect flip too)
+recorder = None
+if RECORD_REPLAY:
+    recorder = ReplayRecorder(
+        seed=seed, use_swarm=USE_SWARM, difficulty=game.difficulty
+    )
+    # runs on window close and on the Quit button (sys.exit)
+    atexit.register(lambda: recorder.save(score=game.score, steps=stepper.steps))
 
 
 def update(dt):
     """update() loop called automatically by Pygame Zero 60x/sec.
     It handles game logic: spawn rate, movement, collisions, spawn speed.
+    The logic always runs in fixed SIM_STEP steps (at most MAX_SUBSTEPS per frame),
+    so a frame hitch cannot make enemies jump past the target or the stop check.
 
     Args:
         dt (float): delta time is time since last frame. Given automatically by Pygame Zero
     """
+    if recorder is not None:
+        recorder.frame(dt)
+    if ASSETS.loading:
+        update_loading()
+    stepper.advance(dt, simulate_step)
+    game.render_alpha = stepper.alpha  # draw() blends enemies b/w the last two steps
 
-    game.check_resume(dt)  # is resuming? if True countdown til PLAY state
 
-    # increment the state timer every frame. only resets during screen transition
-    game.state_timer += dt
-    # Enemy spawn when game state is "PLAY"
-    if game.state == "PLAY":
-        game.update_spawn(
-            dt=dt, enemy_class=Enemy, enemy_name="ant", enemy_asset="color"
-        )  # spawns enemy
-        game.update_enemies(target=target, dt=dt)  # moves enemies
-        if game.check_enemy_target_collision(target, dt):  # is game over?
-            return  # exits out of update() loop
+def update_loading():
+    """Finishes the background image loading: a few converts per MENU frame,
+    everything at once if the game left the menu first. Prints the startup report when done.
+    """
+    if game.state == "MENU":
+        if not ASSETS.pump():
+            return
+    else:
+        ASSETS.wait()
+    STARTUP.mark("assets_ready")
+    STARTUP.finish(
+        fonts=FONTS.load_seconds * 1000,
+        image_convert=ASSETS.load_seconds * 1000,
+        background_decode=ASSETS.background_seconds * 1000,
+    )
+
+
+def simulate_step(step_dt):
+    """One fixed step of game logic (called by the FixedStepper).
+    Queued input is applied first, so clicks always hit-test the enemies of the
+    previous step and their kills are removed by this step's update.
+
+    Args:
+        step_dt (float): fixed simulated seconds of the step
+    """
+    with PROFILER.phase("input"):
+        for event in inputs.drain():
+            if event.kind == "click":
+                kills = game.handle_click(
+                    pos=event.pos,
+                    input_button=event.button,
+                    expected_button=mouse.LEFT,
+                    player=player,
+                )
+                latency.hit_tested(event, kills)
+            else:
+                game.handle_key(key=event.key, expected_button=keys.SPACE)
+    game.update(
+        dt=step_dt,
+        target=target,
+        enemy_class=Enemy,
+        enemy_name="ant",
+        enemy_asset="color",
+    )
+    latency.step_done()
 
 
 def on_key_down(key):  # key stores key press input
@@ -65,14 +153,27 @@ def on_key_down(key):  # key stores key press input
     When space pressed on PAUSE state, it resumes the game and sets countdown.
     When space pressed on PLAY state, it pauses the game.
 
+    F3 toggles the profiler overlay, F4 dumps the profiler buffers + input latency to profiles/,
+    F5 switches the enemy layer b/w batched and per-Actor drawing (compare enemy_draw_calls).
+
     Args:
         key (enum): reads key press inputs
     """
-    if game.state == "PAUSE" and game.is_resuming:  # is game resuming?
-        return  # True then exits out of function to prevent pressing again during countdown
+    if key == key.F3:
+        PROFILER.toggle_overlay()
+        return
+    if key == key.F4:
+        json_path = PROFILER.dump()
+        PROFILER.dump(json_path.with_suffix(".csv"))
+        latency.dump()
+        return
+    if key == key.F5:
+        game.sprite_batch.toggle()
+        return
 
-    # check pause: True > state set to PAUSE, False -> game resume
-    game.check_pause(input_button=key, expected_button=key.SPACE)
+    if recorder is not None:
+        recorder.key(key)
+    inputs.push_key(key)  # applied at the start of the next simulation step
 
 
 def on_mouse_down(pos, button):
@@ -87,41 +188,39 @@ def on_mouse_down(pos, button):
         pos (tuple): (x, y) tuple that gives location of mouse pointer when button pressed.
         button (obj): A mouse enum value indicating the button that was pressed.
     """
-
-    # block input during PAUSE state
-    if game.state == "PAUSE":
-        return  # exits out of function
-
-    # only allows mouse clicks if screen has been visible for at least 0.5s
-    if game.state_timer < 0.5:
-        return
-
-    # Finds which button was clicked on MENU/GAMEOVER screen then changes game state
-    game.check_button_interactions(
-        mouse_pos=pos, input_button=button, expected_button=mouse.LEFT
-    )
-
-    # removes enemies when clicked and scales diffculty base on score
-    game.check_enemy_player_collisions(
-        input_button=button,
-        expected_button=mouse.LEFT,
-        player=player,
-    )
+    if recorder is not None:
+        recorder.click(pos, button)
+    inputs.push_click(pos, button)  # applied at the start of the next simulation step
 
 
 def draw():
     """draw() automatically by Pygame Zero when it needs to redraw your game window.
     It handles displaying the target, enemy movement, score,
-    and game state (menu, playing, game over) on screen
+    and game state (menu, playing, game over) on screen.
+    With USE_DIRTY_RECTS, PLAY frames only redraw + push the regions that changed.
     """
-    screen.clear()  # erases old drawings when draw() is called
-
     # sets mouse visibility to True/False base on game state
     game.update_mouse_visibility()
 
+    if USE_DIRTY_RECTS and game.state == "PLAY" and not PROFILER.overlay_visible:
+        with PROFILER.phase("draw_play"):
+            dirty_renderer.draw_play(game, screen=screen, target=target, player=player)
+        PROFILER.end_frame(enemy_count=len(game.enemies))
+        return
+    dirty_renderer.invalidate()  # next dirty PLAY frame starts from a full redraw
+
+    screen.clear()  # erases old drawings when draw() is called
+
     # Use current game.state value to decide what to draw. Default value set to "MENU"
     # calls each GameState draw methods based on current state
-    game.render_map[game.state](screen=screen, target=target, player=player)
+    draw_screen = game.render_map[game.state]
+    with PROFILER.phase(draw_screen.__name__):  # e.g. "draw_play"
+        draw_screen(screen=screen, target=target, player=player)
+
+    if PROFILER.overlay_visible:
+        PROFILER.draw_overlay(screen, enemy_count=len(game.enemies))
+    PROFILER.end_frame(enemy_count=len(game.enemies))  # one profiler frame per draw()
+    STARTUP.mark("first_frame")  # time-to-menu (first call only)
 
 
 # start pygame zero game loop using Python interpreter to run
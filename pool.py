@@ -0,0 +1,85 @@
+# NOTE: POOL module focus on reusing enemy objects instead of creating/destroying them every spawn
+
+
+class EnemyPool:
+    """Container of live enemies with slot reuse.
+    Live enemies sit in a dense list, removal swaps the last enemy into the freed
+    slot (O(1)) and removed enemies wait on a free list until the next spawn
+    re-uses them. Iterating, len() and indexing work like the old enemies list.
+    """
+
+    def __init__(self):
+        """Creates an empty pool.
+
+        Attributes:
+            self.active (list): live enemies. enemy.pool_index is its index in this list
+            self.free (dict): enemy class -> list of released enemies ready for reuse
+            self.created (int): number of enemy objects ever created by the pool
+            self.reused (int): number of spawns served from the free list
+        """
+        self.active = []
+        self.free = {}
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __getitem__(self, index):
+        return self.active[index]
+
+    def acquire(self, enemy_class: object, **spawn_kwargs):
+        """Returns a live enemy, reusing a released one when available.
+
+        Args:
+            enemy_class (object): Enemy class (or subclass) with a respawn() method
+            **spawn_kwargs: image, image_path, pos, speed passed to the constructor/respawn()
+
+        Returns:
+            Enemy: the spawned enemy, already added to the pool
+        """
+        free = self.free.get(enemy_class)
+        if free:
+            enemy = free.pop()
+            enemy.respawn(**spawn_kwargs)
+            self.reused += 1
+        else:
+            enemy = enemy_class(**spawn_kwargs)
+            self.created += 1
+        enemy.pool_index = len(self.active)
+        self.active.append(enemy)
+        return enemy
+
+    def release(self, enemy: object):
+        """Removes a live enemy in O(1) by moving the last enemy into its slot.
+        The enemy goes to the free list for reuse.
+
+        Args:
+            enemy (object): enemy previously returned by acquire()
+        """
+        index = enemy.pool_index
+        last = self.active.pop()
+        if last is not enemy:  # fill the hole with the last enemy
+            self.active[index] = last
+            last.pool_index = index
+        enemy.pool_index = -1
+        self.free.setdefault(type(enemy), []).append(enemy)
+
+    def clear(self):
+        """Releases every live enemy (e.g. on reset). Nothing is thrown away."""
+        for enemy in self.active:
+            enemy.pool_index = -1
+            self.free.setdefault(type(enemy), []).append(enemy)
+        self.active.clear()
+
+    def stats(self) -> dict:
+        """Returns the pool counters as a dict (e.g. for logging or an overlay)."""
+        return {
+            "active": len(self.active),
+            "free": sum(len(free) for free in self.free.values()),
+            "created": self.created,
+            "reused": self.reused,
+        }
@@ -0,0 +1,243 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from text_cache import TextLabel
+
+# NOTE: PROFILER module focus on WHERE the frame time goes (per-phase timings + overlay)
+# Global constants
+PROFILE_BUFFER_SIZE = 600  # frames kept per phase (10 sec at 60 FPS)
+PROFILE_DUMP_DIR = Path("profiles")
+PERCENTILES = (50, 95, 99)
+OVERLAY_REFRESH_FRAMES = 15  # overlay text is rebuilt (and re-rendered) this often
+
+
+class RingBuffer:
+    """Fixed-size float buffer that overwrites its oldest value when full."""
+
+    def __init__(self, size: int):
+        self.data = np.zeros(size, dtype=np.float64)
+        self.index = 0  # next write position
+        self.count = 0  # number of valid values
+
+    def append(self, value: float):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+
+    def values(self) -> np.ndarray:
+        """Returns the stored values, oldest first."""
+        if self.count < len(self.data):
+            return self.data[: self.count].copy()
+        return np.concatenate((self.data[self.index :], self.data[: self.index]))
+
+
+class PhaseTimer:
+    """Reusable context manager that adds its elapsed time to one profiler phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: object, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        pending = self.profiler.pending
+        pending[self.name] = pending.get(self.name, 0.0) + elapsed
+
+
+class FrameProfiler:
+    """Collects per-phase timings (ms) for every frame into ring buffers.
+    Phases are timed with `with PROFILER.phase("spawn"): ...`, per-frame counts
+    (e.g. draw calls) are added with PROFILER.count(), and end_frame()
+    closes the frame (call it once per frame, at the end of draw()).
+    """
+
+    def __init__(self, size: int = PROFILE_BUFFER_SIZE):
+        """Creates an empty profiler.
+
+        Args:
+            size (int): number of frames kept per phase
+
+        Attributes:
+            self.buffers (dict): phase name -> RingBuffer of ms per frame. "frame" = full frame time
+            self.pending (dict): phase name -> seconds measured so far in the current frame
+            self.counters (dict): counter name -> RingBuffer of its value per frame
+            self.pending_counts (dict): counter name -> value counted so far in the current frame
+            self.enemy_counts (obj): RingBuffer of enemy count per frame
+            self.overlay_visible (bool): True draws the overlay
+            self.overlay_label (obj): TextLabel of the overlay, rebuilt every OVERLAY_REFRESH_FRAMES
+        """
+        self.size = size
+        self.buffers = {}
+        self.timers = {}
+        self.pending = {}
+        self.counters = {}
+        self.pending_counts = {}
+        self.enemy_counts = RingBuffer(size)
+        self.frame_start = None
+        self.frames = 0
+        self.overlay_visible = False
+        self.overlay_text = ""
+        self.overlay_frame = None  # frame count the overlay text was built at
+        self.overlay_label = None  # created on the first draw (needs the screen width)
+
+    def phase(self, name: str) -> PhaseTimer:
+        """Returns the context manager timing phase name.
+
+        Args:
+            name (str): phase name (e.g. "spawn", "movement", "draw_play")
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = PhaseTimer(self, name)
+        return timer
+
+    def count(self, name: str, value: int = 1):
+        """Adds value to counter name for the current frame.
+
+        Args:
+            name (str): counter name (e.g. "enemy_draw_calls")
+            value (int): amount to add
+        """
+        self.pending_counts[name] = self.pending_counts.get(name, 0) + value
+
+    def end_frame(self, enemy_count: int = 0):
+        """Stores the current frame's phase timings and starts a new frame.
+
+        Args:
+            enemy_count (int): enemies alive this frame
+        """
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.pending["frame"] = now - self.frame_start
+        self.frame_start = now
+
+        # every known phase gets a value each frame (0 when it did not run)
+        for name in self.pending.keys() - self.buffers.keys():
+            self.buffers[name] = RingBuffer(self.size)
+        for name, buffer in self.buffers.items():
+            buffer.append(self.pending.get(name, 0.0) * 1000)
+        self.pending.clear()
+        for name in self.pending_counts.keys() - self.counters.keys():
+            self.counters[name] = RingBuffer(self.size)
+        for name, buffer in self.counters.items():
+            buffer.append(self.pending_counts.get(name, 0))
+        self.pending_counts.clear()
+        self.enemy_counts.append(enemy_count)
+        self.frames += 1
+
+    def summary(self) -> dict:
+        """Returns {phase: {"p50": ms, "p95": ms, "p99": ms}} over the buffered frames."""
+        result = {}
+        for name, buffer in self.buffers.items():
+            values = buffer.values()
+            if len(values):
+                result[name] = {
+                    f"p{p}": round(float(v), 3)
+                    for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))
+                }
+        return result
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_frame = None  # rebuild the text on the next draw
+
+    def draw_overlay(self, screen: object, enemy_count: int):
+        """Draws frame time percentiles, enemy count and the slowest phases (top-right).
+        The text is rebuilt every OVERLAY_REFRESH_FRAMES frames so it is readable
+        and not re-rendered every frame.
+
+        Args:
+            screen (obj): Pygame Zero Screen object that represents game screen
+            enemy_count (int): enemies alive this frame
+        """
+        if (
+            self.overlay_frame is None
+            or self.frames - self.overlay_frame >= OVERLAY_REFRESH_FRAMES
+        ):
+            self.overlay_text = self.overlay_lines(enemy_count)
+            self.overlay_frame = self.frames
+        if self.overlay_label is None:
+            self.overlay_label = TextLabel(
+                "{}",
+                fontsize=28,
+                color="white",
+                owidth=1,
+                ocolor="black",
+                align="right",
+                topright=(screen.width - 10, 10),
+            )
+        self.overlay_label.draw(screen, self.overlay_text)
+
+    def overlay_lines(self, enemy_count: int) -> str:
+        """Returns the overlay text: frame percentiles, enemy count, counters, then phases slowest first."""
+        summary = self.summary()
+        frame = summary.get("frame", {"p50": 0, "p95": 0, "p99": 0})
+        lines = [
+            f"frame ms p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  p99 {frame['p99']:.2f}",
+            f"enemies {enemy_count}",
+        ]
+        for name, buffer in self.counters.items():  # value of the last frame
+            lines.append(f"{name} {buffer.data[buffer.index - 1]:.0f}")
+        phases = sorted(
+            (item for item in summary.items() if item[0] != "frame"),
+            key=lambda item: item[1]["p95"],
+            reverse=True,
+        )
+        for name, stats in phases:
+            lines.append(f"{name} p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}")
+
+        return "\n".join(lines)
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Writes the buffered timings to a JSON or CSV file (picked by the suffix).
+
+        Args:
+            path (Path | None): output file. None writes profiles/profile_<time>.json
+
+        Returns:
+            Path: the written file
+        """
+        if path is None:
+            path = PROFILE_DUMP_DIR / time.strftime("profile_%Y%m%d_%H%M%S.json")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = {name: buffer.values() for name, buffer in self.buffers.items()}
+        columns.update(
+            (name, buffer.values()) for name, buffer in self.counters.items()
+        )
+        columns["enemies"] = self.enemy_counts.values()
+
+        if path.suffix == ".csv":
+            names = list(columns)
+            rows = min((len(values) for values in columns.values()), default=0)
+            with open(path, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(names)
+                for i in range(rows):
+                    writer.writerow(
+                        [round(float(columns[n][-rows + i]), 4) for n in names]
+                    )
+        else:
+            data = {
+                "frames": self.frames,
+                "summary": self.summary(),
+                "buffers": {name: values.tolist() for name, values in columns.items()},
+            }
+            with open(path, "w", encoding="utf-8") as json_file:
+                json.dump(data, json_file, indent=4)
+        return path
+
+
+# Shared instance used by main.py and GameState
+PROFILER = FrameProfiler()
@@ -0,0 +1,445 @@
+"""Record a play session as a compact binary log and re-drive it at max speed.
+
+A recording holds the GameState RNG seed, the dt of every frame and the clicks +
+key presses that reached main.on_mouse_down/on_key_down, in the order pgzero
+delivered them. Playback runs the same frames through GameState without
+rendering and checks the final score + frame count against the recording.
+
+Version 2 recordings come from the queued input of main.py: events are applied
+at the start of the next simulation step. Version 1 recordings were played
+immediately and are still played back that way.
+
+Usage:
+    python replay.py replays/20240101-120000.replay
+    python replay.py replays/20240101-120000.replay --events
+    python replay.py --check-quit  # record + replay a session ended by the Quit button
+"""
+
+import argparse
+import json
+import multiprocessing
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+# NOTE: REPLAY module focus on reproducing a session exactly from its inputs
+# Global constants
+REPLAY_DIR = Path("replays")
+REPLAY_MAGIC = b"CDRP"  # Cake Defender RePlay
+REPLAY_VERSION = 2  # 2 = input queued until the next simulation step
+SUPPORTED_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sBI")  # magic, version, metadata JSON length
+
+# record stream: 1 tag byte + payload, events sit between the frames they preceded
+TAG_FRAME_MS = 0  # frame, dt is a whole number of ms (pgzero: clock.tick() / 1000)
+TAG_FRAME = 1  # frame, any other dt (f64)
+TAG_CLICK = 2  # on_mouse_down: button, x, y
+TAG_KEY = 3  # on_key_down: key code
+FRAME_MS = struct.Struct("<BH")
+FRAME = struct.Struct("<Bd")
+CLICK = struct.Struct("<BBhh")
+KEY = struct.Struct("<BH")
+
+
+class ReplayRecorder:
+    """Appends the inputs of a session to an in-memory record stream.
+    At 60 FPS a frame costs 3 bytes before compression, and the stream is
+    zlib-compressed when saved, so an hour of play is a few KB.
+    """
+
+    def __init__(self, seed: int, use_swarm: bool = False, difficulty: object = None):
+        """Starts an empty recording.
+
+        Args:
+            seed (int): seed the GameState RNG was created with
+            use_swarm (bool): True if the session used the NumPy swarm backend
+            difficulty (object): DifficultyProfile of the session (None = default profile)
+
+        Attributes:
+            self.stream (bytearray): encoded records so far
+            self.frames (int): frames recorded so far
+            self.events (int): clicks + key presses recorded so far
+        """
+        self.seed = seed
+        self.use_swarm = use_swarm
+        self.difficulty = difficulty
+        self.stream = bytearray()
+        self.frames = 0
+        self.events = 0
+        self.started = time.time()
+
+    def frame(self, dt: float):
+        """Records one update() call.
+
+        Args:
+            dt (float): secs since the last frame, as given to update()
+        """
+        ms = round(dt * 1000)
+        if 0 <= ms <= 0xFFFF and ms / 1000.0 == dt:  # exact round trip
+            self.stream += FRAME_MS.pack(TAG_FRAME_MS, ms)
+        else:
+            self.stream += FRAME.pack(TAG_FRAME, dt)
+        self.frames += 1
+
+    def click(self, pos: tuple[int, int], button: int):
+        """Records one on_mouse_down() call.
+
+        Args:
+            pos (tuple[int, int]): (x, y) position of the click
+            button (int): mouse enum value of the pressed button
+        """
+        self.stream += CLICK.pack(TAG_CLICK, int(button), int(pos[0]), int(pos[1]))
+        self.events += 1
+
+    def key(self, key: int):
+        """Records one on_key_down() call that reached the game.
+
+        Args:
+            key (int): keys enum value of the pressed key
+        """
+        self.stream += KEY.pack(TAG_KEY, int(key))
+        self.events += 1
+
+    def save(self, score: int, steps: int, path: str | Path | None = None) -> Path:
+        """Writes the recording plus the expected results used by playback.
+
+        Args:
+            score (int): game score when the session ended
+            steps (int): fixed simulation steps run during the session
+            path (str | Path | None): output file. None = replays/<date>-<time>.replay
+
+        Returns:
+            Path: the written file
+        """
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+            path = REPLAY_DIR / f"{stamp}.replay"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        metadata = {
+            "seed": self.seed,
+            "use_swarm": self.use_swarm,
+            "difficulty": (
+                self.difficulty.to_dict() if self.difficulty is not None else None
+            ),
+            "recorded_at": self.started,
+            "frames": self.frames,
+            "events": self.events,
+            "steps": steps,
+            "score": score,
+        }
+        encoded = json.dumps(metadata).encode("utf-8")
+        with open(path, "wb") as replay_file:
+            replay_file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(encoded)))
+            replay_file.write(encoded)
+            replay_file.write(zlib.compress(bytes(self.stream), 9))
+        return path
+
+
+def load_replay(path: str | Path) -> tuple[dict, bytes]:
+    """Reads a recording written by ReplayRecorder.save().
+
+    Args:
+        path (str | Path): .replay file
+
+    Returns:
+        tuple[dict, bytes]: metadata (+ "version") and the decompressed record stream
+    """
+    data = Path(path).read_bytes()
+    magic, version, meta_length = HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"{path}: unsupported replay version {version}")
+    meta_end = HEADER.size + meta_length
+    metadata = json.loads(data[HEADER.size : meta_end].decode("utf-8"))
+    metadata["version"] = version
+    return metadata, zlib.decompress(data[meta_end:])
+
+
+def iter_records(stream: bytes):
+    """Yields the records of a stream as (tag, value) tuples:
+    (TAG_FRAME, dt), (TAG_CLICK, (button, (x, y))) or (TAG_KEY, key).
+
+    Args:
+        stream (bytes): decompressed record stream
+    """
+    offset = 0
+    while offset < len(stream):
+        tag = stream[offset]
+        if tag == TAG_FRAME_MS:
+            _, ms = FRAME_MS.unpack_from(stream, offset)
+            offset += FRAME_MS.size
+            yield TAG_FRAME, ms / 1000.0
+        elif tag == TAG_FRAME:
+            _, dt = FRAME.unpack_from(stream, offset)
+            offset += FRAME.size
+            yield TAG_FRAME, dt
+        elif tag == TAG_CLICK:
+            _, button, x, y = CLICK.unpack_from(stream, offset)
+            offset += CLICK.size
+            yield TAG_CLICK, (button, (x, y))
+        elif tag == TAG_KEY:
+            _, key = KEY.unpack_from(stream, offset)
+            offset += KEY.size
+            yield TAG_KEY, key
+        else:
+            raise ValueError(f"unknown replay record tag {tag} at byte {offset}")
+
+
+class ReplayPlayer:
+    """Re-drives GameState with a recording as fast as possible (no rendering).
+    Frames go through a FixedStepper and inputs through the same InputQueue +
+    GameState calls as main.py, so the run is identical to the recorded session.
+    """
+
+    def __init__(self, path: str | Path):
+        """Loads the recording and creates the game objects without a window.
+
+        Args:
+            path (str | Path): .replay file
+
+        Attributes:
+            self.metadata (dict): seed, settings and expected results of the recording
+            self.frames (int): frames played so far
+            self.event_log (list): (frame, sim_time, description) of every input played
+            self.inputs (obj): InputQueue of version 2 recordings, None = immediate input
+        """
+        # imported here: headless switches SDL to the dummy driver on import,
+        # and main.py imports this module for the recorder
+        from pgzero.constants import mouse
+        from pgzero.keyboard import keys
+
+        from difficulty import DifficultyProfile
+        from entities import Enemy, Player, Target
+        from game_state import GameState, SCREEN_HEIGHT, SCREEN_WIDTH
+        from headless import init_headless
+        from input_queue import InputQueue
+        from timestep import FixedStepper
+
+        self.metadata, self.stream = load_replay(path)
+        self.mouse = mouse
+        self.keys = keys
+        self.enemy_class = Enemy
+
+        init_headless()
+        difficulty = self.metadata["difficulty"]
+        self.game = GameState(
+            use_swarm=self.metadata["use_swarm"],
+            seed=self.metadata["seed"],
+            save_path=None,
+            difficulty=DifficultyProfile(**difficulty) if difficulty else None,
+        )
+        self.target = Target(
+            image="cake1",
+            image_path="images/cake1.png",
+            screen_width=SCREEN_WIDTH,
+            screen_height=SCREEN_HEIGHT,
+        )
+        self.player = Player(image_path="images/cat_angry.png")
+        self.stepper = FixedStepper()
+        self.frames = 0
+        self.event_log = []
+        self.inputs = InputQueue() if self.metadata["version"] >= 2 else None
+
+    def simulate_step(self, step_dt: float):
+        """One fixed step of game logic, same as main.simulate_step()."""
+        if self.inputs is not None:
+            for event in self.inputs.drain():
+                if event.kind == "click":
+                    self.click(event.pos, event.button)
+                else:
+                    self.key(event.key)
+        self.game.update(
+            dt=step_dt,
+            target=self.target,
+            enemy_class=self.enemy_class,
+            enemy_name="ant",
+            enemy_asset="color",
+        )
+
+    def play(self) -> dict:
+        """Plays every record, then compares the results with the recording.
+
+        Returns:
+            dict: expected vs played score, frames and steps, speed and "ok"
+        """
+        start = time.perf_counter()
+        try:
+            for tag, value in iter_records(self.stream):
+                if tag == TAG_FRAME:
+                    # counted first like main.update(): a Quit exits inside advance()
+                    self.frames += 1
+                    self.stepper.advance(value, self.simulate_step)
+                elif tag == TAG_CLICK:
+                    button, pos = value
+                    self.log(f"click {pos} button {button}")
+                    if self.inputs is not None:
+                        self.inputs.push_click(pos, self.mouse(button))
+                    else:
+                        self.click(pos, self.mouse(button))
+                else:
+                    self.log(f"key {self.keys(value).name}")
+                    if self.inputs is not None:
+                        self.inputs.push_key(self.keys(value))
+                    else:
+                        self.key(self.keys(value))
+        except SystemExit:  # the session ended on a Quit button
+            pass
+        wall_seconds = time.perf_counter() - start
+        return self.report(wall_seconds)
+
+    def click(self, pos: tuple[int, int], button: object):
+        """Applies one click, same as main.py (on_mouse_down or the queued step input)."""
+        self.game.handle_click(
+            pos=pos,
+            input_button=button,
+            expected_button=self.mouse.LEFT,
+            player=self.player,
+        )
+
+    def key(self, key: object):
+        """Applies one key press, same as main.py (on_key_down or the queued step input)."""
+        self.game.handle_key(key=key, expected_button=self.keys.SPACE)
+
+    def log(self, description: str):
+        """Keeps one played input in the event log with its frame + simulated time."""
+        sim_time = self.stepper.steps * self.stepper.step
+        self.event_log.append((self.frames, round(sim_time, 3), description))
+
+    def report(self, wall_seconds: float) -> dict:
+        """Returns the expected vs played results.
+
+        Args:
+            wall_seconds (float): real time spent playing
+        """
+        expected = self.metadata
+        played = {
+            "score": self.game.score,
+            "frames": self.frames,
+            "steps": self.stepper.steps,
+        }
+        sim_seconds = self.stepper.steps * self.stepper.step
+        return {
+            "seed": expected["seed"],
+            "expected": {key: expected[key] for key in played},
+            "played": played,
+            "ok": all(expected[key] == played[key] for key in played),
+            "state": self.game.state,
+            "events": len(self.event_log),
+            "wall_seconds": round(wall_seconds, 3),
+            "realtime_factor": (
+                round(sim_seconds / wall_seconds, 1) if wall_seconds else None
+            ),
+        }
+
+
+def record_quit_session(path: str | Path, seed: int = 0) -> Path:
+    """Records a short session the way main.py does (frame recorded before its
+    steps run, clicks queued for the next step): Start, no input until the cake
+    is eaten, then the GAMEOVER Quit button, which exits in the middle of a frame.
+    The Quit button calls pygame.quit(), so run it in its own process (see --check-quit).
+
+    Args:
+        path (str | Path): output .replay file
+        seed (int): GameState RNG seed
+
+    Returns:
+        Path: the written file
+    """
+    from pgzero.constants import mouse
+
+    from entities import Enemy, Player, Target
+    from game_state import GameState, SCREEN_HEIGHT, SCREEN_WIDTH
+    from headless import init_headless
+    from input_queue import InputQueue
+    from timestep import SIM_STEP, FixedStepper
+
+    init_headless()
+    game = GameState(seed=seed, save_path=None)
+    target = Target(
+        image="cake1",
+        image_path="images/cake1.png",
+        screen_width=SCREEN_WIDTH,
+        screen_height=SCREEN_HEIGHT,
+    )
+    player = Player(image_path="images/cat_angry.png")
+    stepper = FixedStepper()
+    inputs = InputQueue()
+    recorder = ReplayRecorder(seed=seed, difficulty=game.difficulty)
+
+    def simulate_step(step_dt):
+        for event in inputs.drain():
+            game.handle_click(
+                pos=event.pos,
+                input_button=event.button,
+                expected_button=mouse.LEFT,
+                player=player,
+            )
+        game.update(dt=step_dt, target=target, enemy_class=Enemy, enemy_name="ant")
+
+    def frames(count: int):
+        for _ in range(count):
+            recorder.frame(SIM_STEP)
+            stepper.advance(SIM_STEP, simulate_step)
+
+    def click(button: object):
+        recorder.click(button.image_rect.center, mouse.LEFT)
+        inputs.push_click(button.image_rect.center, mouse.LEFT)
+
+    try:
+        frames(60)  # buttons accept clicks after 0.5s on screen
+        click(game.menu_buttons["START"])
+        while game.state != "GAMEOVER":
+            frames(1)
+        frames(60)
+        click(game.game_over_buttons["QUIT"])
+        frames(1)
+    except SystemExit:
+        return recorder.save(score=game.score, steps=stepper.steps, path=path)
+    raise RuntimeError("the Quit button did not end the session")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a recorded session headless.")
+    parser.add_argument("path", nargs="?", help=".replay file to play")
+    parser.add_argument(
+        "--events", action="store_true", help="print every played input"
+    )
+    parser.add_argument(
+        "--check-quit",
+        action="store_true",
+        help="record a session ended by the Quit button to path (default: a temp file) and play it",
+    )
+    args = parser.parse_args()
+
+    if args.check_quit:
+        args.path = args.path or Path(tempfile.gettempdir()) / "quit_check.replay"
+        # own process: the Quit button calls pygame.quit(), which frees every Surface
+        recording = multiprocessing.get_context("spawn").Process(
+            target=record_quit_session, args=(args.path,)
+        )
+        recording.start()
+        recording.join()
+        if recording.exitcode != 0:
+            sys.exit(
+                f"recording the Quit session failed (exit code {recording.exitcode})"
+            )
+    elif args.path is None:
+        parser.error("path is required (unless --check-quit)")
+
+    player = ReplayPlayer(args.path)
+    report = player.play()
+    if args.events:
+        for frame, sim_time, description in player.event_log:
+            print(f"frame {frame:>7}  t={sim_time:>9.3f}s  {description}")
+    print(json.dumps(report, indent=4))
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import atexit
+import sqlite3
+import threading
+from collections import deque
+
+# NOTE: SAVE WRITER module focus on keeping disk I/O out of the frame
+
+
+class SaveWriter:
+    """Background thread running disk jobs (e.g. a ScoreStore insert).
+    call() only queues the job and returns, so the game-over frame never waits
+    on the disk. Jobs run one at a time, in the order they were queued.
+    """
+
+    def __init__(self):
+        """Creates the writer. The thread starts on the first call().
+
+        Attributes:
+            self.pending (deque): (func, args) jobs not run yet, oldest first
+            self.busy (bool): True while the thread is running a job
+            self.calls (int): call() jobs queued so far
+            self.writes (int): jobs run so far
+            self.errors (int): failed jobs
+            self.last_error (Exception | None): error of the last failed job
+        """
+        self.condition = threading.Condition()
+        self.pending = deque()
+        self.busy = False
+        self.closed = False
+        self.thread = None
+        self.calls = 0
+        self.writes = 0
+        self.errors = 0
+        self.last_error = None
+
+    def call(self, func, *args):
+        """Queues func(*args) to run on the writer thread and returns immediately.
+
+        Args:
+            func (callable): disk job, e.g. ScoreStore.add_run
+            *args: arguments passed to func
+        """
+        with self.condition:
+            if self.thread is None:
+                self.start()
+            self.calls += 1
+            self.pending.append((func, args))
+            self.condition.notify_all()
+
+    def start(self):
+        """Starts the writer thread and makes sure pending jobs run on exit."""
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="save-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def run(self):
+        """Thread loop: runs the oldest pending job until close() is called."""
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:  # closed + nothing left to write
+                    return
+                func, args = self.pending.popleft()
+                self.busy = True
+
+            try:
+                func(*args)
+                self.writes += 1
+            except (OSError, TypeError, ValueError, sqlite3.Error) as error:
+                self.errors += 1
+                self.last_error = error
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Blocks until every pending job has run.
+
+        Args:
+            timeout (float | None): max secs to wait. None waits as long as needed
+
+        Returns:
+            bool: True if nothing is left to write
+        """
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.pending and not self.busy, timeout
+            )
+
+    def close(self, timeout: float | None = None):
+        """Runs the pending jobs then stops the thread. A later call() restarts it.
+
+        Args:
+            timeout (float | None): max secs to wait for the thread
+        """
+        with self.condition:
+            if self.thread is None:
+                return
+            thread, self.thread = self.thread, None
+            self.closed = True
+            self.condition.notify_all()
+        thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict:
+        """Returns the writer counters as a dict."""
+        return {
+            "calls": self.calls,
+            "writes": self.writes,
+            "errors": self.errors,
+            "pending": len(self.pending),
+        }
+
+
+# shared writer: every save goes through one thread so the writes stay in order
+SAVE_WRITER = SaveWriter()
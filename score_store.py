@@ -0,0 +1,200 @@
+import json
+import math
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+# NOTE: SCORE STORE module focus on keeping EVERY run (not just the highscore) with fast indexed queries
+# Global constants
+SCORE_DB_PATH = Path("game_data.db")
+LEGACY_SAVE_PATH = Path("game_data.json")  # old save: {"highscore": int}
+DAY_FORMAT = "%Y-%m-%d"  # local date of a run, used by best_per_day()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    duration REAL,
+    peak_enemies INTEGER,
+    played_at REAL NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score);
+CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, score);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class ScoreStore:
+    """Run history in a local SQLite database: one row per finished run
+    (score, duration, peak enemy count, date). Inserts are O(log n) whatever the
+    history size, and the indexes on score and (day, score) keep top-K, per-day
+    best and percentile queries fast after months of kiosk play.
+
+    One connection is shared by the game thread and the SAVE_WRITER thread,
+    so every access goes through self.lock.
+    """
+
+    def __init__(self, path: str | Path = SCORE_DB_PATH):
+        """Opens (or creates) the database.
+
+        Args:
+            path (str | Path): SQLite file. ":memory:" keeps the history in RAM only
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self.lock, self.connection:
+            if path != ":memory:":
+                # WAL: a crash mid-insert never damages the older runs
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+
+    def migrate_json(self, legacy_path: str | Path = LEGACY_SAVE_PATH) -> bool:
+        """Imports the highscore of an old JSON save as one run (date = file mtime).
+        The import is recorded in the meta table, so it runs once per database.
+        The file itself is left untouched (the repo ships one).
+
+        Args:
+            legacy_path (str | Path): old game_data.json
+
+        Returns:
+            bool: True if a file was migrated
+        """
+        legacy_path = Path(legacy_path)
+        if self.get_meta("migrated_from") is not None or not legacy_path.exists():
+            return False
+        with open(legacy_path, "r", encoding="utf-8") as game_data_file:
+            highscore = int(json.load(game_data_file).get("highscore", 0))
+        if highscore > 0:
+            self.add_run(score=highscore, played_at=legacy_path.stat().st_mtime)
+        self.set_meta("migrated_from", str(legacy_path))
+        return True
+
+    def add_run(
+        self,
+        score: int,
+        duration: float | None = None,
+        peak_enemies: int | None = None,
+        played_at: float | None = None,
+    ):
+        """Appends one finished run.
+
+        Args:
+            score (int): final score
+            duration (float | None): secs spent in PLAY. None = unknown (migrated runs)
+            peak_enemies (int | None): most enemies alive at once. None = unknown
+            played_at (float | None): unix time of the game over. None = now
+        """
+        if played_at is None:
+            played_at = time.time()
+        day = time.strftime(DAY_FORMAT, time.localtime(played_at))
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO runs (score, duration, peak_enemies, played_at, day)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (score, duration, peak_enemies, played_at, day),
+            )
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """Runs a read query and returns every row."""
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def count(self) -> int:
+        """Returns the number of stored runs."""
+        return self.query("SELECT COUNT(*) FROM runs")[0][0]
+
+    def highscore(self) -> int:
+        """Returns the best score ever (0 without runs). One index lookup."""
+        return self.query("SELECT MAX(score) FROM runs")[0][0] or 0
+
+    def top(self, k: int = 10) -> list[dict]:
+        """Returns the k best runs, best first (ties: oldest first).
+
+        Args:
+            k (int): number of runs
+        """
+        rows = self.query(
+            "SELECT score, duration, peak_enemies, played_at, day FROM runs"
+            " ORDER BY score DESC, id LIMIT ?",
+            (k,),
+        )
+        return [
+            {
+                "score": score,
+                "duration": duration,
+                "peak_enemies": peak_enemies,
+                "played_at": played_at,
+                "day": day,
+            }
+            for score, duration, peak_enemies, played_at, day in rows
+        ]
+
+    def best_per_day(self, days: int | None = None) -> list[tuple[str, int]]:
+        """Returns (day, best score) pairs, most recent day first.
+
+        Args:
+            days (int | None): number of most recent days. None = every day
+        """
+        return self.query(
+            "SELECT day, MAX(score) FROM runs GROUP BY day ORDER BY day DESC LIMIT ?",
+            (-1 if days is None else days,),
+        )
+
+    def percentiles(self, percents: tuple = (50, 90, 99)) -> dict:
+        """Returns the nearest-rank score percentiles over every run.
+        Each one walks the score index in SQLite (no sort, no rows loaded in Python).
+
+        Args:
+            percents (tuple): percentiles in 0-100
+
+        Returns:
+            dict: percent -> score. Empty when there are no runs
+        """
+        total = self.count()
+        if total == 0:
+            return {}
+        return {
+            percent: self.query(
+                "SELECT score FROM runs ORDER BY score LIMIT 1 OFFSET ?",
+                (max(0, math.ceil(percent / 100 * total) - 1),),
+            )[0][0]
+            for percent in percents
+        }
+
+    def get_meta(self, key: str, default: str | None = None) -> str | None:
+        """Returns a stored setting (the old flat data dict, e.g. future sound volume)."""
+        rows = self.query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0][0] if rows else default
+
+    def set_meta(self, key: str, value: str):
+        """Stores a setting, replacing the previous value."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def close(self):
+        """Closes the database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+def main():
+    """Prints the run history summary: python score_store.py [game_data.db]"""
+    store = ScoreStore(sys.argv[1] if len(sys.argv) > 1 else SCORE_DB_PATH)
+    report = {
+        "runs": store.count(),
+        "highscore": store.highscore(),
+        "top_10": store.top(10),
+        "best_per_day": store.best_per_day(14),
+        "percentiles": store.percentiles(),
+    }
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
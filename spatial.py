@@ -0,0 +1,151 @@
+# NOTE: SPATIAL module focus on answering "what is HERE?" without looping over every enemy
+# Global constants
+GRID_CELL_SIZE = 128  # px, ~2x the biggest rotated enemy so most touch <= 4 cells
+GRID_MARGIN = 256  # px covered outside the field, off-screen spawns get cells
+
+
+class SpatialHashGrid:
+    """Uniform grid over the play field. Every item is registered in the cells its
+    Rect overlaps, so rect/point queries only look at items in the cells under
+    the query instead of every item. The grid extends margin px past every edge
+    (where enemies spawn). Items further out are kept in the border cells.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cell_size: int = GRID_CELL_SIZE,
+        rect_of=None,
+        margin: int = GRID_MARGIN,
+    ):
+        """Creates an empty grid.
+
+        Args:
+            width (int): horizontal size of the play field in px
+            height (int): vertical size of the play field in px
+            cell_size (int): width and height of one cell in px
+            rect_of (callable): returns the current Rect obj of an item. Defaults to item.mask_rect
+            margin (int): px the grid extends past each edge of the field
+
+        Attributes:
+            self.cols, self.rows (int): number of cells horizontally/vertically
+            self.cells (list[set]): items registered in each cell, index = row * cols + col
+            self.item_ranges (dict): item -> (col0, row0, col1, row1) cells it is registered in
+        """
+        self.cell_size = cell_size
+        self.margin = margin
+        self.cols = max(1, -(-(width + 2 * margin) // cell_size))  # ceil division
+        self.rows = max(1, -(-(height + 2 * margin) // cell_size))
+        self.cells = [set() for _ in range(self.cols * self.rows)]
+        self.item_ranges = {}
+        self.rect_of = rect_of if rect_of is not None else (lambda item: item.mask_rect)
+
+    def __len__(self):
+        return len(self.item_ranges)
+
+    def __contains__(self, item):
+        return item in self.item_ranges
+
+    def cell_range(self, rect) -> tuple[int, int, int, int]:
+        """Returns the (col0, row0, col1, row1) cells a Rect overlaps, clamped to the grid.
+
+        Args:
+            rect (obj): pygame Rect obj
+        """
+        size, margin = self.cell_size, self.margin
+        last_col, last_row = self.cols - 1, self.rows - 1
+        col0 = min(max((rect.left + margin) // size, 0), last_col)
+        row0 = min(max((rect.top + margin) // size, 0), last_row)
+        col1 = min(max((rect.right - 1 + margin) // size, 0), last_col)
+        row1 = min(max((rect.bottom - 1 + margin) // size, 0), last_row)
+        return col0, row0, col1, row1
+
+    def _cells_in(self, cell_range):
+        col0, row0, col1, row1 = cell_range
+        for row in range(row0, row1 + 1):
+            start = row * self.cols
+            yield from self.cells[start + col0 : start + col1 + 1]
+
+    def insert(self, item, rect):
+        """Registers item in every cell its rect overlaps (moves it if already registered).
+
+        Args:
+            item (obj): any hashable object (e.g. an Enemy)
+            rect (obj): current pygame Rect obj of the item
+        """
+        self.move(item, rect)
+
+    def move(self, item, rect) -> bool:
+        """Updates the cells of item after it moved. Cheap when it stayed in the same cells.
+
+        Args:
+            item (obj): any hashable object (e.g. an Enemy)
+            rect (obj): current pygame Rect obj of the item
+
+        Returns:
+            bool: True if the item changed cells (or was newly inserted)
+        """
+        new_range = self.cell_range(rect)
+        old_range = self.item_ranges.get(item)
+        if new_range == old_range:
+            return False
+
+        if old_range is not None:
+            for cell in self._cells_in(old_range):
+                cell.discard(item)
+        for cell in self._cells_in(new_range):
+            cell.add(item)
+        self.item_ranges[item] = new_range
+        return True
+
+    def remove(self, item):
+        """Unregisters item. Does nothing if it is not in the grid.
+
+        Args:
+            item (obj): item previously inserted
+        """
+        old_range = self.item_ranges.pop(item, None)
+        if old_range is not None:
+            for cell in self._cells_in(old_range):
+                cell.discard(item)
+
+    def clear(self):
+        """Removes every item."""
+        for cell in self.cells:
+            cell.clear()
+        self.item_ranges.clear()
+
+    def query_rect(self, rect) -> list:
+        """Returns every item whose current Rect collides with rect.
+        Only items in the cells under rect are tested.
+
+        Args:
+            rect (obj): pygame Rect obj (e.g. player.rect)
+
+        Returns:
+            list: colliding items, each listed once
+        """
+        candidates = set()
+        for cell in self._cells_in(self.cell_range(rect)):
+            candidates.update(cell)
+        rect_of = self.rect_of
+        return [item for item in candidates if rect.colliderect(rect_of(item))]
+
+    def query_point(self, pos: tuple[int, int]) -> list:
+        """Returns every item whose current Rect contains pos.
+
+        Args:
+            pos (tuple[int, int]): (x, y) point (e.g. a mouse click position)
+
+        Returns:
+            list: items under the point
+        """
+        col = min(max((int(pos[0]) + self.margin) // self.cell_size, 0), self.cols - 1)
+        row = min(max((int(pos[1]) + self.margin) // self.cell_size, 0), self.rows - 1)
+        rect_of = self.rect_of
+        return [
+            item
+            for item in self.cells[row * self.cols + col]
+            if rect_of(item).collidepoint(pos)
+        ]
@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+# NOTE: SPAWNING module focus on WHERE enemies enter the field, computed once per sprite size
+# Global constants
+SPAWN_PADDING = 50  # px past half the sprite diagonal, spawns start off-screen
+
+
+class SpawnRing:
+    """Spawn geometry of one sprite size: the buffer distance outside the screen,
+    the band along each edge and the 4 corner points. Built once per enemy sprite
+    so a spawn is one random side pick + one random int.
+    """
+
+    __slots__ = (
+        "buffer",
+        "sides",
+        "fixed_x",
+        "fixed_y",
+        "low",
+        "high",
+        "band_is_x",
+        "band_is_y",
+    )
+
+    def __init__(
+        self, sprite_size: tuple[int, int], screen_width: int, screen_height: int
+    ):
+        """Pre-computes the 8 spawn sides.
+
+        Args:
+            sprite_size (tuple[int, int]): (width, height) of the enemy sprite
+            screen_width (int): horizontal size of the screen in px
+            screen_height (int): vertical size of the screen in px
+
+        Attributes:
+            self.buffer (int): px outside the screen edges where enemies spawn
+            self.sides (tuple): (x, y, low, high) of the 4 edges then the 4 corners.
+                On an edge x or y is None: a random int in [low, high]
+            self.fixed_x, self.fixed_y, self.low, self.high, self.band_is_x, self.band_is_y
+                (ndarray): the same table as NumPy arrays for positions()
+        """
+        sprite_diag = math.hypot(*sprite_size)  # diagonal length
+        buffer = int(sprite_diag * 0.5) + SPAWN_PADDING  # half diag + padding
+        left, top = -buffer, -buffer
+        right, bottom = screen_width + buffer, screen_height + buffer
+        x_band = (buffer, screen_width - buffer)
+        y_band = (buffer, screen_height - buffer)
+
+        self.buffer = buffer
+        self.sides = (
+            (left, None, *y_band),  # left
+            (right, None, *y_band),  # right
+            (None, top, *x_band),  # top
+            (None, bottom, *x_band),  # bottom
+            (left, top, 0, 0),  # top-left
+            (right, top, 0, 0),  # top-right
+            (left, bottom, 0, 0),  # bottom-left
+            (right, bottom, 0, 0),  # bottom-right
+        )
+        self.fixed_x = np.array([0 if x is None else x for x, _, _, _ in self.sides])
+        self.fixed_y = np.array([0 if y is None else y for _, y, _, _ in self.sides])
+        self.low = np.array([side[2] for side in self.sides])
+        self.high = np.array([side[3] for side in self.sides])
+        self.band_is_x = np.array([x is None for x, _, _, _ in self.sides])
+        self.band_is_y = np.array([y is None for _, y, _, _ in self.sides])
+
+    def position(self, rng) -> tuple[int, int]:
+        """Returns one (x, y) spawn position on a random side.
+
+        Args:
+            rng (obj): random.Random instance of the game
+        """
+        x, y, low, high = rng.choice(self.sides)
+        if x is None:  # top or bottom edge
+            return rng.randint(low, high), y
+        if y is None:  # left or right edge
+            return x, rng.randint(low, high)
+        return x, y  # corners
+
+    def positions(self, np_rng, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns count spawn positions at once, with the same distribution as position().
+
+        Args:
+            np_rng (obj): numpy.random.Generator
+            count (int): number of positions
+
+        Returns:
+            tuple[ndarray, ndarray]: x and y arrays of int positions
+        """
+        side = np_rng.integers(0, len(self.sides), count)
+        along = np_rng.integers(self.low[side], self.high[side], endpoint=True)
+        xs = np.where(self.band_is_x[side], along, self.fixed_x[side])
+        ys = np.where(self.band_is_y[side], along, self.fixed_y[side])
+        return xs, ys
@@ -0,0 +1,102 @@
+# NOTE: SPRITE BATCH module focus on drawing the whole enemy layer with ONE blit call instead of one per Actor
+
+
+class SpriteBatch:
+    """Batched renderer of the enemy layer. Every frame it collects one
+    (rotated Surface, top-left) pair per enemy, reusing the Surface already
+    swapped in by Enemy.apply_rotation(), and submits them all with a single
+    Surface.blits() call. The positions are the same as Enemy.draw_interpolated(),
+    so both paths draw the same image.
+
+    enabled=False draws one Actor at a time (the old path), and draw_calls
+    counts the blit calls of the last frame, to compare the two.
+    """
+
+    def __init__(self, swarm: object = None, enabled: bool = True):
+        """Creates the renderer.
+
+        Args:
+            swarm (obj): SwarmEngine of the enemies, None for Enemy Actors.
+                Swarm positions are then interpolated in one NumPy expression
+            enabled (bool): False draws each enemy with its own blit call
+
+        Attributes:
+            self.enabled (bool): True draws the enemy layer with one Surface.blits call
+            self.draw_calls (int): blit calls issued for the enemy layer last frame
+            self.sprites (int): enemies drawn last frame
+        """
+        self.swarm = swarm
+        self.enabled = enabled
+        self.draw_calls = 0
+        self.sprites = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+
+    def collect(self, enemies: list, alpha: float) -> list:
+        """Returns the (Surface, (left, top)) pair of every enemy at render_pos(alpha).
+
+        Args:
+            enemies (list): Enemy objs (the swarm's view list in swarm mode)
+            alpha (float): 0.0 = position before the last step, 1.0 = current position
+        """
+        swarm = self.swarm
+        if swarm is not None:  # views[i] is swarm row i
+            n = swarm.count
+            prev_x, prev_y = swarm.prev_x[:n], swarm.prev_y[:n]
+            # same math as render_pos() - _anchor (the anchor is half the rotated size)
+            left = prev_x + (swarm.x[:n] - prev_x) * alpha - swarm.width[:n] / 2
+            top = prev_y + (swarm.y[:n] - prev_y) * alpha - swarm.height[:n] / 2
+            return list(
+                zip(
+                    [enemy._surf for enemy in enemies],
+                    zip(left.tolist(), top.tolist()),
+                )
+            )
+
+        sprites = []
+        append = sprites.append
+        for enemy in enemies:
+            # render_pos() inlined. Actor.x is rect.left + anchor through two
+            # Python properties, reading the ZRect directly gives the same float
+            prev_x, prev_y = enemy.prev_x, enemy.prev_y
+            rect = enemy._rect
+            ax, ay = enemy._anchor
+            x = prev_x + (rect.x + ax - prev_x) * alpha
+            y = prev_y + (rect.y + ay - prev_y) * alpha
+            append((enemy._surf, (x - ax, y - ay)))
+        return sprites
+
+    def draw(
+        self, surface: object, enemies: list, alpha: float, return_rects: bool = False
+    ) -> list | None:
+        """Draws every enemy onto surface, batched or one Actor at a time.
+
+        Args:
+            surface (obj): pygame Surface to draw on (the pgzero screen Surface)
+            enemies (list): Enemy objs (the swarm's view list in swarm mode)
+            alpha (float): 0.0 = position before the last step, 1.0 = current position
+            return_rects (bool): True returns the drawn Rects (dirty rect rendering)
+
+        Returns:
+            list | None: drawn Rect of every enemy when return_rects, None otherwise
+        """
+        self.sprites = len(enemies)
+        if not self.enabled:
+            # Enemy.draw_interpolated blits onto the pgzero screen, which is surface
+            rects = [enemy.draw_interpolated(alpha) for enemy in enemies]
+            self.draw_calls = len(rects)
+            return rects if return_rects else None
+
+        self.draw_calls = 1 if enemies else 0
+        if not enemies:
+            return [] if return_rects else None
+        return surface.blits(self.collect(enemies, alpha), doreturn=return_rects)
+
+    def stats(self) -> dict:
+        """Returns the renderer counters as a dict (e.g. for logging or an overlay)."""
+        return {
+            "enabled": self.enabled,
+            "draw_calls": self.draw_calls,
+            "sprites": self.sprites,
+        }
@@ -0,0 +1,201 @@
+from collections import OrderedDict
+import math
+
+from pygame import mask, transform
+
+# NOTE: SPRITE CACHE module focus on reusing expensive per-frame sprite work (rotation + masks)
+# Global constants
+ROTATION_RESOLUTION = 1.0  # degrees covered by one cached rotation step
+ROTATION_CACHE_MAX_BYTES = 32 * 1024 * 1024  # evict oldest entries past this
+RADIUS_SLACK = 2  # px added to bounding radii to cover int() rounding of mask rects
+
+
+def mask_radius(sprite_mask) -> float:
+    """Returns the radius of the smallest circle around the mask center that
+    contains every set pixel (plus RADIUS_SLACK). Used for broad-phase culling.
+
+    Args:
+        sprite_mask (obj): pygame Mask obj
+    """
+    width, height = sprite_mask.get_size()
+    cx, cy = width / 2, height / 2
+    # the outline holds the outermost set pixels, so it is enough to check those
+    points = sprite_mask.outline()
+    if not points:
+        return 0.0
+    farthest = max(math.hypot(px + 0.5 - cx, py + 0.5 - cy) for px, py in points)
+    return farthest + RADIUS_SLACK
+
+
+class RotatedSprite:
+    """Holds one cached rotation of a sprite: the rotated Surface, its Mask
+    and the offset from the sprite center to the mask's top-left corner."""
+
+    __slots__ = (
+        "angle",
+        "surface",
+        "mask",
+        "offset",
+        "size",
+        "radius",
+        "nbytes",
+        "variants",
+    )
+
+    def __init__(self, angle: float, surface: object, sprite_mask: object):
+        """Stores the rotated Surface and pre-computes the values needed every frame.
+
+        Args:
+            angle (float): quantized angle (degrees) the surface was rotated by
+            surface (obj): pygame Surface rotated anti-clockwise by angle
+            sprite_mask (obj): pygame Mask built from surface
+
+        Attributes:
+            self.offset (tuple[int, int]): add to the center pos to get the mask rect top-left
+            self.size (tuple[int, int]): (width, height) of the rotated surface
+            self.radius (float): bounding circle radius of the mask around the sprite center
+            self.nbytes (int): approximate memory used by the surfaces + mask
+            self.variants (dict): image path -> rotated Surface, for images sharing this
+                shape (atlas colors). self.surface is the first one
+        """
+        self.angle = angle
+        self.surface = surface
+        self.mask = sprite_mask
+        width, height = surface.get_size()
+        self.size = (width, height)
+        # same rounding as Rect.center so mask_rect matches mask.get_rect(center=pos)
+        self.offset = (-(width // 2), -(height // 2))
+        self.radius = mask_radius(sprite_mask)
+        # surface pixels + 1 bit per pixel for the mask
+        self.nbytes = width * height * surface.get_bytesize() + (width * height) // 8
+        self.variants = {}
+
+    def mask_rect(self, center: tuple[float, float]):
+        """Returns the mask Rect obj centered on center.
+
+        Args:
+            center (tuple[float, float]): (x, y) center position of the sprite
+        """
+        return self.mask.get_rect(
+            topleft=(int(center[0]) + self.offset[0], int(center[1]) + self.offset[1])
+        )
+
+
+class RotationCache:
+    """Process-wide LRU cache of rotated sprites keyed by (shape key, quantized angle).
+    Every Enemy using the same image shares the same entries, so rotating and
+    building the mask becomes a dictionary lookup. Images with the same shape
+    (atlas colors) share one entry + mask and only add their rotated Surface to it.
+    """
+
+    def __init__(
+        self,
+        resolution: float = ROTATION_RESOLUTION,
+        max_bytes: int = ROTATION_CACHE_MAX_BYTES,
+    ):
+        """Creates an empty cache.
+
+        Args:
+            resolution (float): degrees per cached step. Angles are rounded to the nearest step
+            max_bytes (int): memory cap in bytes before least recently used entries are evicted
+
+        Attributes:
+            self.entries (OrderedDict): (shape key, step) -> RotatedSprite, oldest first
+            self.nbytes (int): total bytes held by cached entries
+            self.hits (int): lookups served from the cache
+            self.misses (int): lookups that had to rotate + build a mask
+            self.evictions (int): entries dropped to stay under max_bytes
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be greater than 0")
+        self.resolution = resolution
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize(self, angle: float) -> int:
+        """Returns the cache step index of angle, wrapped to a single turn.
+
+        Args:
+            angle (float): angle in degrees (any range)
+        """
+        steps_per_turn = max(1, round(360 / self.resolution))
+        return round(angle / self.resolution) % steps_per_turn
+
+    def get(
+        self,
+        image_path: str,
+        surface: object,
+        angle: float,
+        variant: str | None = None,
+    ) -> RotatedSprite:
+        """Returns the cached rotation of surface at angle, creating it on a miss.
+
+        Args:
+            image_path (str): shape key of the image (its path, or the atlas base path
+                shared by every color), used as the cache key
+            surface (obj): un-rotated pygame Surface of the image
+            angle (float): anti-clockwise angle in degrees (same as Actor.angle)
+            variant (str | None): image path of surface when several images share the
+                shape key. Its rotated Surface is entry.variants[variant]
+
+        Returns:
+            RotatedSprite: shared cache entry. Do not modify its surfaces or mask
+        """
+        key = (image_path, self.quantize(angle))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)  # mark as most recently used
+            if variant is not None and variant not in entry.variants:
+                # same shape in another color: one rotate, no new mask
+                rotated_surf = transform.rotate(surface, entry.angle)
+                entry.variants[variant] = rotated_surf
+                nbytes = entry.size[0] * entry.size[1] * rotated_surf.get_bytesize()
+                entry.nbytes += nbytes
+                self.nbytes += nbytes
+                self._evict()
+            return entry
+
+        self.misses += 1
+        step_angle = key[1] * self.resolution
+        rotated_surf = transform.rotate(surface, step_angle)
+        entry = RotatedSprite(step_angle, rotated_surf, mask.from_surface(rotated_surf))
+        if variant is not None:
+            entry.variants[variant] = rotated_surf
+        self.entries[key] = entry
+        self.nbytes += entry.nbytes
+        self._evict()
+        return entry
+
+    def _evict(self):
+        """Evicts least recently used entries until the cache fits max_bytes,
+        but always keeps the most recently used one."""
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            _, old_entry = self.entries.popitem(last=False)
+            self.nbytes -= old_entry.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """Drops every cached entry. Counters are kept."""
+        self.entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Returns the cache counters as a dict (e.g. for logging or an overlay)."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.nbytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared instance used by every entity
+ROTATION_CACHE = RotationCache()
@@ -0,0 +1,104 @@
+import json
+import time
+from pathlib import Path
+
+# NOTE: STARTUP module focus on HOW LONG it takes from launch to the first menu frame
+# Import this module first: its import time is the origin of every startup timing.
+# Global constants
+STARTUP_LOG_PATH = Path("profiles/startup.jsonl")  # one JSON report per launch
+
+
+class StartupTimer:
+    """Startup timeline: marks (ms since launch) and phase durations (ms).
+    main.py marks "imports" and "first_frame" and times the "images" and
+    "game_init" phases; font + background image timings come from FONTS + ASSETS.
+    """
+
+    def __init__(self):
+        """Starts the clock.
+
+        Attributes:
+            self.marks (dict): name -> ms since launch when it was first reached
+            self.phases (dict): phase name -> ms spent in it
+            self.reported (bool): True once finish() wrote the report
+        """
+        self.origin = time.perf_counter()
+        self.marks = {}
+        self.phases = {}
+        self.phase_name = None
+        self.phase_start = 0.0
+        self.reported = False
+
+    def elapsed_ms(self) -> float:
+        """Returns the ms since launch."""
+        return (time.perf_counter() - self.origin) * 1000
+
+    def mark(self, name: str):
+        """Records when name was first reached (later calls are ignored).
+
+        Args:
+            name (str): milestone name (e.g. "first_frame")
+        """
+        if name not in self.marks:
+            self.marks[name] = self.elapsed_ms()
+
+    def phase(self, name: str):
+        """Returns self as a context manager adding its elapsed time to phase name.
+
+        Args:
+            name (str): phase name (e.g. "images")
+        """
+        self.phase_name = name
+        return self
+
+    def __enter__(self):
+        self.phase_start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = (time.perf_counter() - self.phase_start) * 1000
+        self.phases[self.phase_name] = self.phases.get(self.phase_name, 0.0) + elapsed
+
+    def report(self, **extra_ms: float) -> dict:
+        """Returns the timeline rounded to 0.1 ms.
+
+        Args:
+            **extra_ms (float): more ms values to include (e.g. fonts=FONTS time)
+        """
+        return {
+            "marks": {name: round(ms, 1) for name, ms in self.marks.items()},
+            "phases": {name: round(ms, 1) for name, ms in self.phases.items()},
+            **{name: round(ms, 1) for name, ms in extra_ms.items()},
+        }
+
+    def finish(self, path: Path | None = STARTUP_LOG_PATH, **extra_ms: float) -> dict:
+        """Prints the report once and appends it to path (to track time-to-menu across builds).
+
+        Args:
+            path (Path | None): JSON lines log file. None only prints
+            **extra_ms (float): more ms values to include (see report())
+
+        Returns:
+            dict: the report
+        """
+        report = self.report(**extra_ms)
+        if self.reported:
+            return report
+        self.reported = True
+
+        timings = {**report["marks"], **report["phases"]}
+        timings.update((name, report[name]) for name in extra_ms)
+        print(
+            "startup:",
+            " | ".join(f"{name} {ms:.1f} ms" for name, ms in timings.items()),
+        )
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as log_file:
+                log_file.write(json.dumps({"time": time.time(), **report}) + "\n")
+        return report
+
+
+# Shared instance, created when main.py imports this module first
+STARTUP = StartupTimer()
@@ -0,0 +1,403 @@
+from itertools import compress
+
+import numpy as np
+from pgzero import game
+
+from entities import Enemy
+from sprite_cache import ROTATION_CACHE
+
+# NOTE: SWARM module focus on moving MANY enemies at once with NumPy instead of one Actor at a time
+# Global constants
+SWARM_START_CAPACITY = 256  # rows allocated up front, doubles when full
+STOP_DISTANCE = 5  # px from target center where enemies stop (as Enemy.movement)
+
+
+class SwarmEnemy(Enemy):
+    """Thin Enemy view used for drawing and collisions.
+    Position, speed and alive flag live in the SwarmEngine arrays at row self.slot.
+    """
+
+    def __init__(self, swarm, slot, image, image_path, pos, speed):
+        """Binds the view to its swarm row, then runs the normal Enemy setup.
+
+        Args:
+            swarm (obj): SwarmEngine that owns the arrays
+            slot (int): row index of this enemy in the swarm arrays
+            image (str): the name of the image to create an Actor obj
+            image_path(str): path of image.png MUST include file extension. (e.g. "images/myimage.png")
+            pos (tuple[int, int]): (x, y) spawn position
+            speed (float): speed (px/sec) of the enemy
+        """
+        # set before Actor init because the x/y properties below read the arrays
+        self.swarm = swarm
+        self.slot = slot
+        super().__init__(image=image, image_path=image_path, pos=pos, speed=speed)
+
+    # -- Actor position properties redirected to the swarm arrays -- #
+    @property
+    def x(self):
+        return float(self.swarm.x[self.slot])
+
+    @x.setter
+    def x(self, px):
+        self.swarm.x[self.slot] = px
+
+    @property
+    def y(self):
+        return float(self.swarm.y[self.slot])
+
+    @y.setter
+    def y(self, py):
+        self.swarm.y[self.slot] = py
+
+    @property
+    def pos(self):
+        return self.x, self.y
+
+    @pos.setter
+    def pos(self, pos):
+        self.swarm.x[self.slot], self.swarm.y[self.slot] = pos
+
+    @property
+    def prev_x(self):
+        return float(self.swarm.prev_x[self.slot])
+
+    @prev_x.setter
+    def prev_x(self, px):
+        self.swarm.prev_x[self.slot] = px
+
+    @property
+    def prev_y(self):
+        return float(self.swarm.prev_y[self.slot])
+
+    @prev_y.setter
+    def prev_y(self, py):
+        self.swarm.prev_y[self.slot] = py
+
+    @property
+    def speed(self):
+        return float(self.swarm.speed[self.slot])
+
+    @speed.setter
+    def speed(self, speed):
+        self.swarm.speed[self.slot] = speed
+
+    @property
+    def is_dead(self):
+        return not self.swarm.alive[self.slot]
+
+    @is_dead.setter
+    def is_dead(self, is_dead):
+        self.swarm.alive[self.slot] = not is_dead
+
+    @property
+    def mask_rect(self):
+        """Rect obj of the current mask, centered on the swarm position."""
+        if self.rotation is None:
+            return None
+        return self.rotation.mask_rect(self.pos)
+
+    @mask_rect.setter
+    def mask_rect(self, mask_rect):
+        pass  # always computed from the swarm position
+
+    def movement(self, target, dt):
+        """Moves only this enemy, same as Enemy.movement (the x/y properties write
+        its row), then refreshes the rest of the row. The game loop moves every
+        row at once with SwarmEngine.step() instead.
+
+        Args:
+            target (obj): The Actor object of our target
+            dt (float): delta time is time since last frame
+        """
+        super().movement(target, dt)
+        self.swarm.sync_row(self)
+
+    def draw(self):
+        """Draws the cached rotated Surface centered on the swarm position."""
+        ax, ay = self._anchor
+        game.screen.blit(self._surf, (self.x - ax, self.y - ay))
+
+
+class SwarmEngine:
+    """Structure-of-arrays enemy backend. Keeps positions, speeds, headings and
+    alive flags in contiguous NumPy arrays so every enemy is moved toward the
+    target in one vectorized step per frame and dead enemies are removed in bulk.
+    """
+
+    def __init__(self, capacity: int = SWARM_START_CAPACITY, grid: object = None):
+        """Allocates empty arrays.
+
+        Args:
+            capacity (int): number of rows to allocate up front
+            grid (obj): optional SpatialHashGrid kept in sync with the enemy mask rects
+
+        Attributes:
+            self.count (int): number of rows in use (live + not yet compacted dead)
+            self.x, self.y (ndarray): center position of every enemy (px)
+            self.prev_x, self.prev_y (ndarray): center position before the last step (interpolation)
+            self.speed (ndarray): speed of every enemy (px/sec)
+            self.heading (ndarray): angle (degrees, anti-clockwise) each enemy faces
+            self.rotation_step (ndarray): quantized heading the view is currently drawn with. -1 = none yet
+            self.alive (ndarray): False once the enemy is killed
+            self.offset_x, self.offset_y (ndarray): mask rect top-left offset from the center
+            self.width, self.height (ndarray): mask rect size of the current rotation
+            self.grid_key (ndarray): packed grid cell range each view is registered in. -1 = none
+            self.views (list): SwarmEnemy views, views[i] is row i
+            self.free (list): removed views kept for reuse by spawn()
+        """
+        self.capacity = capacity
+        self.grid = grid
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_x = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.heading = np.zeros(capacity, dtype=np.float64)
+        self.rotation_step = np.full(capacity, -1, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.offset_x = np.zeros(capacity, dtype=np.int64)
+        self.offset_y = np.zeros(capacity, dtype=np.int64)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.grid_key = np.full(capacity, -1, dtype=np.int64)
+        self.views = []
+        self.free = []
+
+    def _arrays(self):
+        return (
+            self.x,
+            self.y,
+            self.prev_x,
+            self.prev_y,
+            self.speed,
+            self.heading,
+            self.rotation_step,
+            self.alive,
+            self.offset_x,
+            self.offset_y,
+            self.width,
+            self.height,
+            self.grid_key,
+        )
+
+    def _set_arrays(self, arrays):
+        (
+            self.x,
+            self.y,
+            self.prev_x,
+            self.prev_y,
+            self.speed,
+            self.heading,
+            self.rotation_step,
+            self.alive,
+            self.offset_x,
+            self.offset_y,
+            self.width,
+            self.height,
+            self.grid_key,
+        ) = arrays
+
+    def _grow(self):
+        """Doubles the capacity of every array, keeping the existing rows."""
+        self.capacity *= 2
+        self._set_arrays([np.resize(array, self.capacity) for array in self._arrays()])
+        self.rotation_step[self.count :] = -1
+        self.grid_key[self.count :] = -1
+        self.alive[self.count :] = False
+
+    def spawn(self, image: str, image_path: str, pos: tuple, speed: float):
+        """Adds one enemy row and returns its view.
+
+        Args:
+            image (str): the name of the image to create an Actor obj
+            image_path(str): path of image.png MUST include file extension. (e.g. "images/myimage.png")
+            pos (tuple[int, int]): (x, y) spawn position
+            speed (float): speed (px/sec) of the enemy
+
+        Returns:
+            SwarmEnemy: view of the new row (a recycled view when one is free)
+        """
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        self.count += 1
+        self.rotation_step[slot] = -1  # not rotated yet, step() will orient it
+        self.grid_key[slot] = -1  # not in the grid yet, step() will insert it
+        if self.free:
+            enemy = self.free.pop()
+            enemy.slot = slot
+            enemy.respawn(image=image, image_path=image_path, pos=pos, speed=speed)
+        else:
+            enemy = SwarmEnemy(self, slot, image, image_path, pos, speed)
+        self.views.append(enemy)
+        return enemy
+
+    def spawn_batch(
+        self, image: str, image_path: str, xs: list, ys: list, speeds: list
+    ) -> list:
+        """Adds len(xs) enemies of one image, growing the arrays at most once.
+
+        Args:
+            image (str): the name of the image to create an Actor obj
+            image_path(str): path of image.png MUST include file extension. (e.g. "images/myimage.png")
+            xs, ys (list): x and y spawn positions
+            speeds (list): speed (px/sec) of every enemy
+
+        Returns:
+            list: views of the new rows
+        """
+        count = len(xs)
+        while self.count + count > self.capacity:
+            self._grow()
+        start, end = self.count, self.count + count
+        self.count = end
+        self.rotation_step[start:end] = -1  # not rotated yet, step() will orient them
+        self.grid_key[start:end] = -1  # not in the grid yet, step() will insert them
+
+        spawned = []
+        free = self.free
+        for slot, x, y, speed in zip(range(start, end), xs, ys, speeds):
+            if free:
+                enemy = free.pop()
+                enemy.slot = slot
+                enemy.respawn(
+                    image=image, image_path=image_path, pos=(x, y), speed=speed
+                )
+            else:
+                enemy = SwarmEnemy(self, slot, image, image_path, (x, y), speed)
+            spawned.append(enemy)
+        self.views.extend(spawned)
+        return spawned
+
+    def step(self, target: object, dt: float):
+        """Moves every enemy toward the target center in one vectorized step.
+        Views only get a new rotation when their quantized heading changes.
+
+        Args:
+            target (object): A Target class instance used to define what the objective is
+            dt (float): delta time is time since last frame
+        """
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x  # positions before this step, for render interpolation
+        self.prev_y[:n] = y
+
+        # distance vector + magnitude for every enemy at once
+        dx = target.x - x
+        dy = target.y - y
+        dist = np.hypot(dx, dy)
+
+        # velocity = unit direction * speed * dt, only for enemies further than STOP_DISTANCE
+        moving = dist > STOP_DISTANCE
+        scale = np.zeros(n)
+        np.divide(self.speed[:n] * dt, dist, out=scale, where=moving)
+        x += dx * scale
+        y += dy * scale
+
+        # heading faces the target (y axis inverted like Actor.angle_to)
+        heading = self.heading[:n]
+        np.degrees(np.arctan2(-dy, dx), out=heading)
+
+        # re-orient only the views whose quantized heading changed
+        steps = np.round(heading / ROTATION_CACHE.resolution).astype(np.int32)
+        steps %= self.steps_per_turn()
+        for i in np.flatnonzero(steps != self.rotation_step[:n]):
+            view = self.views[i]
+            view.apply_rotation(heading[i])
+            self.offset_x[i], self.offset_y[i] = view.rotation.offset
+            self.width[i], self.height[i] = view.rotation.size
+        self.rotation_step[:n] = steps
+
+        if self.grid is not None:
+            self._sync_grid(0, n)
+
+    def steps_per_turn(self) -> int:
+        """Returns the number of quantized rotation steps in 360 degrees."""
+        return max(1, round(360 / ROTATION_CACHE.resolution))
+
+    def sync_row(self, view: object):
+        """Refreshes the rotation + grid columns of one row after its view moved
+        on its own (SwarmEnemy.movement), like step() does for every row.
+
+        Args:
+            view (obj): SwarmEnemy view of the row
+        """
+        i = view.slot
+        rotation = view.rotation
+        self.heading[i] = rotation.angle
+        steps = round(rotation.angle / ROTATION_CACHE.resolution)
+        self.rotation_step[i] = steps % self.steps_per_turn()
+        self.offset_x[i], self.offset_y[i] = rotation.offset
+        self.width[i], self.height[i] = rotation.size
+        if self.grid is not None:
+            self._sync_grid(i, i + 1)
+
+    def _sync_grid(self, start: int, stop: int):
+        """Moves views of rows start..stop-1 in the grid, but only the ones whose
+        cell range changed. Uses the same math as SpatialHashGrid.cell_range on
+        every row at once."""
+        grid = self.grid
+        size = grid.cell_size
+        rows = slice(start, stop)
+        # int() truncation, same as RotatedSprite.mask_rect
+        left = (
+            np.trunc(self.x[rows]).astype(np.int64) + self.offset_x[rows] + grid.margin
+        )
+        top = (
+            np.trunc(self.y[rows]).astype(np.int64) + self.offset_y[rows] + grid.margin
+        )
+        col0 = np.clip(left // size, 0, grid.cols - 1)
+        row0 = np.clip(top // size, 0, grid.rows - 1)
+        col1 = np.clip((left + self.width[rows] - 1) // size, 0, grid.cols - 1)
+        row1 = np.clip((top + self.height[rows] - 1) // size, 0, grid.rows - 1)
+        key = col0 | (row0 << 16) | (col1 << 32) | (row1 << 48)
+
+        for i in np.flatnonzero(key != self.grid_key[rows]):
+            view = self.views[start + i]
+            grid.move(view, view.mask_rect)
+        self.grid_key[rows] = key
+
+    def compact(self) -> list:
+        """Removes every dead row in bulk, keeping the survivors in order.
+
+        Returns:
+            list: the removed SwarmEnemy views
+        """
+        n = self.count
+        alive = self.alive[:n].copy()
+        if alive.all():
+            return []
+
+        dead = [self.views[i] for i in np.flatnonzero(~alive)]
+        if self.grid is not None:
+            for view in dead:
+                self.grid.remove(view)
+
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        for array in self._arrays():
+            array[:k] = array[keep]
+        self.alive[k:n] = False
+
+        # views follow their rows, only the ones after the first dead row moved
+        first_dead = int(np.argmin(alive))
+        self.views[:] = compress(self.views, alive)
+        for i in range(first_dead, k):
+            self.views[i].slot = i
+        self.count = k
+        self.free.extend(dead)
+        return dead
+
+    def clear(self):
+        """Removes every enemy (keeps the allocated arrays and recycles the views)."""
+        self.free.extend(self.views)
+        self.alive[: self.count] = False
+        self.grid_key[: self.count] = -1
+        self.count = 0
+        self.views.clear()
+        if self.grid is not None:
+            self.grid.clear()
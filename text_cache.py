@@ -0,0 +1,204 @@
+from collections import OrderedDict
+import time
+
+import pygame
+from pgzero import ptext
+
+# NOTE: TEXT CACHE module focus on rendering each (outlined) text label once instead of every frame
+# Global constants
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # evict oldest labels past this
+
+
+class TextCache:
+    """Process-wide LRU cache of rendered text Surfaces keyed by
+    (text, font, size, color, outline width, outline color, align).
+    Outlined text is drawn by ptext as many offset passes, so a hit skips all of them.
+    """
+
+    def __init__(self, max_bytes: int = TEXT_CACHE_MAX_BYTES):
+        """Creates an empty cache.
+
+        Args:
+            max_bytes (int): memory cap in bytes before least recently used labels are evicted
+
+        Attributes:
+            self.entries (OrderedDict): style key -> rendered Surface, oldest first
+            self.nbytes (int): total bytes held by cached Surfaces
+            self.hits (int): lookups served from the cache
+            self.misses (int): lookups that had to render the text
+            self.evictions (int): Surfaces dropped to stay under max_bytes
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        text: str,
+        fontname: str | None = None,
+        fontsize: int | None = None,
+        color: str | tuple = "white",
+        owidth: float | None = None,
+        ocolor: str | tuple | None = None,
+        align: str = "left",
+    ) -> object:
+        """Returns the rendered Surface of text, rendering it on a miss.
+        Takes the same style arguments as screen.draw.text().
+
+        Args:
+            text (str): text to render ("\\n" starts a new line)
+            fontname (str | None): font name in fonts/ (e.g. "love_days"). None = default font
+            fontsize (int | None): font size. None = ptext default
+            color (str | tuple): text color
+            owidth (float | None): outline width (fraction of the font size). None = no outline
+            ocolor (str | tuple | None): outline color
+            align (str): "left", "center" or "right" alignment of multi-line text
+
+        Returns:
+            Surface: shared cache entry. Do not modify it
+        """
+        key = (text, fontname, fontsize, color, owidth, ocolor, align)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)  # mark as most recently used
+            return surface
+
+        self.misses += 1
+        surface = ptext.getsurf(
+            text,
+            fontname=fontname,
+            fontsize=fontsize,
+            color=color,
+            owidth=owidth,
+            ocolor=ocolor,
+            align=align,
+            cache=False,  # this cache owns the Surface
+        )
+        self.entries[key] = surface
+        width, height = surface.get_size()
+        self.nbytes += width * height * surface.get_bytesize()
+
+        # evict least recently used labels, but always keep the newest one
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            _, old_surface = self.entries.popitem(last=False)
+            width, height = old_surface.get_size()
+            self.nbytes -= width * height * old_surface.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drops every cached Surface. Counters are kept."""
+        self.entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Returns the cache counters as a dict (e.g. for logging or an overlay)."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.nbytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared instance used by every TextLabel
+TEXT_CACHE = TextCache()
+
+
+class FontCache:
+    """Process-wide cache of pygame Font objects keyed by (path, size).
+    Opening a .ttf parses the whole file, so widgets using the same font
+    (e.g. the 4 menu/game over Buttons) share one Font instead of one each.
+    """
+
+    def __init__(self):
+        """Creates an empty cache.
+
+        Attributes:
+            self.fonts (dict): (path, size) -> pygame Font obj
+            self.load_seconds (float): total secs spent opening fonts (startup report)
+        """
+        self.fonts = {}
+        self.load_seconds = 0.0
+
+    def get(self, path: str, size: int) -> object:
+        """Returns the shared Font for (path, size), opening it on first use.
+
+        Args:
+            path (str): path of font.ttf MUST include file extension. Ex: "fonts/myfont.ttf"
+            size (int): size of font
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            font = self.fonts[key] = pygame.font.Font(path, size)
+            self.load_seconds += time.perf_counter() - start
+        return font
+
+
+# Shared instance used by every Button
+FONTS = FontCache()
+
+
+class TextLabel:
+    """Text drawn at a fixed anchor. The text is built from a template and the
+    Surface + Rect are only looked up again when the template values change,
+    so a "Score: {}" label costs one tuple compare per frame until the score changes.
+    """
+
+    __slots__ = ("template", "style", "anchor", "values", "surface", "rect", "cache")
+
+    def __init__(
+        self,
+        template: str,
+        fontname: str | None = None,
+        fontsize: int | None = None,
+        color: str | tuple = "white",
+        owidth: float | None = None,
+        ocolor: str | tuple | None = None,
+        align: str = "left",
+        cache: TextCache = TEXT_CACHE,
+        **anchor,
+    ):
+        """Stores the label style. Nothing is rendered until the first draw().
+
+        Args:
+            template (str): text, with str.format() fields for values (e.g. "Score: {}")
+            fontname, fontsize, color, owidth, ocolor, align: same as TextCache.get()
+            cache (obj): TextCache the Surfaces come from
+            **anchor: one pygame Rect position keyword (e.g. center=(960, 580) or topleft=(100, 0))
+
+        Attributes:
+            self.values (tuple | None): template values of the current Surface. None = not rendered
+            self.surface (obj): current rendered Surface
+            self.rect (obj): Rect obj of the Surface placed at the anchor
+        """
+        self.template = template
+        self.style = (fontname, fontsize, color, owidth, ocolor, align)
+        self.anchor = anchor
+        self.cache = cache
+        self.values = None
+        self.surface = None
+        self.rect = None
+
+    def draw(self, screen: object, *values):
+        """Blits the label, formatting + looking the text up only when values changed.
+
+        Args:
+            screen (obj): Pygame Zero Screen object that represents game screen
+            *values: values for the template fields (none for static labels)
+        """
+        if values != self.values:
+            text = self.template.format(*values) if values else self.template
+            self.surface = self.cache.get(text, *self.style)
+            self.rect = self.surface.get_rect(**self.anchor)
+            self.values = values
+        screen.blit(self.surface, self.rect.topleft)
@@ -0,0 +1,68 @@
+# NOTE: TIMESTEP module focus on stepping the simulation at a FIXED dt whatever the frame rate
+# Global constants
+SIM_STEP = 1 / 60  # simulated secs per step (max ~3.3 px per step at 200 px/sec)
+MAX_SUBSTEPS = 5  # steps per frame before the backlog is dropped (no spiral of death)
+
+
+class FixedStepper:
+    """Accumulator for a fixed-timestep simulation. Every frame the real dt is
+    added to the accumulator and the simulation is stepped in SIM_STEP chunks,
+    at most max_substeps times. The left-over fraction of a step is exposed as
+    alpha so the renderer can interpolate between the last two steps.
+    """
+
+    def __init__(self, step: float = SIM_STEP, max_substeps: int = MAX_SUBSTEPS):
+        """Creates an empty accumulator.
+
+        Args:
+            step (float): simulated secs per step
+            max_substeps (int): max steps run by one advance() call
+
+        Attributes:
+            self.accumulator (float): real secs not simulated yet (always < step after advance)
+            self.steps (int): steps run so far
+            self.last_substeps (int): steps run by the last advance()
+            self.dropped_time (float): real secs skipped because of the sub-step cap
+        """
+        if step <= 0:
+            raise ValueError("step must be greater than 0")
+        self.step = step
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.steps = 0
+        self.last_substeps = 0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction (0.0 - 1.0) of a step between the last simulated step and now."""
+        return self.accumulator / self.step
+
+    def advance(self, frame_dt: float, step_func) -> int:
+        """Runs as many fixed steps as the accumulated real time allows.
+
+        Args:
+            frame_dt (float): real secs since the last frame
+            step_func (callable): step_func(step) simulates one fixed step
+
+        Returns:
+            int: number of steps run this frame
+        """
+        self.accumulator += frame_dt
+        substeps = 0
+        while self.accumulator >= self.step and substeps < self.max_substeps:
+            step_func(self.step)
+            self.accumulator -= self.step
+            substeps += 1
+
+        if self.accumulator >= self.step:  # hitch longer than the cap: drop the backlog
+            backlog = self.accumulator - self.accumulator % self.step
+            self.dropped_time += backlog
+            self.accumulator -= backlog
+        self.steps += substeps
+        self.last_substeps = substeps
+        return substeps
+
+    def reset(self):
+        """Drops the accumulated time (e.g. after a long load). Counters are kept."""
+        self.accumulator = 0.0
@@ -0,0 +1,273 @@
+"""Parallel batch simulation for difficulty tuning: many seeded headless sessions
+per parameter set, played by a bot with a human-like reaction time and accuracy.
+
+Usage:
+    python tuning.py --sessions 500 --set max_difficulty_score=120,240,360 --set stage_count=5,10
+    python tuning.py --sessions 2000 --set reaction_time=0.25,0.4 --set accuracy=0.8,0.95
+    python tuning.py --base difficulty/default.json --set end_speed_max=160,200 --workers 8
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from difficulty import DIFFICULTY_PROFILE_PATH, DifficultyProfile
+
+# NOTE: TUNING module focus on sweeping difficulty settings over thousands of bot sessions on every core
+# Global constants
+TUNING_DIR = Path("tuning")  # reports are written here
+SESSION_MINUTES = 10  # a session still alive after this is cut (counted as survived)
+TUNING_SEED = 0  # session i of every parameter set uses seed TUNING_SEED + i
+# bot defaults, sweepable like the curve settings
+BOT_PARAMS = {"reaction_time": 0.35, "accuracy": 0.9}
+PERCENTILES = (10, 50, 90)
+HISTOGRAM_BINS = 10
+# work units per process: fewer = less overhead, more = better balance
+CHUNKS_PER_WORKER = 4
+
+
+def difficulty_settings(params: dict) -> dict:
+    """Returns the DifficultyProfile settings of a parameter set (without the bot settings)."""
+    return {key: value for key, value in params.items() if key not in BOT_PARAMS}
+
+
+def run_session(params: dict, seed: int, minutes: float, use_swarm: bool) -> dict:
+    """Plays one seeded headless session until the first game over (or minutes).
+
+    Args:
+        params (dict): DifficultyProfile settings + "reaction_time" + "accuracy"
+        seed (int): seed of the game RNG and of the bot
+        minutes (float): game-minutes before the session is cut
+        use_swarm (bool): True uses the NumPy swarm backend
+
+    Returns:
+        dict: survival secs, score and whether the session reached a game over
+    """
+    # imported here: opens the SDL dummy display in the worker process only
+    from headless import HeadlessRunner, ReactionBot
+
+    bot = ReactionBot(
+        reaction_time=params["reaction_time"], accuracy=params["accuracy"], seed=seed
+    )
+    runner = HeadlessRunner(
+        seed=seed,
+        use_swarm=use_swarm,
+        input_source=bot,
+        difficulty=DifficultyProfile(**difficulty_settings(params)),
+    )
+    max_frames = round(minutes * 60 / runner.dt)
+    game_over = False
+    while runner.frames < max_frames and not game_over:
+        game_over = runner.step()
+    return {
+        "survival": runner.sim_time,
+        # the runner restarts after a game over and adds the final score to kills
+        "score": runner.kills if game_over else runner.game.score,
+        "game_over": game_over,
+    }
+
+
+def run_chunk(tasks: list) -> list:
+    """Worker entry point: runs a list of (set index, params, seed, minutes, use_swarm) sessions.
+
+    Returns:
+        list: (set index, session result) pairs
+    """
+    return [
+        (set_index, run_session(params, seed, minutes, use_swarm))
+        for set_index, params, seed, minutes, use_swarm in tasks
+    ]
+
+
+def parameter_sets(base: dict, sweeps: dict) -> list[dict]:
+    """Returns every combination of the swept values applied on top of base.
+
+    Args:
+        base (dict): DifficultyProfile settings + bot settings every set starts from
+        sweeps (dict): setting name -> list of values to try
+    """
+    names = list(sweeps)
+    return [
+        {**base, **dict(zip(names, values))}
+        for values in itertools.product(*(sweeps[name] for name in names))
+    ]
+
+
+def distribution(values: list) -> dict:
+    """Returns mean, percentiles, max and a histogram of values."""
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values, bins=HISTOGRAM_BINS)
+    return {
+        "mean": round(float(values.mean()), 3),
+        **{
+            f"p{p}": round(float(v), 3)
+            for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))
+        },
+        "max": round(float(values.max()), 3),
+        "histogram": {
+            "counts": counts.tolist(),
+            "edges": [round(float(edge), 3) for edge in edges],
+        },
+    }
+
+
+def summarize(params: dict, results: list) -> dict:
+    """Aggregates the sessions of one parameter set."""
+    return {
+        "params": params,
+        "sessions": len(results),
+        "game_over_ratio": round(
+            sum(result["game_over"] for result in results) / len(results), 4
+        ),
+        "survival_seconds": distribution([result["survival"] for result in results]),
+        "score": distribution([result["score"] for result in results]),
+    }
+
+
+def run_sweep(
+    sets: list[dict],
+    sessions: int,
+    minutes: float = SESSION_MINUTES,
+    workers: int | None = None,
+    seed: int = TUNING_SEED,
+    use_swarm: bool = False,
+) -> dict:
+    """Runs sessions seeded sessions for every parameter set across a process pool.
+    Every set plays the same seeds, so differences come from the parameters, not luck.
+
+    Args:
+        sets (list[dict]): parameter sets (see parameter_sets())
+        sessions (int): sessions per parameter set
+        minutes (float): game-minutes before a session is cut
+        workers (int | None): worker processes. None = one per CPU core
+        seed (int): seed of the first session
+        use_swarm (bool): True uses the NumPy swarm backend
+
+    Returns:
+        dict: {"meta": ..., "results": [summary per parameter set]}
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [
+        (set_index, params, seed + i, minutes, use_swarm)
+        for set_index, params in enumerate(sets)
+        for i in range(sessions)
+    ]
+    # sessions are independent: a few big chunks per worker keep the pickling overhead
+    # small while the slow (long surviving) sessions still spread over every core
+    chunk_size = max(1, len(tasks) // (workers * CHUNKS_PER_WORKER))
+    chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        finished = list(map(run_chunk, chunks))  # no process start-up costs
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            finished = list(pool.map(run_chunk, chunks))
+    wall_seconds = time.perf_counter() - start
+
+    results = [[] for _ in sets]
+    for chunk_results in finished:  # in task order, whatever worker ran them
+        for set_index, result in chunk_results:
+            results[set_index].append(result)
+
+    simulated = sum(
+        result["survival"] for set_results in results for result in set_results
+    )
+    return {
+        "meta": {
+            "sessions_per_set": sessions,
+            "session_minutes": minutes,
+            "seed": seed,
+            "swarm": use_swarm,
+            "workers": workers,
+            "wall_seconds": round(wall_seconds, 3),
+            "sessions_per_second": round(len(tasks) / wall_seconds, 2),
+            "simulated_hours": round(simulated / 3600, 2),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": [
+            summarize(params, set_results) for params, set_results in zip(sets, results)
+        ],
+    }
+
+
+def parse_sweep(text: str) -> tuple[str, list]:
+    """Parses one --set argument: "name=v1,v2,..." -> (name, [numbers])."""
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected name=v1,v2,... got {text!r}")
+    return name, [json.loads(value) for value in values.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep difficulty settings with bots.")
+    parser.add_argument("--sessions", type=int, default=200, help="sessions per set")
+    parser.add_argument("--minutes", type=float, default=SESSION_MINUTES)
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU cores")
+    parser.add_argument("--seed", type=int, default=TUNING_SEED)
+    parser.add_argument("--swarm", action="store_true", help="NumPy swarm backend")
+    parser.add_argument(
+        "--base", type=Path, default=DIFFICULTY_PROFILE_PATH, help="profile JSON"
+    )
+    parser.add_argument(
+        "--set",
+        dest="sweeps",
+        type=parse_sweep,
+        action="append",
+        default=[],
+        help="name=v1,v2,... difficulty or bot setting to sweep (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    base = (
+        DifficultyProfile.from_file(args.base)
+        if args.base.exists()
+        else DifficultyProfile()
+    ).to_dict()
+    base.update(BOT_PARAMS)
+    sweeps = dict(args.sweeps)
+    unknown = sweeps.keys() - base.keys()
+    if unknown:
+        parser.error(f"unknown settings: {', '.join(sorted(unknown))}")
+
+    sets = parameter_sets(base, sweeps)
+    for params in sets:  # a bad value fails here, not inside every worker
+        try:
+            DifficultyProfile(**difficulty_settings(params))  # compiles the tables
+        except (TypeError, ValueError) as error:
+            swept = {name: params[name] for name in sweeps}
+            parser.error(f"invalid parameter set {swept}: {error}")
+    report = run_sweep(
+        sets, args.sessions, args.minutes, args.workers, args.seed, args.swarm
+    )
+
+    for summary in report["results"]:
+        swept = {name: summary["params"][name] for name in sweeps}
+        survival, score = summary["survival_seconds"], summary["score"]
+        print(
+            f"{swept or 'base'}: survival p50 {survival['p50']:.1f}s "
+            f"(p10 {survival['p10']:.1f} p90 {survival['p90']:.1f})  "
+            f"score p50 {score['p50']:.0f} (p10 {score['p10']:.0f} p90 {score['p90']:.0f})  "
+            f"game over {summary['game_over_ratio']:.0%}"
+        )
+    meta = report["meta"]
+    print(
+        f"{len(sets) * args.sessions} sessions on {meta['workers']} workers in "
+        f"{meta['wall_seconds']:.1f}s ({meta['sessions_per_second']} sessions/s)"
+    )
+
+    output = args.output or TUNING_DIR / time.strftime("tuning_%Y%m%d_%H%M%S.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+    print(f"Report saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 import pygame  # Pygame Zero uses pygame under the hood
 
+from text_cache import FONTS
+
 
 class Button:
     """This class is used to create buttons for UI."""
@@ -35,8 +37,8 @@ class Button:
         self.image_path = image_path
         self.hover_color = hovering_color
 
-        # Create Font object
-        self.font = pygame.font.Font(self.font_path, self.fontsize)
+        # Shared Font object, opened once per (path, size)
+        self.font = FONTS.get(self.font_path, self.fontsize)
 
         # Pre-render a Surface object (image) from a text
         self.text = self.font.render(self.text_input, True, self.base_color)